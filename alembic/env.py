@@ -20,7 +20,9 @@ from app.maintenance.models import *  # noqa: F401, F403
 
 config = context.config
 
-if config.config_file_name is not None:
+# The app runs migrations at startup and keeps its own logging setup
+configure_logger = config.attributes.get("configure_logger", True)
+if config.config_file_name is not None and configure_logger:
     fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
@@ -5,7 +5,7 @@ Revises:
 Create Date: 2024-01-01 00:00:00.000000
 
 """
-from typing import Sequence, Union
+from typing import Optional, Sequence, Union
 
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
@@ -18,85 +18,403 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Shared server default for timestamp columns
+NOW = sa.text("now()")
+
+# Enumerated status/type columns, stored as native ENUM types
+USER_ROLE = postgresql.ENUM("worker", "supervisor", "manager", "admin", name="user_role", create_type=False)
+NOTIFICATION_PRIORITY = postgresql.ENUM(
+    "low", "normal", "high", "critical", name="notification_priority", create_type=False
+)
+FARM_TASK_STATUS = postgresql.ENUM(
+    "pending", "in_progress", "completed", "postponed", "cancelled", name="farm_task_status", create_type=False
+)
+ASSET_STATUS = postgresql.ENUM(
+    "operational", "needs_repair", "under_repair", "retired", name="asset_status", create_type=False
+)
+ASSET_CRITICALITY = postgresql.ENUM("low", "medium", "high", "critical", name="asset_criticality", create_type=False)
+INVENTORY_TRANSACTION_TYPE = postgresql.ENUM(
+    "receipt", "issue", "transfer", "adjustment", "return", name="inventory_transaction_type", create_type=False
+)
+FARM_TASK_PRIORITY = postgresql.ENUM("low", "normal", "high", "urgent", name="farm_task_priority", create_type=False)
+JOB_TYPE = postgresql.ENUM("corrective", "preventive", "emergency", "inspection", name="job_type", create_type=False)
+JOB_STATUS = postgresql.ENUM(
+    "open", "assigned", "in_progress", "on_hold", "completed", "cancelled", name="job_status", create_type=False
+)
+JOB_PRIORITY = postgresql.ENUM("low", "normal", "high", "critical", name="job_priority", create_type=False)
+TOOL_STATUS = postgresql.ENUM(
+    "available", "checked_out", "damaged", "calibration", "retired", name="tool_status", create_type=False
+)
+PURCHASE_REQUISITION_STATUS = postgresql.ENUM(
+    "draft", "pending_approval", "approved", "rejected", "converted", name="purchase_requisition_status", create_type=False
+)
+PURCHASE_ORDER_STATUS = postgresql.ENUM(
+    "draft", "sent", "acknowledged", "partial", "received", "closed", name="purchase_order_status", create_type=False
+)
+GOODS_RECEIPT_STATUS = postgresql.ENUM("pending", "verified", "discrepancy", name="goods_receipt_status", create_type=False)
+ENUM_TYPES = (
+    USER_ROLE,
+    NOTIFICATION_PRIORITY,
+    FARM_TASK_STATUS,
+    FARM_TASK_PRIORITY,
+    ASSET_STATUS,
+    ASSET_CRITICALITY,
+    INVENTORY_TRANSACTION_TYPE,
+    JOB_TYPE,
+    JOB_STATUS,
+    JOB_PRIORITY,
+    TOOL_STATUS,
+    PURCHASE_REQUISITION_STATUS,
+    PURCHASE_ORDER_STATUS,
+    GOODS_RECEIPT_STATUS,
+)
+
+# Autovacuum thresholds for the write-hottest tables: vacuum after 2% of rows
+# are dead (default 20%) and re-analyze after 1% change (default 10%).
+HIGH_CHURN_AUTOVACUUM = "autovacuum_vacuum_scale_factor = 0.02, autovacuum_analyze_scale_factor = 0.01"
+
+# Every table created by this revision, children before parents
+TABLES = (
+    "goods_receipt_items",
+    "goods_receipts",
+    "purchase_order_items",
+    "purchase_orders",
+    "purchase_requisition_items",
+    "purchase_requisitions",
+    "preventive_maintenance_schedules",
+    "tool_transactions",
+    "tools",
+    "job_card_materials",
+    "job_cards",
+    "inventory_transactions",
+    "stock_levels",
+    "inventory_items",
+    "assets",
+    "asset_categories",
+    "vendors",
+    "checklist_responses",
+    "checklist_templates",
+    "farm_equipment",
+    "harvests",
+    "watering_schedules",
+    "farm_tasks",
+    "cultivation_cycles",
+    "fields",
+    "crop_varieties",
+    "attachments",
+    "audio_logs",
+    "notifications",
+    "locations",
+    "users",
+    "organizations",
+)
+
+
+class _DDLBatch:
+    """Collect DDL statements and send them to the server in one round-trip."""
+
+    def __init__(self) -> None:
+        self.metadata = sa.MetaData()
+        self.statements: list[str] = []
+        self.unvalidated: list[tuple[str, str]] = []
+
+    def create_table(
+        self,
+        name: str,
+        *columns,
+        fillfactor: Optional[int] = None,
+        high_churn: bool = False,
+        **kwargs,
+    ) -> sa.Table:
+        table = sa.Table(name, self.metadata, *columns, **kwargs)
+        self._add(sa.schema.CreateTable(table, if_not_exists=True, include_foreign_key_constraints=[]))
+        storage_params = []
+        if fillfactor is not None:
+            storage_params.append(f"fillfactor = {fillfactor}")
+        if high_churn:
+            storage_params.append(HIGH_CHURN_AUTOVACUUM)
+        if storage_params:
+            self.statements.append(f"ALTER TABLE {name} SET ({', '.join(storage_params)})")
+        if "updated_at" in table.c:
+            self.statements.append(
+                f"CREATE OR REPLACE TRIGGER {name}_touch_updated_at BEFORE UPDATE ON {name} "
+                "FOR EACH ROW EXECUTE FUNCTION tg_touch_updated_at()"
+            )
+        partitioned = bool(table.dialect_options["postgresql"]["partition_by"])
+        for constraint in table.foreign_key_constraints:
+            (element,) = constraint.elements
+            self.add_foreign_key(
+                name,
+                element.parent.name,
+                element.target_fullname,
+                ondelete=constraint.ondelete,
+                validate_later=not partitioned,
+            )
+        return table
+
+    def add_foreign_key(
+        self, table: str, column: str, target: str, ondelete: str, validate_later: bool = True
+    ) -> None:
+        """Add a foreign key, deferring the validating table scan when possible.
+
+        A NOT VALID constraint only checks new writes, so adding it needs just a
+        brief lock; validate_foreign_keys() scans existing rows afterwards under
+        a lock that does not block reads or writes. Partitioned tables do not
+        support NOT VALID and are validated immediately.
+        """
+        name = f"fk_{table}_{column}"
+        ref_table, ref_column = target.split(".")
+        ddl = (
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+            f"REFERENCES {ref_table} ({ref_column}) ON DELETE {ondelete}"
+        )
+        if validate_later:
+            ddl += " NOT VALID"
+            self.unvalidated.append((table, name))
+        self.statements.append(
+            f"IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN {ddl}; END IF"
+        )
+
+    def validate_foreign_keys(self) -> None:
+        """Validate deferred foreign keys, each in its own short transaction."""
+        self.flush()
+        with op.get_context().autocommit_block():
+            for table, name in self.unvalidated:
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+        self.unvalidated.clear()
+
+    def create_enum(self, enum: postgresql.ENUM) -> None:
+        labels = ", ".join(f"'{label}'" for label in enum.enums)
+        self.statements.append(
+            f"IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = '{enum.name}') THEN "
+            f"CREATE TYPE {enum.name} AS ENUM ({labels}); END IF"
+        )
+
+    def create_index(self, name: str, table_name: str, columns: list[str], **kwargs) -> None:
+        table = self.metadata.tables[table_name]
+        index = sa.Index(name, *(self._index_column(table, column) for column in columns), **kwargs)
+        self._add(sa.schema.CreateIndex(index, if_not_exists=True))
+
+    @staticmethod
+    def _index_column(table: sa.Table, column: str) -> sa.ColumnElement:
+        """Resolve "name" or "name DESC" to a column of the table."""
+        name, _, order = column.partition(" ")
+        return table.c[name].desc() if order.upper() == "DESC" else table.c[name]
+
+    def execute(self, sql: str) -> None:
+        self.statements.append(sql)
+
+    def flush(self) -> None:
+        """Run the collected statements as a single anonymous code block.
+
+        Every statement is guarded with IF NOT EXISTS, so a failed run can be
+        retried as a whole without cleaning up partially created objects.
+        """
+        if not self.statements:
+            return
+        body = ";\n".join(self.statements)
+        with op.get_context().autocommit_block():
+            op.execute(f"DO $batch$ BEGIN\n{body};\nEND $batch$")
+        self.statements.clear()
+
+    def _add(self, ddl: sa.schema.ExecutableDDLElement) -> None:
+        self.statements.append(str(ddl.compile(dialect=op.get_context().dialect)))
+
+
+def _create_quarterly_partitions(
+    batch: _DDLBatch, table: str, first_year: int, last_year: int, high_churn: bool = False
+) -> None:
+    """Create quarterly range partitions plus a DEFAULT catch-all partition.
+
+    Storage parameters cannot be set on a partitioned parent, so high-churn
+    autovacuum settings are applied to each partition.
+    """
+    with_clause = f" WITH ({HIGH_CHURN_AUTOVACUUM})" if high_churn else ""
+    for year in range(first_year, last_year + 1):
+        for quarter in range(4):
+            start = f"{year}-{quarter * 3 + 1:02d}-01"
+            end = f"{year + 1}-01-01" if quarter == 3 else f"{year}-{quarter * 3 + 4:02d}-01"
+            batch.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_{year}_q{quarter + 1} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}'){with_clause}"
+            )
+    batch.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT{with_clause}")
+
 
 def upgrade() -> None:
+    # The whole schema (functions, types, tables, partitions and indexes) is
+    # collected into one batch and created in a single round-trip.
+    batch = _DDLBatch()
+
+    # UUID primary keys default to time-ordered UUIDv7 values (built on
+    # gen_random_uuid(), which is core since PostgreSQL 13), so inserts append
+    # to the right-most B-tree leaf instead of splitting pages across the
+    # tree. The highest-volume append-only and line-item tables go further: an
+    # 8-byte BIGINT identity is the primary key and the UUIDv7 is kept as the
+    # public external_id.
+    batch.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+    # updated_at is set by a trigger rather than by the application, so only
+    # mutable tables carry the column; append-only tables have created_at only.
+    batch.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # locations.parent_path materializes the chain of ancestor ids
+    # ("<root id>/.../<own id>/"), so ancestors are a primary-key lookup and a
+    # subtree is a prefix match. full_path is the matching chain of names
+    # ("Root > ... > Name"). Moving or renaming a location rewrites its
+    # descendants.
+    batch.execute(
+        """
+        CREATE OR REPLACE FUNCTION tg_locations_parent_path() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.parent_id IS NULL THEN
+                NEW.parent_path = NEW.id::text || '/';
+                NEW.full_path = NEW.name;
+            ELSE
+                SELECT parent_path || NEW.id::text || '/', full_path || ' > ' || NEW.name
+                INTO NEW.parent_path, NEW.full_path
+                FROM locations WHERE id = NEW.parent_id;
+            END IF;
+            IF TG_OP = 'UPDATE' AND (NEW.parent_path <> OLD.parent_path OR NEW.full_path <> OLD.full_path) THEN
+                UPDATE locations
+                SET parent_path = NEW.parent_path || substr(parent_path, length(OLD.parent_path) + 1),
+                    full_path = NEW.full_path || substr(full_path, length(OLD.full_path) + 1)
+                WHERE parent_path LIKE OLD.parent_path || '_%';
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for enum in ENUM_TYPES:
+        batch.create_enum(enum)
+
     # ========================================
     # CORE MODULE TABLES
     # ========================================
 
     # Organizations table
-    op.create_table(
+    batch.create_table(
         "organizations",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
-        sa.Column("code", sa.String(50), unique=True, nullable=False),
+        sa.Column("code", sa.Text, unique=True, nullable=False),
         sa.Column("type", sa.String(50), nullable=False, server_default="both"),
-        sa.Column("description", sa.String(500), nullable=True),
+        sa.Column("description", sa.Text, nullable=True),
         sa.Column("settings", postgresql.JSONB, nullable=False, server_default="{}"),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_organizations_code_len"),
     )
 
     # Users table
-    op.create_table(
+    batch.create_table(
         "users",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("employee_code", sa.String(20), unique=True, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("phone", sa.String(15), nullable=True),
         sa.Column("email", sa.String(100), nullable=True),
-        sa.Column("pin_hash", sa.String(256), nullable=True),
-        sa.Column("password_hash", sa.String(256), nullable=True),
-        sa.Column("role", sa.String(50), nullable=False, server_default="worker"),
+        sa.Column("pin_hash", postgresql.BYTEA, nullable=True),
+        sa.Column("password_hash", postgresql.BYTEA, nullable=True),
+        sa.Column("role", USER_ROLE, nullable=False, server_default="worker"),
         sa.Column("department", sa.String(50), nullable=False, server_default="general"),
         sa.Column("preferred_language", sa.String(10), nullable=False, server_default="ta"),
         sa.Column("voice_profile_id", sa.String(100), nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
         sa.Column("is_verified", sa.Boolean, nullable=False, server_default="false"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("octet_length(pin_hash) BETWEEN 32 AND 128", name="ck_users_pin_hash_len"),
+        sa.CheckConstraint("octet_length(password_hash) BETWEEN 32 AND 128", name="ck_users_password_hash_len"),
     )
-    op.create_index("idx_users_org", "users", ["org_id"])
-    op.create_index("idx_users_role", "users", ["role"])
 
     # Locations table (hierarchical)
-    op.create_table(
+    batch.create_table(
         "locations",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("parent_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
-        sa.Column("code", sa.String(50), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("parent_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=True),
+        sa.Column("parent_path", sa.Text, nullable=False),
+        sa.Column("full_path", sa.Text, nullable=False),
+        sa.Column("code", sa.Text, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("type", sa.String(50), nullable=False),
-        sa.Column("qr_code", sa.String(100), unique=True, nullable=True),
+        sa.Column("qr_code", sa.Text, unique=True, nullable=True),
         sa.Column("coordinates", postgresql.JSONB, nullable=True),
         sa.Column("area_sqm", sa.Numeric(10, 2), nullable=True),
-        sa.Column("address", sa.String(500), nullable=True),
-        sa.Column("description", sa.String(500), nullable=True),
-        sa.Column("description_tamil", sa.String(500), nullable=True),
+        sa.Column("address", sa.Text, nullable=True),
+        sa.Column("description", sa.Text, nullable=True),
+        sa.Column("description_tamil", sa.Text, nullable=True),
         sa.Column("extra_data", postgresql.JSONB, nullable=False, server_default="{}"),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_locations_code_len"),
+        sa.CheckConstraint("char_length(qr_code) <= 64", name="ck_locations_qr_code_len"),
+        sa.CheckConstraint("char_length(address) <= 500", name="ck_locations_address_len"),
+    )
+    # Unique keys are built with their tables, never concurrently, so they are
+    # enforced from the first row
+    batch.create_index("idx_locations_org_code", "locations", ["org_id", "code"], unique=True)
+    # Native point derived from the {lat, lng} JSON, for GiST nearest-neighbour
+    # ordering (geo_point <-> point(lng, lat)) without PostGIS. coordinates is
+    # free-form, so rows without numeric lat/lng get a NULL point rather than
+    # failing the insert.
+    batch.execute(
+        "ALTER TABLE locations ADD COLUMN IF NOT EXISTS geo_point point GENERATED ALWAYS AS ("
+        "CASE WHEN jsonb_typeof(coordinates -> 'lat') = 'number' "
+        "AND jsonb_typeof(coordinates -> 'lng') = 'number' "
+        "THEN point((coordinates ->> 'lng')::float8, (coordinates ->> 'lat')::float8) END"
+        ") STORED"
+    )
+    batch.execute(
+        "CREATE OR REPLACE TRIGGER locations_parent_path BEFORE INSERT OR UPDATE OF parent_id, name ON locations "
+        "FOR EACH ROW EXECUTE FUNCTION tg_locations_parent_path()"
     )
-    op.create_index("idx_locations_parent", "locations", ["parent_id"])
-    op.create_index("idx_locations_type", "locations", ["type"])
-    op.create_index("idx_locations_org_code", "locations", ["org_id", "code"], unique=True)
 
-    # Notifications table
-    op.create_table(
+    # Notifications table (partitioned by created_at)
+    batch.create_table(
         "notifications",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), nullable=False),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
         sa.Column("type", sa.String(50), nullable=False, server_default="info"),
-        sa.Column("priority", sa.String(20), nullable=False, server_default="normal"),
-        sa.Column("title", sa.String(200), nullable=False),
-        sa.Column("title_tamil", sa.String(200), nullable=True),
+        sa.Column("priority", NOTIFICATION_PRIORITY, nullable=False, server_default="normal"),
+        sa.Column("title", sa.Text, nullable=False),
+        sa.Column("title_tamil", sa.Text, nullable=True),
         sa.Column("message", sa.Text, nullable=True),
         sa.Column("message_tamil", sa.Text, nullable=True),
         sa.Column("audio_url", sa.String(500), nullable=True),
@@ -105,16 +423,41 @@ def upgrade() -> None:
         sa.Column("action_url", sa.String(500), nullable=True),
         sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        sa.UniqueConstraint("external_id", "created_at", name="uq_notifications_external_id"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    _create_quarterly_partitions(batch, "notifications", 2024, 2026)
+    batch.create_index(
+        "idx_notifications_user_unread",
+        "notifications",
+        ["user_id", "created_at"],
+        postgresql_where=sa.text("read_at IS NULL"),
+    )
+    # Keyset pagination of a user's notifications, newest first. Covers the
+    # list view's columns so pages are served by index-only scans.
+    batch.create_index(
+        "idx_notifications_user_created",
+        "notifications",
+        ["user_id", "created_at DESC", "id DESC"],
+        postgresql_include=["external_id", "type", "priority", "title", "title_tamil", "read_at"],
+    )
+    batch.create_index(
+        "brin_notifications_created",
+        "notifications",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
     )
-    op.create_index("idx_notifications_user", "notifications", ["user_id", "read_at"])
 
-    # Audio logs table
-    op.create_table(
+    # Audio logs table (partitioned by created_at)
+    batch.create_table(
         "audio_logs",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), nullable=False),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("entity_type", sa.String(50), nullable=False),
         sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("audio_url", sa.String(500), nullable=False),
@@ -127,16 +470,45 @@ def upgrade() -> None:
         sa.Column("keywords", postgresql.JSONB, nullable=True),
         sa.Column("processing_status", sa.String(50), nullable=False, server_default="pending"),
         sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("error_message", sa.String(500), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("error_message", sa.Text, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.CheckConstraint("char_length(error_message) <= 2000", name="ck_audio_logs_error_message_len"),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        sa.UniqueConstraint("external_id", "created_at", name="uq_audio_logs_external_id"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    _create_quarterly_partitions(batch, "audio_logs", 2024, 2026)
+    for entity_type in ("farm_task", "job_card", "feedback", "service_request"):
+        batch.create_index(
+            f"idx_audio_{entity_type}",
+            "audio_logs",
+            ["entity_id", "created_at"],
+            postgresql_where=sa.text(f"entity_type = '{entity_type}'"),
+            postgresql_include=["audio_url", "processing_status"],
+        )
+    batch.create_index(
+        "brin_audio_logs_created",
+        "audio_logs",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
     )
-    op.create_index("idx_audio_entity", "audio_logs", ["entity_type", "entity_id"])
+    batch.create_index(
+        "gin_audio_logs_keywords",
+        "audio_logs",
+        ["keywords"],
+        postgresql_using="gin",
+        postgresql_ops={"keywords": "jsonb_path_ops"},
+    )
+    batch.create_index("idx_audio_logs_user", "audio_logs", ["user_id"])
+    batch.create_index("idx_audio_logs_org_created", "audio_logs", ["org_id", "created_at"])
 
     # Attachments table
-    op.create_table(
+    batch.create_table(
         "attachments",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("entity_type", sa.String(50), nullable=False),
         sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("file_url", sa.String(500), nullable=False),
@@ -144,26 +516,24 @@ def upgrade() -> None:
         sa.Column("file_type", sa.String(50), nullable=False, server_default="image"),
         sa.Column("mime_type", sa.String(100), nullable=True),
         sa.Column("file_size_bytes", sa.Integer, nullable=True),
-        sa.Column("caption", sa.String(200), nullable=True),
-        sa.Column("caption_tamil", sa.String(200), nullable=True),
+        sa.Column("caption", sa.Text, nullable=True),
+        sa.Column("caption_tamil", sa.Text, nullable=True),
         sa.Column("sequence_order", sa.Integer, nullable=False, server_default="0"),
         sa.Column("is_before", sa.Boolean, nullable=True),
         sa.Column("category", sa.String(50), nullable=True),
-        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
-    op.create_index("idx_attachments_entity", "attachments", ["entity_type", "entity_id"])
 
     # ========================================
     # FARM MODULE TABLES
     # ========================================
 
     # Crop varieties table
-    op.create_table(
+    batch.create_table(
         "crop_varieties",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("code", sa.String(50), unique=True, nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("code", sa.Text, unique=True, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("category", sa.String(50), nullable=False),
@@ -179,23 +549,24 @@ def upgrade() -> None:
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("description_tamil", sa.Text, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_crop_varieties_code_len"),
     )
 
     # Fields table
-    op.create_table(
+    batch.create_table(
         "fields",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("code", sa.String(50), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("code", sa.Text, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("field_type", sa.String(50), nullable=False, server_default="grass_block"),
         sa.Column("area_acres", sa.Numeric(6, 2), nullable=True),
         sa.Column("soil_type", sa.String(50), nullable=True),
         sa.Column("irrigation_type", sa.String(50), nullable=True),
-        sa.Column("current_crop_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("crop_varieties.id"), nullable=True),
+        sa.Column("current_crop_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("crop_varieties.id", ondelete="SET NULL"), nullable=True),
         sa.Column("last_sowing_date", sa.Date, nullable=True),
         sa.Column("last_harvest_date", sa.Date, nullable=True),
         sa.Column("next_harvest_date", sa.Date, nullable=True),
@@ -203,53 +574,58 @@ def upgrade() -> None:
         sa.Column("status", sa.String(50), nullable=False, server_default="active"),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
         sa.Column("extra_data", postgresql.JSONB, nullable=False, server_default="{}"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_fields_code_len"),
+        fillfactor=80,
     )
 
     # Cultivation cycles table
-    op.create_table(
+    batch.create_table(
         "cultivation_cycles",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id"), nullable=False),
-        sa.Column("crop_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("crop_varieties.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("crop_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("crop_varieties.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("cycle_number", sa.Integer, nullable=False, server_default="1"),
         sa.Column("sowing_date", sa.Date, nullable=False),
         sa.Column("expected_first_harvest", sa.Date, nullable=True),
         sa.Column("actual_first_harvest", sa.Date, nullable=True),
         sa.Column("status", sa.String(50), nullable=False, server_default="active"),
         sa.Column("end_date", sa.Date, nullable=True),
-        sa.Column("end_reason", sa.String(200), nullable=True),
+        sa.Column("end_reason", sa.Text, nullable=True),
         sa.Column("total_harvests", sa.Integer, nullable=False, server_default="0"),
         sa.Column("total_yield_kg", sa.Numeric(10, 2), nullable=False, server_default="0"),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        fillfactor=80,
     )
 
     # Add current_cycle_id to fields after cultivation_cycles exists
-    op.add_column("fields", sa.Column("current_cycle_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("cultivation_cycles.id"), nullable=True))
+    batch.execute("ALTER TABLE fields ADD COLUMN IF NOT EXISTS current_cycle_id UUID")
+    batch.add_foreign_key("fields", "current_cycle_id", "cultivation_cycles.id", ondelete="SET NULL")
 
     # Farm tasks table
-    op.create_table(
+    batch.create_table(
         "farm_tasks",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id"), nullable=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id", ondelete="SET NULL"), nullable=True),
         sa.Column("task_type", sa.String(50), nullable=False),
-        sa.Column("title", sa.String(200), nullable=False),
-        sa.Column("title_tamil", sa.String(200), nullable=True),
+        sa.Column("title", sa.Text, nullable=False),
+        sa.Column("title_tamil", sa.Text, nullable=True),
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("description_tamil", sa.Text, nullable=True),
         sa.Column("scheduled_date", sa.Date, nullable=False),
         sa.Column("scheduled_time", sa.Time, nullable=True),
         sa.Column("due_date", sa.Date, nullable=True),
-        sa.Column("priority", sa.String(20), nullable=False, server_default="normal"),
-        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
-        sa.Column("assigned_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("priority", FARM_TASK_PRIORITY, nullable=False, server_default="normal"),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("assigned_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("assigned_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("checklist_template_id", postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("status", FARM_TASK_STATUS, nullable=False, server_default="pending"),
         sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("postpone_reason", sa.Text, nullable=True),
@@ -258,17 +634,17 @@ def upgrade() -> None:
         sa.Column("feedback_tamil", sa.Text, nullable=True),
         sa.Column("rating", sa.Integer, nullable=True),
         sa.Column("has_voice_notes", sa.Boolean, nullable=False, server_default="false"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        fillfactor=80,
     )
-    op.create_index("idx_farm_tasks_date", "farm_tasks", ["scheduled_date", "status"])
-    op.create_index("idx_farm_tasks_assigned", "farm_tasks", ["assigned_to", "status"])
 
     # Watering schedules table
-    op.create_table(
+    batch.create_table(
         "watering_schedules",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id", ondelete="CASCADE"), nullable=False),
         sa.Column("frequency_days", sa.Integer, nullable=False),
         sa.Column("preferred_time", sa.Time, nullable=True),
         sa.Column("last_watered_date", sa.Date, nullable=True),
@@ -278,23 +654,24 @@ def upgrade() -> None:
         sa.Column("includes_fertilizer", sa.Boolean, nullable=False, server_default="false"),
         sa.Column("fertilizer_type", sa.String(100), nullable=True),
         sa.Column("fertilizer_quantity", sa.String(50), nullable=True),
-        sa.Column("default_assignee", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("default_assignee", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("notes", sa.Text, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
-    # Harvests table
-    op.create_table(
+    # Harvests table (partitioned by harvest_date)
+    batch.create_table(
         "harvests",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id"), nullable=False),
-        sa.Column("cycle_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("cultivation_cycles.id"), nullable=True),
-        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("farm_tasks.id"), nullable=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("cycle_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("cultivation_cycles.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("farm_tasks.id", ondelete="SET NULL"), nullable=True),
         sa.Column("harvest_date", sa.Date, nullable=False),
         sa.Column("harvest_number", sa.Integer, nullable=True),
-        sa.Column("yield_kg", sa.Numeric(10, 2), nullable=False),
+        sa.Column("yield_grams", sa.BigInteger, nullable=False),
         sa.Column("area_harvested_acres", sa.Numeric(6, 2), nullable=True),
         sa.Column("quality_rating", sa.String(20), nullable=True),
         sa.Column("moisture_content", sa.Numeric(5, 2), nullable=True),
@@ -303,60 +680,92 @@ def upgrade() -> None:
         sa.Column("received_by", sa.String(100), nullable=True),
         sa.Column("received_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("receipt_confirmed", sa.Boolean, nullable=False, server_default="false"),
-        sa.Column("harvested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("harvested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.PrimaryKeyConstraint("id", "harvest_date"),
+        postgresql_partition_by="RANGE (harvest_date)",
     )
+    _create_quarterly_partitions(batch, "harvests", 2024, 2026)
+    batch.create_index(
+        "brin_harvests_date",
+        "harvests",
+        ["harvest_date"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 16},
+    )
+    batch.create_index("idx_harvests_org_date", "harvests", ["org_id", "harvest_date"])
+    batch.create_index("idx_harvests_field", "harvests", ["field_id"])
+    for column in ("cycle_id", "task_id", "harvested_by"):
+        batch.create_index(
+            f"idx_harvests_{column.removesuffix('_id')}",
+            "harvests",
+            [column],
+            postgresql_where=sa.text(f"{column} IS NOT NULL"),
+        )
 
     # Farm equipment table
-    op.create_table(
+    batch.create_table(
         "farm_equipment",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("code", sa.String(50), unique=True, nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("code", sa.Text, unique=True, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("category", sa.String(50), nullable=True),
         sa.Column("status", sa.String(50), nullable=False, server_default="available"),
-        sa.Column("current_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
-        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("current_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("purchase_date", sa.Date, nullable=True),
         sa.Column("last_maintenance_date", sa.Date, nullable=True),
         sa.Column("next_maintenance_date", sa.Date, nullable=True),
         sa.Column("specifications", postgresql.JSONB, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_farm_equipment_code_len"),
     )
 
     # Checklist templates table
-    op.create_table(
+    batch.create_table(
         "checklist_templates",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("module", sa.String(50), nullable=False),
         sa.Column("task_type", sa.String(50), nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("items", postgresql.JSONB, nullable=False),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
-    # Checklist responses table
-    op.create_table(
+    # Checklist responses table (partitioned by created_at)
+    batch.create_table(
         "checklist_responses",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), nullable=False),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column("task_type", sa.String(50), nullable=False),
-        sa.Column("template_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_templates.id"), nullable=True),
-        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("template_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_templates.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("responses", postgresql.JSONB, nullable=False),
-        sa.Column("completed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("completed_at", sa.DateTime(timezone=True), server_default=NOW),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        sa.UniqueConstraint("external_id", "created_at", name="uq_checklist_responses_external_id"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    _create_quarterly_partitions(batch, "checklist_responses", 2024, 2026)
+    batch.create_index("idx_checklist_responses_org_created", "checklist_responses", ["org_id", "created_at"])
+    batch.create_index("idx_checklist_responses_user", "checklist_responses", ["user_id"])
+    batch.create_index(
+        "idx_checklist_responses_template",
+        "checklist_responses",
+        ["template_id"],
+        postgresql_where=sa.text("template_id IS NOT NULL"),
     )
 
     # ========================================
@@ -364,32 +773,33 @@ def upgrade() -> None:
     # ========================================
 
     # Asset categories table
-    op.create_table(
+    batch.create_table(
         "asset_categories",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("code", sa.String(50), unique=True, nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("code", sa.Text, unique=True, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("domain", sa.String(50), nullable=False),
-        sa.Column("parent_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("asset_categories.id"), nullable=True),
+        sa.Column("parent_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("asset_categories.id", ondelete="RESTRICT"), nullable=True),
         sa.Column("icon_url", sa.String(500), nullable=True),
         sa.Column("default_maintenance_days", sa.Integer, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_asset_categories_code_len"),
     )
 
     # Assets table
-    op.create_table(
+    batch.create_table(
         "assets",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("category_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("asset_categories.id"), nullable=True),
-        sa.Column("code", sa.String(50), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("category_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("asset_categories.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("code", sa.Text, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
-        sa.Column("qr_code", sa.String(100), unique=True, nullable=True),
+        sa.Column("qr_code", sa.Text, unique=True, nullable=True),
         sa.Column("serial_number", sa.String(100), nullable=True),
         sa.Column("barcode", sa.String(100), nullable=True),
         sa.Column("manufacturer", sa.String(100), nullable=True),
@@ -398,8 +808,8 @@ def upgrade() -> None:
         sa.Column("installation_date", sa.Date, nullable=True),
         sa.Column("warranty_expiry", sa.Date, nullable=True),
         sa.Column("purchase_date", sa.Date, nullable=True),
-        sa.Column("status", sa.String(50), nullable=False, server_default="operational"),
-        sa.Column("criticality", sa.String(20), nullable=False, server_default="medium"),
+        sa.Column("status", ASSET_STATUS, nullable=False, server_default="operational"),
+        sa.Column("criticality", ASSET_CRITICALITY, nullable=False, server_default="medium"),
         sa.Column("last_maintenance_date", sa.Date, nullable=True),
         sa.Column("next_maintenance_date", sa.Date, nullable=True),
         sa.Column("maintenance_interval_days", sa.Integer, nullable=True),
@@ -407,19 +817,19 @@ def upgrade() -> None:
         sa.Column("extra_data", postgresql.JSONB, nullable=False, server_default="{}"),
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_assets_code_len"),
+        sa.CheckConstraint("char_length(qr_code) <= 64", name="ck_assets_qr_code_len"),
+        fillfactor=80,
     )
-    op.create_index("idx_assets_location", "assets", ["location_id"])
-    op.create_index("idx_assets_status", "assets", ["status"])
-    op.create_index("idx_assets_maintenance", "assets", ["next_maintenance_date"])
-    op.create_index("idx_assets_org_code", "assets", ["org_id", "code"], unique=True)
+    batch.create_index("idx_assets_org_code", "assets", ["org_id", "code"], unique=True)
 
     # Inventory items table
-    op.create_table(
+    batch.create_table(
         "inventory_items",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("sku", sa.String(50), unique=True, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
@@ -433,52 +843,69 @@ def upgrade() -> None:
         sa.Column("reorder_point", sa.Numeric(10, 2), nullable=True),
         sa.Column("reorder_quantity", sa.Numeric(10, 2), nullable=True),
         sa.Column("lead_time_days", sa.Integer, nullable=True),
-        sa.Column("unit_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("unit_price_paise", sa.BigInteger, nullable=True),
         sa.Column("is_serialized", sa.Boolean, nullable=False, server_default="false"),
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Stock levels table
-    op.create_table(
+    batch.create_table(
         "stock_levels",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("quantity", sa.Numeric(10, 2), nullable=False, server_default="0"),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("quantity_milli", sa.BigInteger, nullable=False, server_default="0"),
         sa.Column("last_counted_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        fillfactor=80,
+        high_churn=True,
     )
-    op.create_index("idx_stock_levels_item", "stock_levels", ["item_id"])
-    op.create_index("idx_stock_unique", "stock_levels", ["item_id", "location_id"], unique=True)
+    batch.create_index("idx_stock_unique", "stock_levels", ["item_id", "location_id"], unique=True)
 
-    # Inventory transactions table
-    op.create_table(
+    # Inventory transactions table (partitioned by created_at)
+    batch.create_table(
         "inventory_transactions",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("transaction_type", sa.String(50), nullable=False),
-        sa.Column("quantity", sa.Numeric(10, 2), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), nullable=False),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("transaction_type", INVENTORY_TRANSACTION_TYPE, nullable=False),
+        sa.Column("quantity_milli", sa.BigInteger, nullable=False),
         sa.Column("reference_type", sa.String(50), nullable=True),
         sa.Column("reference_id", postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column("unit_cost", sa.Numeric(10, 2), nullable=True),
-        sa.Column("performed_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("unit_cost_paise", sa.BigInteger, nullable=True),
+        sa.Column("performed_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=NOW),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        sa.UniqueConstraint("external_id", "created_at", name="uq_inventory_transactions_external_id"),
+        postgresql_partition_by="RANGE (created_at)",
     )
-    op.create_index("idx_inv_trans_item", "inventory_transactions", ["item_id", "created_at"])
+    _create_quarterly_partitions(batch, "inventory_transactions", 2024, 2026, high_churn=True)
+    batch.create_index("idx_inv_trans_item", "inventory_transactions", ["item_id", "created_at"])
+    batch.create_index(
+        "brin_inv_trans_created",
+        "inventory_transactions",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 16},
+    )
+    batch.create_index("idx_inv_trans_org_created", "inventory_transactions", ["org_id", "created_at"])
+    batch.create_index("idx_inv_trans_location", "inventory_transactions", ["location_id"])
+    batch.create_index("idx_inv_trans_performed_by", "inventory_transactions", ["performed_by"])
 
     # Vendors table
-    op.create_table(
+    batch.create_table(
         "vendors",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("code", sa.String(50), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("code", sa.Text, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("contact_person", sa.String(100), nullable=True),
         sa.Column("phone", sa.String(15), nullable=True),
@@ -491,253 +918,238 @@ def upgrade() -> None:
         sa.Column("payment_terms", sa.String(50), nullable=True),
         sa.Column("rating", sa.Numeric(3, 2), nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_vendors_code_len"),
     )
-    op.create_index("idx_vendors_org_code", "vendors", ["org_id", "code"], unique=True)
+    batch.create_index("idx_vendors_org_code", "vendors", ["org_id", "code"], unique=True)
 
     # Job cards table
-    op.create_table(
+    batch.create_table(
         "job_cards",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("job_number", sa.String(50), unique=True, nullable=False),
-        sa.Column("asset_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assets.id"), nullable=True),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("job_type", sa.String(50), nullable=False),
-        sa.Column("priority", sa.String(20), nullable=False, server_default="normal"),
-        sa.Column("title", sa.String(200), nullable=False),
-        sa.Column("title_tamil", sa.String(200), nullable=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("job_number", sa.String(50), nullable=False),
+        sa.Column("asset_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assets.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("job_type", JOB_TYPE, nullable=False),
+        sa.Column("priority", JOB_PRIORITY, nullable=False, server_default="normal"),
+        sa.Column("title", sa.Text, nullable=False),
+        sa.Column("title_tamil", sa.Text, nullable=True),
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("description_tamil", sa.Text, nullable=True),
-        sa.Column("reported_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("reported_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("reported_via", sa.String(50), nullable=True),
         sa.Column("audio_request_id", postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("assigned_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("status", sa.String(50), nullable=False, server_default="open"),
+        sa.Column("status", JOB_STATUS, nullable=False, server_default="open"),
         sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("resolution", sa.Text, nullable=True),
         sa.Column("resolution_tamil", sa.Text, nullable=True),
         sa.Column("resolution_audio_id", postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column("root_cause", sa.String(200), nullable=True),
+        sa.Column("root_cause", sa.Text, nullable=True),
         sa.Column("mttr_minutes", sa.Integer, nullable=True),
         sa.Column("labor_cost", sa.Numeric(10, 2), nullable=True),
         sa.Column("parts_cost", sa.Numeric(10, 2), nullable=True),
         sa.Column("total_cost", sa.Numeric(10, 2), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        fillfactor=85,
+        high_churn=True,
     )
-    op.create_index("idx_job_cards_status", "job_cards", ["status", "priority"])
-    op.create_index("idx_job_cards_asset", "job_cards", ["asset_id"])
-    op.create_index("idx_job_cards_assigned", "job_cards", ["assigned_to", "status"])
+    batch.create_index("idx_job_cards_org_number", "job_cards", ["org_id", "job_number"], unique=True)
 
     # Job card materials table
-    op.create_table(
+    batch.create_table(
         "job_card_materials",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("job_card_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("job_cards.id"), nullable=False),
-        sa.Column("inventory_item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
-        sa.Column("quantity", sa.Numeric(10, 2), nullable=False),
-        sa.Column("unit_cost", sa.Numeric(10, 2), nullable=True),
-        sa.Column("issued_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("job_card_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("job_cards.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("inventory_item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("quantity_milli", sa.BigInteger, nullable=False),
+        sa.Column("unit_cost_paise", sa.BigInteger, nullable=True),
+        sa.Column("issued_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("issued_at", sa.DateTime(timezone=True), nullable=False),
-        sa.Column("notes", sa.String(200), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("notes", sa.Text, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Tools table
-    op.create_table(
+    batch.create_table(
         "tools",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("code", sa.String(50), unique=True, nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("code", sa.Text, nullable=False),
         sa.Column("name", sa.String(100), nullable=False),
         sa.Column("name_tamil", sa.String(100), nullable=True),
         sa.Column("category", sa.String(50), nullable=True),
-        sa.Column("status", sa.String(50), nullable=False, server_default="available"),
-        sa.Column("current_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
-        sa.Column("checked_out_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("status", TOOL_STATUS, nullable=False, server_default="available"),
+        sa.Column("current_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("checked_out_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("checked_out_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("last_calibration_date", sa.Date, nullable=True),
         sa.Column("next_calibration_date", sa.Date, nullable=True),
         sa.Column("purchase_date", sa.Date, nullable=True),
         sa.Column("specifications", postgresql.JSONB, nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.CheckConstraint("char_length(code) <= 50", name="ck_tools_code_len"),
     )
+    batch.create_index("idx_tools_org_code", "tools", ["org_id", "code"], unique=True)
 
     # Tool transactions table
-    op.create_table(
+    batch.create_table(
         "tool_transactions",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("tool_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tools.id"), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("tool_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tools.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("transaction_type", sa.String(50), nullable=False),
-        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("from_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
-        sa.Column("to_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
-        sa.Column("job_card_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("job_cards.id"), nullable=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("from_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("to_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("job_card_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("job_cards.id", ondelete="SET NULL"), nullable=True),
         sa.Column("condition_notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Purchase requisitions table
-    op.create_table(
+    batch.create_table(
         "purchase_requisitions",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("pr_number", sa.String(50), unique=True, nullable=False),
-        sa.Column("requested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("status", sa.String(50), nullable=False, server_default="draft"),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("pr_number", sa.String(50), nullable=False),
+        sa.Column("requested_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("status", PURCHASE_REQUISITION_STATUS, nullable=False, server_default="draft"),
         sa.Column("priority", sa.String(20), nullable=False, server_default="normal"),
         sa.Column("required_date", sa.Date, nullable=True),
         sa.Column("justification", sa.Text, nullable=True),
         sa.Column("total_amount", sa.Numeric(12, 2), nullable=True),
-        sa.Column("approved_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("approved_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("approved_at", sa.DateTime(timezone=True), nullable=True),
         sa.Column("rejection_reason", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
+    batch.create_index("idx_pr_org_number", "purchase_requisitions", ["org_id", "pr_number"], unique=True)
 
     # Purchase requisition items table
-    op.create_table(
+    batch.create_table(
         "purchase_requisition_items",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("pr_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_requisitions.id"), nullable=False),
-        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("pr_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_requisitions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("quantity", sa.Numeric(10, 2), nullable=False),
         sa.Column("estimated_unit_price", sa.Numeric(10, 2), nullable=True),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Purchase orders table
-    op.create_table(
+    batch.create_table(
         "purchase_orders",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("po_number", sa.String(50), unique=True, nullable=False),
-        sa.Column("pr_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_requisitions.id"), nullable=True),
-        sa.Column("vendor_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("vendors.id"), nullable=False),
-        sa.Column("status", sa.String(50), nullable=False, server_default="draft"),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("po_number", sa.String(50), nullable=False),
+        sa.Column("pr_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_requisitions.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("vendor_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("vendors.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("status", PURCHASE_ORDER_STATUS, nullable=False, server_default="draft"),
         sa.Column("order_date", sa.Date, nullable=True),
         sa.Column("expected_delivery", sa.Date, nullable=True),
-        sa.Column("delivery_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=True),
+        sa.Column("delivery_location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="SET NULL"), nullable=True),
         sa.Column("subtotal", sa.Numeric(12, 2), nullable=True),
         sa.Column("tax_amount", sa.Numeric(12, 2), nullable=True),
         sa.Column("total_amount", sa.Numeric(12, 2), nullable=True),
         sa.Column("terms", sa.Text, nullable=True),
-        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
+    batch.create_index("idx_po_org_number", "purchase_orders", ["org_id", "po_number"], unique=True)
 
     # Purchase order items table
-    op.create_table(
+    batch.create_table(
         "purchase_order_items",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("po_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_orders.id"), nullable=False),
-        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
-        sa.Column("quantity", sa.Numeric(10, 2), nullable=False),
-        sa.Column("unit_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("po_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_orders.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("quantity_milli", sa.BigInteger, nullable=False),
+        sa.Column("unit_price_paise", sa.BigInteger, nullable=False),
         sa.Column("received_quantity", sa.Numeric(10, 2), nullable=False, server_default="0"),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Goods receipts table
-    op.create_table(
+    batch.create_table(
         "goods_receipts",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("grn_number", sa.String(50), unique=True, nullable=False),
-        sa.Column("po_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_orders.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("grn_number", sa.String(50), nullable=False),
+        sa.Column("po_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_orders.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("received_date", sa.Date, nullable=False),
-        sa.Column("received_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id"), nullable=False),
-        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("received_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("location_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("locations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("status", GOODS_RECEIPT_STATUS, nullable=False, server_default="pending"),
         sa.Column("invoice_number", sa.String(50), nullable=True),
         sa.Column("invoice_date", sa.Date, nullable=True),
         sa.Column("invoice_amount", sa.Numeric(12, 2), nullable=True),
         sa.Column("notes", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
+    batch.create_index("idx_grn_org_number", "goods_receipts", ["org_id", "grn_number"], unique=True)
 
     # Goods receipt items table
-    op.create_table(
+    batch.create_table(
         "goods_receipt_items",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("grn_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("goods_receipts.id"), nullable=False),
-        sa.Column("po_item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("purchase_order_items.id"), nullable=False),
-        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id"), nullable=False),
+        sa.Column("id", sa.BigInteger, sa.Identity(always=True), primary_key=True),
+        sa.Column("external_id", postgresql.UUID(as_uuid=True), nullable=False, unique=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("grn_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("goods_receipts.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("po_item_id", sa.BigInteger, sa.ForeignKey("purchase_order_items.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("inventory_items.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("ordered_quantity", sa.Numeric(10, 2), nullable=False),
         sa.Column("received_quantity", sa.Numeric(10, 2), nullable=False),
         sa.Column("accepted_quantity", sa.Numeric(10, 2), nullable=True),
         sa.Column("rejected_quantity", sa.Numeric(10, 2), nullable=False, server_default="0"),
         sa.Column("rejection_reason", sa.Text, nullable=True),
         sa.Column("condition", sa.String(50), nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
 
     # Preventive maintenance schedules table
-    op.create_table(
+    batch.create_table(
         "preventive_maintenance_schedules",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("asset_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assets.id"), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("asset_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("assets.id", ondelete="CASCADE"), nullable=False),
         sa.Column("schedule_type", sa.String(50), nullable=True),
         sa.Column("frequency_days", sa.Integer, nullable=True),
         sa.Column("last_performed", sa.Date, nullable=True),
         sa.Column("next_due", sa.Date, nullable=True),
-        sa.Column("task_template_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_templates.id"), nullable=True),
-        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("task_template_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_templates.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("assigned_to", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("is_active", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
-    op.create_index("idx_pm_schedules_due", "preventive_maintenance_schedules", ["next_due", "is_active"])
+    batch.validate_foreign_keys()
 
 
 def downgrade() -> None:
-    # Drop all tables in reverse order of creation
-    op.drop_table("goods_receipt_items")
-    op.drop_table("goods_receipts")
-    op.drop_table("purchase_order_items")
-    op.drop_table("purchase_orders")
-    op.drop_table("purchase_requisition_items")
-    op.drop_table("purchase_requisitions")
-    op.drop_table("preventive_maintenance_schedules")
-    op.drop_table("tool_transactions")
-    op.drop_table("tools")
-    op.drop_table("job_card_materials")
-    op.drop_table("job_cards")
-    op.drop_table("inventory_transactions")
-    op.drop_table("stock_levels")
-    op.drop_table("inventory_items")
-    op.drop_table("assets")
-    op.drop_table("asset_categories")
-    op.drop_table("vendors")
-    op.drop_table("checklist_responses")
-    op.drop_table("checklist_templates")
-    op.drop_table("farm_equipment")
-    op.drop_table("harvests")
-    op.drop_table("watering_schedules")
-    op.drop_table("farm_tasks")
-    op.drop_column("fields", "current_cycle_id")
-    op.drop_table("cultivation_cycles")
-    op.drop_table("fields")
-    op.drop_table("crop_varieties")
-    op.drop_table("attachments")
-    op.drop_table("audio_logs")
-    op.drop_table("notifications")
-    op.drop_table("locations")
-    op.drop_table("users")
-    op.drop_table("organizations")
+    # One DROP removes all tables (with their partitions, indexes and
+    # triggers); CASCADE takes care of the fields <-> cultivation_cycles cycle.
+    batch = _DDLBatch()
+    batch.execute(f"DROP TABLE IF EXISTS {', '.join(TABLES)} CASCADE")
+    batch.execute(f"DROP TYPE IF EXISTS {', '.join(enum.name for enum in ENUM_TYPES)}")
+    batch.execute("DROP FUNCTION IF EXISTS tg_locations_parent_path()")
+    batch.execute("DROP FUNCTION IF EXISTS tg_touch_updated_at()")
+    batch.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
+    batch.flush()
@@ -18,41 +18,61 @@ down_revision: Union[str, None] = "001_initial"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+NOW = sa.text("now()")
+
+# Same thresholds as the high-churn tables in 001_initial
+HIGH_CHURN_AUTOVACUUM = "autovacuum_vacuum_scale_factor = 0.02, autovacuum_analyze_scale_factor = 0.01"
+
+
+def _create_index(name: str, table: str, columns: list[str], **kwargs) -> None:
+    """Create an index without taking a write-blocking lock.
+
+    A failed concurrent build leaves an INVALID index behind that IF NOT EXISTS
+    would skip on retry, so any such leftover is dropped and rebuilt.
+    """
+    invalid = op.get_bind().scalar(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    )
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(
+        name,
+        table,
+        columns,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+        **kwargs,
+    )
+
 
 def upgrade() -> None:
     # Day schedules table
     op.create_table(
         "day_schedules",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("schedule_date", sa.Date, nullable=False, index=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("schedule_date", sa.Date, nullable=False),
         sa.Column("notes", sa.Text, nullable=True),
         sa.Column("notes_tamil", sa.Text, nullable=True),
-        sa.Column("created_by_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_by_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("is_published", sa.Boolean, nullable=False, server_default="true"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
-    op.create_index("idx_day_schedules_org_date", "day_schedules", ["org_id", "schedule_date"], unique=True)
 
     # Scheduled tasks table
     op.create_table(
         "scheduled_tasks",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
-        sa.Column("schedule_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("day_schedules.id"), nullable=True),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("org_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("schedule_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("day_schedules.id", ondelete="CASCADE"), nullable=True),
         sa.Column("description", sa.Text, nullable=True),
         sa.Column("description_tamil", sa.Text, nullable=False),
-        sa.Column("scheduled_time", sa.DateTime(timezone=True), nullable=False, index=True),
+        sa.Column("scheduled_time", sa.DateTime(timezone=True), nullable=False),
         sa.Column("category", sa.String(50), nullable=False),
-        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id"), nullable=True),
-        sa.Column("field_name", sa.String(100), nullable=True),
-        sa.Column("field_name_tamil", sa.String(100), nullable=True),
-        sa.Column("crop_name", sa.String(100), nullable=True),
-        sa.Column("crop_name_tamil", sa.String(100), nullable=True),
-        sa.Column("assigned_worker_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
-        sa.Column("assigned_worker_name", sa.String(100), nullable=True),
-        sa.Column("assigned_worker_name_tamil", sa.String(100), nullable=True),
+        sa.Column("field_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fields.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("assigned_worker_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
         sa.Column("priority", sa.String(20), nullable=False, server_default="normal"),
         sa.Column("status", sa.String(50), nullable=False, server_default="scheduled"),
         sa.Column("notes", sa.Text, nullable=True),
@@ -63,20 +83,16 @@ def upgrade() -> None:
         sa.Column("issue_type", sa.String(50), nullable=True),
         sa.Column("issue_description", sa.Text, nullable=True),
         sa.Column("issue_description_tamil", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
-    op.create_index("idx_scheduled_tasks_org_time", "scheduled_tasks", ["org_id", "scheduled_time"])
-    op.create_index("idx_scheduled_tasks_worker", "scheduled_tasks", ["assigned_worker_id", "scheduled_time"])
-    op.create_index("idx_scheduled_tasks_schedule", "scheduled_tasks", ["schedule_id"])
 
     # Task updates table
     op.create_table(
         "task_updates",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("scheduled_tasks.id"), nullable=False),
-        sa.Column("worker_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
-        sa.Column("worker_name", sa.String(100), nullable=False),
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("uuid_generate_v7()")),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("scheduled_tasks.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("worker_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
         sa.Column("status", sa.String(50), nullable=False),
         sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
         sa.Column("notes", sa.Text, nullable=True),
@@ -85,10 +101,39 @@ def upgrade() -> None:
         sa.Column("issue_type", sa.String(50), nullable=True),
         sa.Column("issue_description", sa.Text, nullable=True),
         sa.Column("issue_description_tamil", sa.Text, nullable=True),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=NOW, nullable=False),
     )
-    op.create_index("idx_task_updates_task", "task_updates", ["task_id", "timestamp"])
+
+    # Unique keys are built with the table so they are enforced from the first row
+    op.create_index("idx_day_schedules_org_date", "day_schedules", ["org_id", "schedule_date"], unique=True)
+
+    # Tasks move through several status updates after insert; leave room on
+    # each page so those updates stay HOT and skip index maintenance
+    op.execute(f"ALTER TABLE scheduled_tasks SET (fillfactor = 85, {HIGH_CHURN_AUTOVACUUM})")
+    op.execute(f"ALTER TABLE task_updates SET ({HIGH_CHURN_AUTOVACUUM})")
+
+    # Keep updated_at current via tg_touch_updated_at() from 001_initial
+    for table in ("day_schedules", "scheduled_tasks", "task_updates"):
+        op.execute(
+            f"CREATE TRIGGER {table}_touch_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION tg_touch_updated_at()"
+        )
+
+    # Build indexes concurrently (outside the transaction) so writers are not
+    # blocked while they build.
+    with op.get_context().autocommit_block():
+        _create_index("idx_scheduled_tasks_org_time", "scheduled_tasks", ["org_id", "scheduled_time"])
+        _create_index(
+            "idx_scheduled_tasks_open",
+            "scheduled_tasks",
+            ["org_id", "scheduled_time"],
+            postgresql_where=sa.text("status IN ('scheduled', 'pending', 'in_progress')"),
+        )
+        _create_index("idx_scheduled_tasks_worker", "scheduled_tasks", ["assigned_worker_id", "scheduled_time"])
+        _create_index("idx_scheduled_tasks_schedule", "scheduled_tasks", ["schedule_id"])
+        _create_index("idx_scheduled_tasks_field", "scheduled_tasks", ["field_id"])
+        _create_index("idx_task_updates_task", "task_updates", ["task_id", "timestamp"])
 
 
 def downgrade() -> None:
@@ -0,0 +1,361 @@
+"""Build secondary indexes concurrently
+
+Revision ID: 003_concurrent_indexes
+Revises: 002_scheduled_tasks
+Create Date: 2024-03-01 00:00:00.000000
+
+CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so every
+index here is built from an autocommit block. Writers stay online while the
+indexes build on a populated database.
+
+Partitioned tables cannot be indexed concurrently, and unique indexes must
+never be left INVALID by a failed build; both are created alongside their
+tables in 001_initial.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_concurrent_indexes"
+down_revision: Union[str, None] = "002_scheduled_tasks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Entity types that attachments are listed for; each gets its own partial index.
+ATTACHMENT_ENTITY_TYPES = (
+    "farm_task",
+    "job_card",
+    "asset",
+    "harvest",
+    "checklist_response",
+)
+
+# Foreign key columns that are not the leading column of any other index.
+FK_INDEXES = (
+    ("attachments", "created_by"),
+    ("cultivation_cycles", "field_id"),
+    ("cultivation_cycles", "crop_id"),
+    ("watering_schedules", "field_id"),
+    ("stock_levels", "location_id"),
+    ("job_card_materials", "job_card_id"),
+    ("tool_transactions", "tool_id"),
+    ("preventive_maintenance_schedules", "asset_id"),
+    ("purchase_requisition_items", "pr_id"),
+    ("purchase_order_items", "po_id"),
+    ("goods_receipts", "po_id"),
+    ("goods_receipt_items", "grn_id"),
+    ("goods_receipt_items", "po_item_id"),
+)
+# Child tables that carry their own org_id for tenant-scoped listing;
+# partitioned ones are indexed in 001_initial.
+ORG_SCOPED_CHILD_TABLES = (
+    "attachments",
+    "cultivation_cycles",
+    "watering_schedules",
+    "stock_levels",
+)
+# Optional foreign keys that are mostly NULL.
+SPARSE_FK_INDEXES = (
+    ("fields", "current_crop_id"),
+    ("fields", "current_cycle_id"),
+    ("farm_equipment", "current_location_id"),
+    ("farm_equipment", "assigned_to"),
+    ("watering_schedules", "default_assignee"),
+)
+
+# Equality-only lookup columns (QR/barcode scans, SKU and login lookups).
+HASH_LOOKUP_COLUMNS = (
+    ("users", "employee_code"),
+    ("locations", "qr_code"),
+    ("assets", "qr_code"),
+    ("assets", "serial_number"),
+    ("assets", "barcode"),
+    ("inventory_items", "sku"),
+)
+
+# Time columns that grow with insertion order, for date-range scans across
+# an organization's history (dashboards and reports).
+BRIN_TIME_COLUMNS = (
+    ("task_updates", "timestamp"),
+    ("scheduled_tasks", "scheduled_time"),
+    ("job_cards", "created_at"),
+)
+
+
+def _create_index(name: str, table: str, columns: list[str], **kwargs) -> None:
+    """Create an index without taking a write-blocking lock.
+
+    A failed concurrent build leaves an INVALID index behind that IF NOT EXISTS
+    would skip on retry, so any such leftover is dropped and rebuilt.
+    """
+    invalid = op.get_bind().scalar(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    )
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(
+        name,
+        table,
+        columns,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+        **kwargs,
+    )
+
+
+def _drop_index(name: str, table: str) -> None:
+    """Drop an index without taking a write-blocking lock."""
+    op.drop_index(
+        name,
+        table_name=table,
+        postgresql_concurrently=True,
+        if_exists=True,
+    )
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # ========================================
+        # CORE MODULE INDEXES
+        # ========================================
+        _create_index(
+            "idx_users_org_role",
+            "users",
+            ["org_id", "role"],
+            postgresql_include=["name", "employee_code", "is_active"],
+        )
+        # Keyset pagination: WHERE (created_at, id) < cursor ORDER BY both DESC
+        _create_index(
+            "idx_users_org_created",
+            "users",
+            ["org_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+        _create_index(
+            "idx_locations_org_created",
+            "locations",
+            ["org_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+        _create_index("idx_locations_parent", "locations", ["parent_id"])
+        _create_index(
+            "idx_locations_parent_path",
+            "locations",
+            ["parent_path"],
+            postgresql_ops={"parent_path": "text_pattern_ops"},
+        )
+        _create_index("idx_locations_type", "locations", ["type"])
+        _create_index(
+            "gist_locations_geo_point",
+            "locations",
+            ["geo_point"],
+            postgresql_using="gist",
+        )
+        for entity_type in ATTACHMENT_ENTITY_TYPES:
+            _create_index(
+                f"idx_attach_{entity_type}",
+                "attachments",
+                ["entity_id", "sequence_order"],
+                postgresql_where=sa.text(f"entity_type = '{entity_type}'"),
+                postgresql_include=["file_url", "file_type", "caption"],
+            )
+
+        # ========================================
+        # FARM MODULE INDEXES
+        # ========================================
+        _create_index(
+            "idx_farm_tasks_org_date",
+            "farm_tasks",
+            ["org_id", "scheduled_date", "status"],
+        )
+        _create_index(
+            "idx_farm_tasks_assignee",
+            "farm_tasks",
+            ["assigned_to", "status", "scheduled_date"],
+            postgresql_include=["title", "priority"],
+        )
+        _create_index(
+            "idx_farm_tasks_pending",
+            "farm_tasks",
+            ["org_id", "scheduled_date"],
+            postgresql_where=sa.text("status = 'pending'"),
+        )
+        _create_index("idx_fields_location", "fields", ["location_id"])
+
+        # ========================================
+        # MAINTENANCE MODULE INDEXES
+        # ========================================
+        _create_index(
+            "idx_assets_location_active",
+            "assets",
+            ["location_id"],
+            postgresql_where=sa.text("is_active"),
+        )
+        _create_index("idx_assets_status", "assets", ["status"])
+        _create_index(
+            "idx_assets_maintenance_due",
+            "assets",
+            ["next_maintenance_date"],
+            postgresql_where=sa.text("is_active AND status = 'operational'"),
+        )
+        _create_index("idx_stock_levels_item", "stock_levels", ["item_id"])
+        # One covering index serves the worker queue and status dashboards
+        # with index-only scans; open jobs per asset get a small partial index.
+        _create_index(
+            "idx_job_cards_assigned_status_priority",
+            "job_cards",
+            ["assigned_to", "status", "priority"],
+            postgresql_include=["asset_id", "job_number", "title"],
+        )
+        _create_index(
+            "idx_job_cards_open",
+            "job_cards",
+            ["asset_id"],
+            postgresql_where=sa.text(
+                "status IN ('open', 'assigned', 'in_progress', 'on_hold')"
+            ),
+        )
+        _create_index(
+            "idx_pm_schedules_due_active",
+            "preventive_maintenance_schedules",
+            ["next_due"],
+            postgresql_where=sa.text("is_active"),
+        )
+        _create_index(
+            "idx_tools_available",
+            "tools",
+            ["org_id", "code"],
+            postgresql_where=sa.text("status = 'available' AND is_active"),
+        )
+
+        # ========================================
+        # FOREIGN KEY INDEXES
+        # ========================================
+        # Deleting or re-keying a parent row looks up its children by the
+        # referencing column; without an index that is a sequential scan of
+        # the child table. Sparse optional references get partial indexes.
+        for table, column in FK_INDEXES:
+            _create_index(f"idx_{table}_{column}", table, [column])
+        for table in ORG_SCOPED_CHILD_TABLES:
+            _create_index(f"idx_{table}_org_created", table, ["org_id", "created_at"])
+        for table, column in SPARSE_FK_INDEXES:
+            _create_index(
+                f"idx_{table}_{column}",
+                table,
+                [column],
+                postgresql_where=sa.text(f"{column} IS NOT NULL"),
+            )
+
+        # ========================================
+        # HASH INDEXES
+        # ========================================
+        # Scan/lookup codes are only ever compared with =; a hash index is a
+        # single probe and smaller than the unique B-tree that backs it.
+        for table, column in HASH_LOOKUP_COLUMNS:
+            _create_index(
+                f"hash_{table}_{column}",
+                table,
+                [column],
+                postgresql_using="hash",
+                postgresql_where=sa.text(f"{column} IS NOT NULL"),
+            )
+
+        # ========================================
+        # BRIN INDEXES
+        # ========================================
+        # Rows arrive roughly in time order, so a block-range summary of each
+        # 32 pages answers range filters at a tiny fraction of a B-tree's size.
+        for table, column in BRIN_TIME_COLUMNS:
+            _create_index(
+                f"brin_{table}_{column}",
+                table,
+                [column],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+            )
+
+        # ========================================
+        # JSONB INDEXES
+        # ========================================
+        # jsonb_path_ops only supports containment (@>) but is much smaller;
+        # columns read with key lookups (?, ?|) keep the default jsonb_ops.
+        _create_index(
+            "gin_assets_specs",
+            "assets",
+            ["specifications"],
+            postgresql_using="gin",
+            postgresql_ops={"specifications": "jsonb_path_ops"},
+        )
+        _create_index(
+            "gin_farm_equipment_specs",
+            "farm_equipment",
+            ["specifications"],
+            postgresql_using="gin",
+            postgresql_ops={"specifications": "jsonb_path_ops"},
+        )
+        _create_index(
+            "gin_vendors_categories",
+            "vendors",
+            ["categories"],
+            postgresql_using="gin",
+            postgresql_ops={"categories": "jsonb_path_ops"},
+        )
+        _create_index(
+            "gin_checklist_templates_items",
+            "checklist_templates",
+            ["items"],
+            postgresql_using="gin",
+            postgresql_ops={"items": "jsonb_path_ops"},
+        )
+        _create_index(
+            "gin_fields_extra_data", "fields", ["extra_data"], postgresql_using="gin"
+        )
+        _create_index(
+            "gin_assets_extra_data", "assets", ["extra_data"], postgresql_using="gin"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _drop_index("gin_assets_extra_data", "assets")
+        _drop_index("gin_fields_extra_data", "fields")
+        _drop_index("gin_checklist_templates_items", "checklist_templates")
+        _drop_index("gin_vendors_categories", "vendors")
+        _drop_index("gin_farm_equipment_specs", "farm_equipment")
+        _drop_index("gin_assets_specs", "assets")
+        for table, column in reversed(BRIN_TIME_COLUMNS):
+            _drop_index(f"brin_{table}_{column}", table)
+        for table, column in reversed(HASH_LOOKUP_COLUMNS):
+            _drop_index(f"hash_{table}_{column}", table)
+        for table, column in reversed(SPARSE_FK_INDEXES):
+            _drop_index(f"idx_{table}_{column}", table)
+        for table in reversed(ORG_SCOPED_CHILD_TABLES):
+            _drop_index(f"idx_{table}_org_created", table)
+        for table, column in reversed(FK_INDEXES):
+            _drop_index(f"idx_{table}_{column}", table)
+        _drop_index("idx_tools_available", "tools")
+        _drop_index("idx_pm_schedules_due_active", "preventive_maintenance_schedules")
+        _drop_index("idx_job_cards_open", "job_cards")
+        _drop_index("idx_job_cards_assigned_status_priority", "job_cards")
+        _drop_index("idx_stock_levels_item", "stock_levels")
+        _drop_index("idx_assets_maintenance_due", "assets")
+        _drop_index("idx_assets_status", "assets")
+        _drop_index("idx_assets_location_active", "assets")
+        _drop_index("idx_fields_location", "fields")
+        _drop_index("idx_farm_tasks_pending", "farm_tasks")
+        _drop_index("idx_farm_tasks_assignee", "farm_tasks")
+        _drop_index("idx_farm_tasks_org_date", "farm_tasks")
+        for entity_type in reversed(ATTACHMENT_ENTITY_TYPES):
+            _drop_index(f"idx_attach_{entity_type}", "attachments")
+        _drop_index("gist_locations_geo_point", "locations")
+        _drop_index("idx_locations_type", "locations")
+        _drop_index("idx_locations_parent_path", "locations")
+        _drop_index("idx_locations_parent", "locations")
+        _drop_index("idx_locations_org_created", "locations")
+        _drop_index("idx_users_org_created", "users")
+        _drop_index("idx_users_org_role", "users")
@@ -0,0 +1,111 @@
+"""Add quarterly partition maintenance
+
+Revision ID: 004_partition_maintenance
+Revises: 003_concurrent_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+001_initial only creates partitions for 2024-2026, and anything later lands
+in each table's DEFAULT partition. create_quarterly_partitions() adds the
+missing quarters up to a given date. This migration runs it two years ahead,
+and scripts/create_partitions.py keeps the horizon moving and should run
+from cron at least once a quarter.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_partition_maintenance"
+down_revision: Union[str, None] = "003_concurrent_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Creates every missing quarter from the current one through `through`, named
+# and configured like the partitions from 001_initial. Rows that already sit
+# in the DEFAULT partition for a new quarter are moved into it; the DEFAULT
+# partition is detached meanwhile, since Postgres refuses to add a range that
+# DEFAULT already holds rows for.
+CREATE_QUARTERLY_PARTITIONS = """
+CREATE OR REPLACE FUNCTION create_quarterly_partitions(parent regclass, through date)
+RETURNS void AS $$
+DECLARE
+    key_column text;
+    default_partition regclass := to_regclass(parent::text || '_default');
+    storage text;
+    quarter_start date := date_trunc('quarter', current_date);
+    quarter_end date;
+    partition_name text;
+    in_default boolean;
+BEGIN
+    SELECT a.attname INTO key_column
+    FROM pg_partitioned_table pt
+    JOIN pg_attribute a ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+    WHERE pt.partrelid = parent;
+
+    SELECT ' WITH (' || array_to_string(reloptions, ', ') || ')' INTO storage
+    FROM pg_class
+    WHERE oid = default_partition;
+
+    WHILE quarter_start <= through LOOP
+        quarter_end := quarter_start + interval '3 months';
+        partition_name := format(
+            '%s_%s_q%s',
+            parent,
+            extract(year FROM quarter_start)::int,
+            extract(quarter FROM quarter_start)::int
+        );
+
+        IF to_regclass(partition_name) IS NULL THEN
+            in_default := false;
+            IF default_partition IS NOT NULL THEN
+                EXECUTE format(
+                    'SELECT EXISTS (SELECT 1 FROM %s WHERE %I >= %L AND %I < %L)',
+                    default_partition, key_column, quarter_start, key_column, quarter_end
+                ) INTO in_default;
+            END IF;
+
+            IF in_default THEN
+                EXECUTE format(
+                    'ALTER TABLE %s DETACH PARTITION %s', parent, default_partition
+                );
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)%s',
+                partition_name, parent, quarter_start, quarter_end, coalesce(storage, '')
+            );
+            IF in_default THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %s WHERE %I >= %L AND %I < %L RETURNING *) '
+                    'INSERT INTO %s OVERRIDING SYSTEM VALUE SELECT * FROM moved',
+                    default_partition, key_column, quarter_start, key_column, quarter_end,
+                    parent
+                );
+                EXECUTE format(
+                    'ALTER TABLE %s ATTACH PARTITION %s DEFAULT', parent, default_partition
+                );
+            END IF;
+        END IF;
+
+        quarter_start := quarter_end;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(CREATE_QUARTERLY_PARTITIONS)
+    op.execute("""
+        SELECT create_quarterly_partitions(
+            partrelid::regclass, (current_date + interval '2 years')::date
+        )
+        FROM pg_partitioned_table
+        WHERE partstrat = 'r'
+        """)
+
+
+def downgrade() -> None:
+    # Partitions created by the function are left in place; they are
+    # ordinary partitions of the 001_initial tables and drop with them.
+    op.execute("DROP FUNCTION IF EXISTS create_quarterly_partitions(regclass, date)")
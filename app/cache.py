@@ -0,0 +1,63 @@
+"""
+Redis cache for hot, rarely-changing lookups.
+
+The cache is an optimization only: if Redis is unreachable, reads miss and
+writes are dropped, so callers fall back to the database.
+"""
+
+import logging
+from typing import Optional, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+redis_client = Redis.from_url(
+    settings.redis_url,
+    socket_connect_timeout=1,
+    socket_timeout=1,
+)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get a cached value, or None on a miss or if Redis is unavailable."""
+    try:
+        # Responses are not decoded, so values come back as bytes
+        return cast(Optional[bytes], await redis_client.get(key))
+    except RedisError as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Cache a value with an expiry."""
+    try:
+        await redis_client.set(key, value, ex=ttl_seconds)
+    except RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def cache_add(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Cache a value with an expiry unless the key already holds one."""
+    try:
+        await redis_client.set(key, value, ex=ttl_seconds, nx=True)
+    except RedisError as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """Invalidate cached values."""
+    if not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache invalidation failed for %d keys: %s", len(keys), e)
+
+
+async def close_cache() -> None:
+    """Close Redis connections."""
+    await redis_client.aclose()
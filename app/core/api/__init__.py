@@ -1,7 +1,16 @@
 """
 Core API routers.
+
+Router modules are imported on first access, so importing one router does
+not pull in the models, schemas and services of all the others.
 """
 
-from app.core.api import auth, locations, notifications, users, voice
+import importlib
 
 __all__ = ["auth", "users", "locations", "notifications", "voice"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
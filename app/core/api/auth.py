@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.models.user import User
 from app.core.schemas.auth import (
     ChangePINRequest,
+    CurrentUserResponse,
     LoginRequest,
     LoginResponse,
     RefreshTokenRequest,
@@ -94,7 +95,7 @@ async def change_pin(
     return MessageResponse(message="PIN changed successfully")
 
 
-@router.get("/me")
+@router.get("/me", response_model=CurrentUserResponse)
 async def get_current_user_info(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
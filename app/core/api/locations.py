@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models.user import User, UserRole
-from app.core.schemas.common import MessageResponse, PaginatedResponse
+from app.core.schemas.common import CursorPage, MessageResponse
 from app.core.schemas.location import (
     LocationCreate,
     LocationListItem,
@@ -25,7 +25,7 @@ from app.database import get_db
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[LocationListItem])
+@router.get("", response_model=CursorPage[LocationListItem])
 async def list_locations(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -33,7 +33,7 @@ async def list_locations(
     location_type: Optional[str] = None,
     is_active: Optional[bool] = True,
     search: Optional[str] = None,
-    page: int = Query(default=1, ge=1),
+    cursor: Optional[str] = None,
     page_size: int = Query(default=50, ge=1, le=100),
 ):
     """
@@ -43,25 +43,23 @@ async def list_locations(
     - **location_type**: Filter by type (guest_house, room, field, etc.)
     - **is_active**: Filter by active status
     - **search**: Search by name or code
+    - **cursor**: next_cursor from the previous page
     """
     location_service = LocationService(db)
-    offset = (page - 1) * page_size
 
-    locations, total = await location_service.get_all(
+    locations, next_cursor = await location_service.get_all(
         org_id=current_user.org_id,
         parent_id=parent_id,
         location_type=location_type,
         is_active=is_active,
         search=search,
-        offset=offset,
+        cursor=cursor,
         limit=page_size,
     )
 
-    return PaginatedResponse.create(
-        items=[LocationListItem.model_validate(loc) for loc in locations],
-        total=total,
-        page=page,
-        page_size=page_size,
+    return CursorPage.create(
+        items=[LocationListItem.from_db(location) for location in locations],
+        next_cursor=next_cursor,
     )
 
 
@@ -100,31 +98,9 @@ async def lookup_by_qr(
     if location.org_id != current_user.org_id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    # Get parent path
-    parent_path = await location_service.get_parent_path(location.id)
-
     return LocationQRLookup(
-        location=LocationResponse(
-            id=location.id,
-            org_id=location.org_id,
-            parent_id=location.parent_id,
-            code=location.code,
-            name=location.name,
-            name_tamil=location.name_tamil,
-            type=location.type,
-            qr_code=location.qr_code,
-            coordinates=location.coordinates,
-            area_sqm=location.area_sqm,
-            address=location.address,
-            description=location.description,
-            description_tamil=location.description_tamil,
-            metadata=location.metadata,
-            is_active=location.is_active,
-            full_path=location.full_path,
-            created_at=location.created_at,
-            updated_at=location.updated_at,
-        ),
-        parent_path=[LocationListItem.model_validate(p) for p in parent_path],
+        location=LocationResponse.from_db(location),
+        parent_path=await location_service.get_cached_parent_path(location),
     )
 
 
@@ -146,26 +122,7 @@ async def get_location(
     if location.org_id != current_user.org_id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return LocationResponse(
-        id=location.id,
-        org_id=location.org_id,
-        parent_id=location.parent_id,
-        code=location.code,
-        name=location.name,
-        name_tamil=location.name_tamil,
-        type=location.type,
-        qr_code=location.qr_code,
-        coordinates=location.coordinates,
-        area_sqm=location.area_sqm,
-        address=location.address,
-        description=location.description,
-        description_tamil=location.description_tamil,
-        metadata=location.metadata,
-        is_active=location.is_active,
-        full_path=location.full_path,
-        created_at=location.created_at,
-        updated_at=location.updated_at,
-    )
+    return LocationResponse.from_db(location)
 
 
 @router.post("", response_model=LocationResponse, status_code=201)
@@ -186,26 +143,7 @@ async def create_location(
     location_service = LocationService(db)
     location = await location_service.create(data)
 
-    return LocationResponse(
-        id=location.id,
-        org_id=location.org_id,
-        parent_id=location.parent_id,
-        code=location.code,
-        name=location.name,
-        name_tamil=location.name_tamil,
-        type=location.type,
-        qr_code=location.qr_code,
-        coordinates=location.coordinates,
-        area_sqm=location.area_sqm,
-        address=location.address,
-        description=location.description,
-        description_tamil=location.description_tamil,
-        metadata=location.metadata,
-        is_active=location.is_active,
-        full_path=location.full_path,
-        created_at=location.created_at,
-        updated_at=location.updated_at,
-    )
+    return LocationResponse.from_db(location)
 
 
 @router.put("/{location_id}", response_model=LocationResponse)
@@ -231,26 +169,7 @@ async def update_location(
 
     location = await location_service.update(location_id, data)
 
-    return LocationResponse(
-        id=location.id,
-        org_id=location.org_id,
-        parent_id=location.parent_id,
-        code=location.code,
-        name=location.name,
-        name_tamil=location.name_tamil,
-        type=location.type,
-        qr_code=location.qr_code,
-        coordinates=location.coordinates,
-        area_sqm=location.area_sqm,
-        address=location.address,
-        description=location.description,
-        description_tamil=location.description_tamil,
-        metadata=location.metadata,
-        is_active=location.is_active,
-        full_path=location.full_path,
-        created_at=location.created_at,
-        updated_at=location.updated_at,
-    )
+    return LocationResponse.from_db(location)
 
 
 @router.delete("/{location_id}", response_model=MessageResponse)
@@ -8,8 +8,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.models.notification import NotificationPriority
 from app.core.models.user import User
-from app.core.schemas.common import MessageResponse, PaginatedResponse
+from app.core.schemas.common import CursorPage, MessageResponse
 from app.core.schemas.notification import (
     NotificationCount,
     NotificationListItem,
@@ -22,13 +23,13 @@ from app.database import get_db
 router = APIRouter()
 
 
-@router.get("", response_model=PaginatedResponse[NotificationListItem])
+@router.get("", response_model=CursorPage[NotificationListItem])
 async def list_notifications(
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     unread_only: bool = False,
     notification_type: Optional[str] = None,
-    page: int = Query(default=1, ge=1),
+    cursor: Optional[str] = None,
     page_size: int = Query(default=20, ge=1, le=100),
 ):
     """
@@ -36,34 +37,23 @@ async def list_notifications(
 
     - **unread_only**: Only return unread notifications
     - **notification_type**: Filter by type (alert, reminder, etc.)
+    - **cursor**: next_cursor from the previous page
     """
     notification_service = NotificationService(db)
-    offset = (page - 1) * page_size
 
-    notifications, total = await notification_service.get_user_notifications(
+    notifications, next_cursor = await notification_service.get_user_notifications(
         user_id=current_user.id,
         unread_only=unread_only,
         notification_type=notification_type,
-        offset=offset,
+        cursor=cursor,
         limit=page_size,
     )
 
-    return PaginatedResponse.create(
+    return CursorPage.create(
         items=[
-            NotificationListItem(
-                id=n.id,
-                type=n.type,
-                priority=n.priority,
-                title=n.title,
-                title_tamil=n.title_tamil,
-                is_read=n.is_read,
-                created_at=n.created_at,
-            )
-            for n in notifications
+            NotificationListItem.from_db(notification) for notification in notifications
         ],
-        total=total,
-        page=page,
-        page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -100,10 +90,10 @@ async def get_notification(
         raise HTTPException(status_code=403, detail="Access denied")
 
     return NotificationResponse(
-        id=notification.id,
+        id=notification.external_id,
         user_id=notification.user_id,
         type=notification.type,
-        priority=notification.priority,
+        priority=NotificationPriority(notification.priority),
         title=notification.title,
         title_tamil=notification.title_tamil,
         message=notification.message,
@@ -5,11 +5,11 @@ User management API endpoints.
 from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models.user import User, UserRole
-from app.core.schemas.common import MessageResponse, PaginatedResponse
+from app.core.schemas.common import CursorPage, MessageResponse
 from app.core.schemas.user import (
     UserCreate,
     UserProfile,
@@ -30,21 +30,11 @@ async def get_my_profile(
     """
     Get the current user's profile.
     """
-    return UserProfile(
-        id=current_user.id,
-        employee_code=current_user.employee_code,
-        name=current_user.name,
-        name_tamil=current_user.name_tamil,
-        phone=current_user.phone,
-        email=current_user.email,
-        role=current_user.role,
-        department=current_user.department,
-        preferred_language=current_user.preferred_language,
-        org_id=current_user.org_id,
-        org_name=current_user.organization.name if current_user.organization else "",
-        org_name_tamil=current_user.organization.name_tamil if current_user.organization else None,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at,
+    organization = current_user.organization
+    return UserProfile.from_db(
+        current_user,
+        org_name=organization.name if organization else "",
+        org_name_tamil=organization.name_tamil if organization else None,
     )
 
 
@@ -67,19 +57,19 @@ async def update_my_profile(
 
     user_service = UserService(db)
     user = await user_service.update(current_user.id, data)
-    return UserResponse.model_validate(user)
+    return UserResponse.from_db(user)
 
 
-@router.get("", response_model=PaginatedResponse[UserResponse])
+@router.get("", response_model=CursorPage[UserResponse])
 async def list_users(
     current_user: Annotated[User, Depends(require_role(UserRole.SUPERVISOR, UserRole.MANAGER, UserRole.ADMIN))],
     db: Annotated[AsyncSession, Depends(get_db)],
     org_id: Optional[UUID] = None,
     department: Optional[str] = None,
-    role: Optional[str] = None,
+    role: Optional[UserRole] = None,
     is_active: Optional[bool] = None,
     search: Optional[str] = None,
-    page: int = Query(default=1, ge=1),
+    cursor: Optional[str] = None,
     page_size: int = Query(default=20, ge=1, le=100),
 ):
     """
@@ -92,22 +82,19 @@ async def list_users(
         org_id = current_user.org_id
 
     user_service = UserService(db)
-    offset = (page - 1) * page_size
-    users, total = await user_service.get_all(
+    users, next_cursor = await user_service.get_all(
         org_id=org_id,
         department=department,
         role=role,
         is_active=is_active,
         search=search,
-        offset=offset,
+        cursor=cursor,
         limit=page_size,
     )
 
-    return PaginatedResponse.create(
-        items=[UserResponse.model_validate(u) for u in users],
-        total=total,
-        page=page,
-        page_size=page_size,
+    return CursorPage.create(
+        items=[UserResponse.from_db(user) for user in users],
+        next_cursor=next_cursor,
     )
 
 
@@ -125,15 +112,13 @@ async def get_user(
     user_service = UserService(db)
     user = await user_service.get_by_id(user_id)
     if not user:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="User not found")
 
     # Non-admins can only view users in their organization
     if not current_user.is_admin and user.org_id != current_user.org_id:
-        from fastapi import HTTPException
         raise HTTPException(status_code=403, detail="Access denied")
 
-    return UserResponse.model_validate(user)
+    return UserResponse.from_db(user)
 
 
 @router.post("", response_model=UserResponse, status_code=201)
@@ -153,7 +138,7 @@ async def create_user(
 
     user_service = UserService(db)
     user = await user_service.create(data)
-    return UserResponse.model_validate(user)
+    return UserResponse.from_db(user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -171,16 +156,14 @@ async def update_user(
     user_service = UserService(db)
     user = await user_service.get_by_id(user_id)
     if not user:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="User not found")
 
     # Non-admins can only update users in their organization
     if not current_user.is_admin and user.org_id != current_user.org_id:
-        from fastapi import HTTPException
         raise HTTPException(status_code=403, detail="Access denied")
 
     user = await user_service.update(user_id, data)
-    return UserResponse.model_validate(user)
+    return UserResponse.from_db(user)
 
 
 @router.delete("/{user_id}", response_model=MessageResponse)
@@ -214,12 +197,10 @@ async def reset_user_pin(
     user_service = UserService(db)
     user = await user_service.get_by_id(user_id)
     if not user:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="User not found")
 
     # Non-admins can only reset PINs for users in their organization
     if not current_user.is_admin and user.org_id != current_user.org_id:
-        from fastapi import HTTPException
         raise HTTPException(status_code=403, detail="Access denied")
 
     await user_service.reset_pin(user_id, new_pin)
@@ -2,17 +2,72 @@
 Voice processing API endpoints for Bhashini STT/TTS integration.
 """
 
-from typing import Annotated, Optional
-
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+import re
+from collections.abc import Callable, Coroutine
+from typing import Annotated, Any, Optional
+
+import ahocorasick
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Message, Receive
 
+from app.config import settings
 from app.core.models.user import User
 from app.core.schemas.common import BaseSchema
 from app.core.services.auth import get_current_user
 from app.database import get_db
 
-router = APIRouter()
+
+def _limit_body(receive: Receive, max_bytes: int) -> Receive:
+    """Wrap an ASGI receive callable to fail once the body exceeds max_bytes."""
+    received = 0
+
+    async def limited_receive() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_bytes:
+                raise HTTPException(status_code=413, detail="Audio too large")
+        return message
+
+    return limited_receive
+
+
+class AudioUploadRoute(APIRoute):
+    """
+    Route that rejects request bodies over max_audio_upload_bytes.
+
+    The check runs before FastAPI parses the multipart form, so an oversized
+    upload is refused from its Content-Length, or as soon as a chunked body
+    crosses the limit, instead of after the whole file has been spooled.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        max_bytes = settings.max_audio_upload_bytes
+
+        async def limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                raise HTTPException(status_code=413, detail="Audio too large")
+            return await handler(
+                Request(request.scope, _limit_body(request.receive, max_bytes))
+            )
+
+        return limited_handler
+
+
+router = APIRouter(route_class=AudioUploadRoute)
 
 
 # Tamil keyword mappings for domain-specific terms
@@ -58,6 +113,20 @@ TAMIL_KEYWORD_MAPPING = {
 }
 
 
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build an automaton that finds every keyword in one pass over a transcript."""
+    automaton = ahocorasick.Automaton()
+    for tamil_word, data in TAMIL_KEYWORD_MAPPING.items():
+        automaton.add_word(tamil_word, (tamil_word, data))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+_NUMBER_RE = re.compile(r"\d+")
+
+
 class TranscribeRequest(BaseSchema):
     """Request for audio transcription."""
 
@@ -98,6 +167,22 @@ class KeywordMapping(BaseSchema):
     category: str
 
 
+# TAMIL_KEYWORD_MAPPING never changes, so the /keywords responses are built once
+_ALL_KEYWORD_MAPPINGS: tuple[KeywordMapping, ...] = tuple(
+    KeywordMapping(tamil=tamil, english=data["en"], category=data["category"])
+    for tamil, data in TAMIL_KEYWORD_MAPPING.items()
+)
+_KEYWORD_MAPPINGS_BY_CATEGORY: dict[str, tuple[KeywordMapping, ...]] = {
+    category: tuple(m for m in _ALL_KEYWORD_MAPPINGS if m.category == category)
+    for category in {m.category for m in _ALL_KEYWORD_MAPPINGS}
+}
+
+# The endpoint requires authentication, so only the client may cache the
+# mappings. They change only with a deploy; an hour keeps a new release from
+# being masked for long.
+KEYWORDS_CACHE_CONTROL = "private, max-age=3600"
+
+
 @router.post("/transcribe", response_model=TranscribeResponse)
 async def transcribe_audio(
     current_user: Annotated[User, Depends(get_current_user)],
@@ -124,9 +209,6 @@ async def transcribe_audio(
             detail=f"Invalid audio format. Allowed: {', '.join(allowed_types)}",
         )
 
-    # Read audio content
-    audio_content = await audio.read()
-
     # TODO: Implement actual Bhashini API call
     # For now, return a mock response
     # In production, this would call:
@@ -184,6 +266,7 @@ async def synthesize_speech(
 
 @router.get("/keywords", response_model=list[KeywordMapping])
 async def get_keyword_mappings(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     category: Optional[str] = None,
 ):
@@ -197,38 +280,40 @@ async def get_keyword_mappings(
     - Displaying Tamil terms to users
     - Mapping voice input to system actions
     """
-    mappings = [
-        KeywordMapping(tamil=tamil, english=data["en"], category=data["category"])
-        for tamil, data in TAMIL_KEYWORD_MAPPING.items()
-    ]
+    response.headers["Cache-Control"] = KEYWORDS_CACHE_CONTROL
 
     if category:
-        mappings = [m for m in mappings if m.category == category]
-
-    return mappings
+        return _KEYWORD_MAPPINGS_BY_CATEGORY.get(category, ())
+    return _ALL_KEYWORD_MAPPINGS
 
 
 def extract_keywords(transcript: str) -> list[dict]:
     """
     Extract domain-specific keywords from Tamil transcript.
+
+    Keywords are reported once each, in the order they first appear. Where
+    keywords overlap the longest one wins, so "சரிசெய்" (fix) is not also
+    reported as "சரி" (okay).
     """
     keywords = []
-    transcript_lower = transcript.lower()
-
-    for tamil_word, data in TAMIL_KEYWORD_MAPPING.items():
-        if tamil_word in transcript_lower:
-            keywords.append(
-                {
-                    "tamil": tamil_word,
-                    "english": data["en"],
-                    "category": data["category"],
-                }
-            )
+    seen = set()
+
+    # Keys are all Tamil script, which has no case, so the transcript is
+    # matched as-is rather than lowercased
+    for _, (tamil_word, data) in _KEYWORD_AUTOMATON.iter_long(transcript):
+        if tamil_word in seen:
+            continue
+        seen.add(tamil_word)
+        keywords.append(
+            {
+                "tamil": tamil_word,
+                "english": data["en"],
+                "category": data["category"],
+            }
+        )
 
     # Extract numbers (room numbers, quantities, etc.)
-    import re
-
-    numbers = re.findall(r"\d+", transcript)
+    numbers = _NUMBER_RE.findall(transcript)
     for num in numbers:
         keywords.append(
             {
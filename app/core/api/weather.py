@@ -2,9 +2,10 @@
 Weather API endpoints for IMD weather data.
 """
 
-from typing import Annotated, Optional
+import hashlib
+from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.core.models.user import User
 from app.core.schemas.weather import WeatherResponse
@@ -13,21 +14,51 @@ from app.core.services.weather import WeatherService
 
 router = APIRouter()
 
-# Global weather service instance
-# In production, this could be managed via dependency injection
-_weather_service: Optional[WeatherService] = None
+# The endpoints require authentication, so only the client may cache responses;
+# shared caches would serve them to unauthenticated requests. The service
+# refreshes the data every 15 minutes.
+WEATHER_CACHE_CONTROL = "private, max-age=600"
 
 
-def get_weather_service() -> WeatherService:
-    """Get or create weather service instance."""
-    global _weather_service
-    if _weather_service is None:
-        _weather_service = WeatherService(cache_ttl_minutes=15)
-    return _weather_service
+async def get_weather_service(request: Request) -> WeatherService:
+    """Get the app's weather service, creating it on first use.
+
+    The service is shared through app.state and closed by the application
+    lifespan, so its HTTP client only exists once weather is requested.
+    Declared async so FastAPI calls it on the event loop rather than
+    dispatching it to the thread pool, where two requests could each create
+    a service.
+    """
+    service: Optional[WeatherService] = getattr(
+        request.app.state, "weather_service", None
+    )
+    if service is None:
+        service = WeatherService(cache_ttl_minutes=15)
+        request.app.state.weather_service = service
+    return service
+
+
+def _cacheable(
+    request: Request, response: Response, weather: WeatherResponse
+) -> Union[WeatherResponse, Response]:
+    """Add caching headers, answering 304 if the client already has this data."""
+    # The cached flag differs between the first and later reads of the same data
+    payload = weather.model_dump_json(exclude={"cached"}).encode()
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": WEATHER_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return weather
 
 
 @router.get("/tiruvannamalai", response_model=WeatherResponse)
 async def get_tiruvannamalai_weather(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     weather_service: Annotated[WeatherService, Depends(get_weather_service)],
 ):
@@ -43,19 +74,17 @@ async def get_tiruvannamalai_weather(
 
     Data is cached for 15 minutes to reduce API calls.
     Falls back to reasonable defaults if IMD API is unavailable.
+    Responses carry an ETag; send it back in If-None-Match to get a 304.
     """
-    try:
-        weather_data = await weather_service.get_tiruvannamalai_weather()
-        return WeatherResponse(**weather_data)
-    except Exception as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Weather service temporarily unavailable: {str(e)}",
-        )
+    return _cacheable(
+        request, response, await weather_service.get_tiruvannamalai_weather()
+    )
 
 
 @router.get("/current", response_model=WeatherResponse)
 async def get_current_weather(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     weather_service: Annotated[WeatherService, Depends(get_weather_service)],
     latitude: Optional[float] = Query(None, description="Latitude coordinate"),
@@ -70,25 +99,8 @@ async def get_current_weather(
     **Note**: Coordinate-based weather is planned for future implementation.
     Currently returns Tiruvannamalai data regardless of coordinates.
     """
-    try:
-        if latitude is not None and longitude is not None:
-            weather_data = await weather_service.get_weather_by_coordinates(
-                latitude, longitude
-            )
-        else:
-            weather_data = await weather_service.get_tiruvannamalai_weather()
-
-        return WeatherResponse(**weather_data)
-    except Exception as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Weather service temporarily unavailable: {str(e)}",
-        )
-
-
-@router.on_event("shutdown")
-async def shutdown_weather_service():
-    """Clean up weather service on shutdown."""
-    global _weather_service
-    if _weather_service:
-        await _weather_service.close()
+    if latitude is not None and longitude is not None:
+        weather = await weather_service.get_weather_by_coordinates(latitude, longitude)
+    else:
+        weather = await weather_service.get_tiruvannamalai_weather()
+    return _cacheable(request, response, weather)
@@ -4,7 +4,14 @@ Core module database models.
 
 from app.core.models.attachment import Attachment
 from app.core.models.audio_log import AudioLog
-from app.core.models.base import BaseModel, TimestampMixin
+from app.core.models.base import (
+    AppendOnlyModel,
+    BaseModel,
+    CreatedAtMixin,
+    IdentityBaseModel,
+    IdentityModel,
+    TimestampMixin,
+)
 from app.core.models.location import Location
 from app.core.models.notification import Notification
 from app.core.models.organization import Organization
@@ -12,6 +19,10 @@ from app.core.models.user import User
 
 __all__ = [
     "BaseModel",
+    "AppendOnlyModel",
+    "IdentityModel",
+    "IdentityBaseModel",
+    "CreatedAtMixin",
     "TimestampMixin",
     "Organization",
     "User",
@@ -6,11 +6,11 @@ import uuid
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.models.base import BaseModel
+from app.core.models.base import IdentityModel
 
 
 class AttachmentType(str, Enum):
@@ -22,7 +22,7 @@ class AttachmentType(str, Enum):
     VIDEO = "video"
 
 
-class Attachment(BaseModel):
+class Attachment(IdentityModel):
     """
     Attachment model for photos and documents.
 
@@ -35,6 +35,10 @@ class Attachment(BaseModel):
 
     __tablename__ = "attachments"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     # Entity reference (polymorphic)
     entity_type: Mapped[str] = mapped_column(
         String(50), nullable=False
@@ -51,8 +55,8 @@ class Attachment(BaseModel):
     file_size_bytes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Metadata
-    caption: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
-    caption_tamil: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    caption: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    caption_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Ordering and categorization
     sequence_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -10,10 +10,10 @@ from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.models.base import BaseModel
+from app.core.models.base import IdentityModel
 
 
-class AudioLog(BaseModel):
+class AudioLog(IdentityModel):
     """
     Audio log model for storing voice recordings and transcriptions.
 
@@ -28,6 +28,10 @@ class AudioLog(BaseModel):
 
     __tablename__ = "audio_logs"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     # User who recorded
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
@@ -64,7 +68,7 @@ class AudioLog(BaseModel):
     processed_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
-    error_message: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     def __repr__(self) -> str:
         return f"<AudioLog(id={self.id}, entity_type={self.entity_type}, status={self.processing_status})>"
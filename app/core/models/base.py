@@ -6,33 +6,59 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import BigInteger, DateTime, FetchedValue, Identity, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
 
-class TimestampMixin:
-    """Mixin that adds created_at and updated_at timestamp columns."""
+class CreatedAtMixin:
+    """Mixin that adds a created_at timestamp column."""
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
+
+
+class TimestampMixin(CreatedAtMixin):
+    """
+    Mixin that adds created_at and updated_at timestamp columns.
+
+    updated_at is maintained by the tg_touch_updated_at() trigger, so the ORM
+    never writes it and reads the new value back from UPDATE ... RETURNING.
+    """
+
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
 
-class BaseModel(Base, TimestampMixin):
+class _Model(Base):
+    """Abstract model with the helpers shared by every table."""
+
+    __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert model to dictionary."""
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(id={getattr(self, 'id', None)})>"
+
+
+class _UUIDModel(_Model):
     """
-    Abstract base model with UUID primary key and timestamps.
-    All models should inherit from this class.
+    Abstract model with a UUID primary key.
+
+    Ids are generated by the database as time-ordered UUIDv7 values and read
+    back with RETURNING, so new rows land at the end of the primary key index.
     """
 
     __abstract__ = True
@@ -40,12 +66,58 @@ class BaseModel(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("uuid_generate_v7()"),
     )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}(id={self.id})>"
+class BaseModel(_UUIDModel, TimestampMixin):
+    """
+    Abstract base model with UUID primary key and timestamps.
+    All models should inherit from this class.
+    """
+
+    __abstract__ = True
+
+
+class AppendOnlyModel(_UUIDModel, CreatedAtMixin):
+    """
+    Abstract base model for append-only (log/ledger) tables.
+
+    Rows are not updated after insert, so there is no updated_at column.
+    """
+
+    __abstract__ = True
+
+
+class _IdentityModel(_Model):
+    """
+    Abstract model with an internal BIGINT identity primary key.
+
+    external_id is the UUID exposed through the API and used for lookups by
+    clients; the 8-byte key keeps primary and foreign key indexes narrow.
+    """
+
+    __abstract__ = True
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
+        primary_key=True,
+    )
+    external_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        server_default=text("uuid_generate_v7()"),
+        nullable=False,
+    )
+
+
+class IdentityModel(_IdentityModel, CreatedAtMixin):
+    """Abstract base model for high-volume append-only tables."""
+
+    __abstract__ = True
+
+
+class IdentityBaseModel(_IdentityModel, TimestampMixin):
+    """Abstract base model for high-volume line-item tables that are updated."""
+
+    __abstract__ = True
@@ -9,7 +9,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, FetchedValue, ForeignKey, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,6 +38,11 @@ class LocationType(str, Enum):
     STORAGE = "storage"
 
 
+_TYPE_GUEST_HOUSE = LocationType.GUEST_HOUSE.value
+_TYPE_ROOM = LocationType.ROOM.value
+_TYPE_FIELD = LocationType.FIELD.value
+
+
 class Location(BaseModel):
     """
     Hierarchical location model supporting both maintenance and farm domains.
@@ -65,27 +70,35 @@ class Location(BaseModel):
     parent_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("locations.id"), nullable=True
     )
+    # "<root id>/.../<own id>/" and "Root > ... > Name", maintained by a
+    # trigger on parent_id and name
+    parent_path: Mapped[str] = mapped_column(
+        Text, nullable=False, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    full_path: Mapped[str] = mapped_column(
+        Text, nullable=False, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
 
     # Identity
-    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    code: Mapped[str] = mapped_column(Text, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     type: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # QR Code for scanning
-    qr_code: Mapped[Optional[str]] = mapped_column(String(100), unique=True, nullable=True)
+    qr_code: Mapped[Optional[str]] = mapped_column(Text, unique=True, nullable=True)
 
     # Geographic data
     coordinates: Mapped[Optional[dict]] = mapped_column(
         JSONB, nullable=True
-    )  # {lat, lng, polygon}
+    )  # {lat, lng, polygon}; the DB derives a GiST-indexed geo_point from lat/lng
     area_sqm: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
-    address: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Extra data
     extra_data: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    description_tamil: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    description_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -99,30 +112,24 @@ class Location(BaseModel):
         remote_side="Location.id",
         back_populates="children",
     )
+    # Not loaded implicitly; get_tree() builds the hierarchy in one query
     children: Mapped[list["Location"]] = relationship(
         "Location",
         back_populates="parent",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
-    @property
-    def full_path(self) -> str:
-        """Get full path from root to this location."""
-        if self.parent:
-            return f"{self.parent.full_path} > {self.name}"
-        return self.name
-
     @property
     def is_guest_house(self) -> bool:
-        return self.type == LocationType.GUEST_HOUSE.value
+        return self.type == _TYPE_GUEST_HOUSE
 
     @property
     def is_room(self) -> bool:
-        return self.type == LocationType.ROOM.value
+        return self.type == _TYPE_ROOM
 
     @property
     def is_field(self) -> bool:
-        return self.type == LocationType.FIELD.value
+        return self.type == _TYPE_FIELD
 
     def __repr__(self) -> str:
         return f"<Location(id={self.id}, code={self.code}, name={self.name}, type={self.type})>"
@@ -8,10 +8,10 @@ from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.models.base import BaseModel
+from app.core.models.base import IdentityModel
 
 if TYPE_CHECKING:
     from app.core.models.user import User
@@ -38,7 +38,10 @@ class NotificationPriority(str, Enum):
     CRITICAL = "critical"
 
 
-class Notification(BaseModel):
+_PRIORITY_CRITICAL = NotificationPriority.CRITICAL.value
+
+
+class Notification(IdentityModel):
     """
     Notification model with Tamil voice support.
 
@@ -61,12 +64,17 @@ class Notification(BaseModel):
         String(50), nullable=False, default=NotificationType.INFO.value
     )
     priority: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=NotificationPriority.NORMAL.value
+        ENUM(
+            *(priority.value for priority in NotificationPriority),
+            name="notification_priority",
+        ),
+        nullable=False,
+        default=NotificationPriority.NORMAL.value,
     )
 
     # Content
-    title: Mapped[str] = mapped_column(String(200), nullable=False)
-    title_tamil: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    title_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     message_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -105,7 +113,7 @@ class Notification(BaseModel):
 
     @property
     def is_critical(self) -> bool:
-        return self.priority == NotificationPriority.CRITICAL.value
+        return self.priority == _PRIORITY_CRITICAL
 
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, type={self.type}, user_id={self.user_id})>"
@@ -4,7 +4,7 @@ Organization model for multi-tenant support.
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,20 +29,21 @@ class Organization(BaseModel):
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    code: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     type: Mapped[str] = mapped_column(
         String(50), nullable=False, default="both"
     )  # 'farm', 'maintenance', 'both'
-    description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     settings: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    # Relationships
+    # Relationships. These collections are unbounded, so they are never
+    # loaded implicitly; query users and locations by org_id instead.
     users: Mapped[list["User"]] = relationship(
-        "User", back_populates="organization", lazy="selectin"
+        "User", back_populates="organization", lazy="raise_on_sql"
     )
     locations: Mapped[list["Location"]] = relationship(
-        "Location", back_populates="organization", lazy="selectin"
+        "Location", back_populates="organization", lazy="raise_on_sql"
     )
 
     def __repr__(self) -> str:
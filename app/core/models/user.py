@@ -6,8 +6,8 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, ForeignKey, LargeBinary, String
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.models.base import BaseModel
@@ -35,6 +35,17 @@ class Department(str, Enum):
     GENERAL = "general"
 
 
+# Role values as loaded from the database, for the permission properties
+_ROLE_ADMIN = UserRole.ADMIN.value
+_SUPERVISOR_ROLES = frozenset({UserRole.SUPERVISOR.value, UserRole.MANAGER.value, UserRole.ADMIN.value})
+
+# Departments whose users can use each app module
+_FARM_DEPARTMENTS = frozenset({Department.FARM.value, Department.GENERAL.value})
+_MAINTENANCE_DEPARTMENTS = frozenset(
+    {Department.ELECTRICAL.value, Department.PLUMBING.value, Department.GENERAL.value}
+)
+
+
 class User(BaseModel):
     """
     User model supporting PIN-based authentication for low-literacy users.
@@ -63,16 +74,18 @@ class User(BaseModel):
     email: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Authentication
-    pin_hash: Mapped[Optional[str]] = mapped_column(
-        String(256), nullable=True
-    )  # For PIN-based auth
-    password_hash: Mapped[Optional[str]] = mapped_column(
-        String(256), nullable=True
-    )  # For admin users
+    pin_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True
+    )  # For PIN-based auth (raw bcrypt hash)
+    password_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True
+    )  # For admin users (raw bcrypt hash)
 
     # Role and Department
     role: Mapped[str] = mapped_column(
-        String(50), nullable=False, default=UserRole.WORKER.value
+        ENUM(*(role.value for role in UserRole), name="user_role"),
+        nullable=False,
+        default=UserRole.WORKER.value,
     )
     department: Mapped[str] = mapped_column(
         String(50), nullable=False, default=Department.GENERAL.value
@@ -94,29 +107,26 @@ class User(BaseModel):
     organization: Mapped["Organization"] = relationship(
         "Organization", back_populates="users"
     )
+    # Unbounded; use NotificationService to page through a user's notifications
     notifications: Mapped[list["Notification"]] = relationship(
-        "Notification", back_populates="user", lazy="selectin"
+        "Notification", back_populates="user", lazy="raise_on_sql"
     )
 
     @property
     def is_admin(self) -> bool:
-        return self.role == UserRole.ADMIN.value
+        return self.role == _ROLE_ADMIN
 
     @property
     def is_supervisor(self) -> bool:
-        return self.role in [UserRole.SUPERVISOR.value, UserRole.MANAGER.value, UserRole.ADMIN.value]
+        return self.role in _SUPERVISOR_ROLES
 
     @property
     def can_access_farm(self) -> bool:
-        return self.department in [Department.FARM.value, Department.GENERAL.value]
+        return self.department in _FARM_DEPARTMENTS
 
     @property
     def can_access_maintenance(self) -> bool:
-        return self.department in [
-            Department.ELECTRICAL.value,
-            Department.PLUMBING.value,
-            Department.GENERAL.value,
-        ]
+        return self.department in _MAINTENANCE_DEPARTMENTS
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, code={self.employee_code}, name={self.name}, role={self.role})>"
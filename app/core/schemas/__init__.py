@@ -4,9 +4,10 @@ Core module Pydantic schemas for request/response validation.
 
 from app.core.schemas.auth import LoginRequest, LoginResponse, RefreshTokenRequest, TokenData
 from app.core.schemas.common import (
+    Cursor,
+    CursorPage,
     ErrorResponse,
     MessageResponse,
-    PaginatedResponse,
     PaginationParams,
 )
 from app.core.schemas.location import (
@@ -29,9 +30,10 @@ from app.core.schemas.user import UserCreate, UserProfile, UserResponse, UserUpd
 
 __all__ = [
     # Common
+    "Cursor",
+    "CursorPage",
     "ErrorResponse",
     "MessageResponse",
-    "PaginatedResponse",
     "PaginationParams",
     # Auth
     "LoginRequest",
@@ -68,6 +68,20 @@ class LoginResponse(BaseSchema):
     org_name: str
 
 
+class CurrentUserResponse(BaseSchema):
+    """Authenticated user's profile returned by /auth/me."""
+
+    id: UUID
+    employee_code: str
+    name: str
+    name_tamil: Optional[str] = None
+    role: str
+    department: str
+    org_id: UUID
+    org_name: Optional[str] = None
+    preferred_language: str
+
+
 class RefreshTokenRequest(BaseSchema):
     """Refresh token request."""
 
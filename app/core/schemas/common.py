@@ -2,7 +2,11 @@
 Common Pydantic schemas used across the application.
 """
 
-from typing import Any, Generic, Optional, TypeVar
+import base64
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Generic, NamedTuple, Optional, Self, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,6 +22,49 @@ class BaseSchema(BaseModel):
         str_strip_whitespace=True,
     )
 
+    @classmethod
+    def from_db(cls, obj: Any, **values: Any) -> Self:
+        """
+        Build the schema from an ORM object or row without validation.
+
+        Fields given in values are used as-is instead of being read from obj.
+        Only for values the database has already typed; request bodies must
+        still go through model_validate.
+        """
+        return cls.model_construct(
+            **{
+                name: convert(getattr(obj, attribute))
+                for name, attribute, convert in _db_fields(cls)
+                if name not in values
+            },
+            **values,
+        )
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+@cache
+def _db_fields(schema: type[BaseModel]) -> list[tuple[str, str, Callable[[Any], Any]]]:
+    """Field name, source attribute and converter for each field of a schema.
+
+    Enum columns are stored as plain strings and are wrapped in their enum so
+    serialization sees the declared type.
+    """
+    fields: list[tuple[str, str, Callable[[Any], Any]]] = []
+    for name, field in schema.model_fields.items():
+        alias = field.validation_alias
+        attribute = alias if isinstance(alias, str) else name
+        annotation = field.annotation
+        convert = (
+            annotation
+            if isinstance(annotation, type) and issubclass(annotation, Enum)
+            else _keep
+        )
+        fields.append((name, attribute, convert))
+    return fields
+
 
 class ErrorResponse(BaseSchema):
     """Standard error response schema."""
@@ -52,27 +99,44 @@ class PaginationParams(BaseModel):
         return (self.page - 1) * self.page_size
 
 
-class PaginatedResponse(BaseSchema, Generic[T]):
-    """Paginated response wrapper for list endpoints."""
+class Cursor(NamedTuple):
+    """Keyset position of the last row on a page, ordered by (created_at, id)."""
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        """Encode as an opaque, URL-safe token."""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Decode a token produced by encode(); raises ValueError if malformed."""
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, _, id_ = raw.partition("|")
+        if not id_:
+            raise ValueError("Invalid cursor")
+        return cls(datetime.fromisoformat(created_at), id_)
+
+
+class CursorPage(BaseSchema, Generic[T]):
+    """
+    Keyset-paginated response; pass next_cursor back to fetch the next page.
+
+    There is deliberately no total: counting every matching row costs a
+    full scan of the filtered set on each request.
+    """
 
     items: list[T]
-    total: int
-    page: int
-    page_size: int
-    total_pages: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
     @classmethod
-    def create(
-        cls, items: list[T], total: int, page: int, page_size: int
-    ) -> "PaginatedResponse[T]":
-        """Create a paginated response."""
-        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+    def create(cls, items: list[T], next_cursor: Optional[str]) -> "CursorPage[T]":
+        """Create a page from the results of page_items()."""
         return cls(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages,
+            items=items, next_cursor=next_cursor, has_more=next_cursor is not None
         )
 
 
@@ -61,7 +61,8 @@ class LocationResponse(LocationBase):
     coordinates: Optional[dict[str, Any]] = None
     area_sqm: Optional[Decimal] = None
     address: Optional[str] = None
-    metadata: dict[str, Any]
+    # Stored as Location.extra_data; Location.metadata is SQLAlchemy's MetaData
+    metadata: dict[str, Any] = Field(validation_alias="extra_data")
     is_active: bool
     full_path: str
     created_at: datetime
@@ -89,14 +90,7 @@ class LocationTree(BaseSchema):
     name: str
     name_tamil: Optional[str] = None
     type: str
-    children: list["LocationTree"] = []
-
-    class Config:
-        from_attributes = True
-
-
-# Update forward reference
-LocationTree.model_rebuild()
+    children: list["LocationTree"] = Field(default_factory=list)
 
 
 class LocationQRLookup(BaseSchema):
@@ -16,7 +16,7 @@ class NotificationBase(BaseSchema):
     """Base notification schema."""
 
     type: str = Field(default=NotificationType.INFO.value)
-    priority: str = Field(default=NotificationPriority.NORMAL.value)
+    priority: NotificationPriority = Field(default=NotificationPriority.NORMAL)
     title: str = Field(..., min_length=1, max_length=200)
     title_tamil: Optional[str] = Field(None, max_length=200)
     message: Optional[str] = None
@@ -57,7 +57,8 @@ class NotificationResponse(NotificationBase):
 class NotificationListItem(BaseSchema):
     """Simplified notification for list views."""
 
-    id: UUID
+    # The public id of a notification is Notification.external_id
+    id: UUID = Field(validation_alias="external_id")
     type: str
     priority: str
     title: str
@@ -79,7 +80,7 @@ class BulkNotificationCreate(BaseSchema):
 
     user_ids: list[UUID]
     type: str = Field(default=NotificationType.INFO.value)
-    priority: str = Field(default=NotificationPriority.NORMAL.value)
+    priority: NotificationPriority = Field(default=NotificationPriority.NORMAL)
     title: str = Field(..., min_length=1, max_length=200)
     title_tamil: Optional[str] = Field(None, max_length=200)
     message: Optional[str] = None
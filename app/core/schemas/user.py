@@ -19,7 +19,7 @@ class UserBase(BaseSchema):
     name_tamil: Optional[str] = Field(None, max_length=100)
     phone: Optional[str] = Field(None, max_length=15, pattern=r"^\+?[\d\s-]{10,15}$")
     email: Optional[EmailStr] = None
-    role: str = Field(default=UserRole.WORKER.value)
+    role: UserRole = Field(default=UserRole.WORKER)
     department: str = Field(default=Department.GENERAL.value)
     preferred_language: str = Field(default="ta", max_length=10)
 
@@ -48,7 +48,7 @@ class UserUpdate(BaseSchema):
     name_tamil: Optional[str] = Field(None, max_length=100)
     phone: Optional[str] = Field(None, max_length=15)
     email: Optional[EmailStr] = None
-    role: Optional[str] = None
+    role: Optional[UserRole] = None
     department: Optional[str] = None
     preferred_language: Optional[str] = Field(None, max_length=10)
     is_active: Optional[bool] = None
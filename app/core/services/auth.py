@@ -2,19 +2,26 @@
 Authentication service with PIN-based and password authentication.
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Annotated, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from sqlalchemy import select
+from jwt import InvalidTokenError as JWTError
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.cache import cache_add, cache_delete, cache_get
 from app.config import settings
+from app.core.models.organization import Organization
 from app.core.models.user import User, UserRole
 from app.core.schemas.auth import LoginRequest, LoginResponse, TokenData
 from app.database import get_db
@@ -22,6 +29,115 @@ from app.database import get_db
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
+# Decoded access tokens kept in memory; each client reuses its token until it
+# expires, so repeat requests skip the signature check and payload parsing
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
+# Auth lookups join the organization into the user SELECT, so resolving a
+# user is a single query. Only the organization's names are read from it, so
+# its other columns (notably the settings JSONB) are not fetched.
+_USER_AUTH_LOADS = (
+    joinedload(User.organization).load_only(Organization.name, Organization.name_tamil),
+)
+
+
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@lru_cache(maxsize=VERIFIED_TOKEN_CACHE_SIZE)
+def _verify_token(token: str) -> TokenData:
+    """Verify a token's signature and claims; failures are not cached."""
+    try:
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        # The signature has been checked, so the claims are trusted as issued
+        return TokenData.model_construct(
+            user_id=UUID(payload["user_id"]),
+            employee_code=payload["employee_code"],
+            role=payload["role"],
+            department=payload["department"],
+            org_id=UUID(payload["org_id"]),
+            exp=payload.get("exp"),
+        )
+    except (JWTError, KeyError, ValueError) as e:
+        raise _invalid_token() from e
+
+
+# Authenticated users kept in memory so steady-state requests skip the user
+# lookup. Entries are detached snapshots merged into each request's session.
+# Each snapshot records the user's stamp in Redis, read before the user was
+# loaded; committed changes to a user delete the stamp, so every worker drops
+# its snapshot on the next request. Without Redis nothing is served from
+# memory, and the TTL bounds staleness if a stamp could not be deleted.
+AUTH_USER_CACHE_TTL = 30
+AUTH_USER_CACHE_SIZE = 10_000
+AUTH_USER_STAMP_TTL = 86400
+
+_auth_users: dict[UUID, tuple[float, bytes, User]] = {}
+
+
+def _auth_user_stamp_key(user_id: UUID) -> str:
+    return f"auth:stamp:{user_id}"
+
+
+async def _get_user_stamp(user_id: UUID) -> Optional[bytes]:
+    """Get a user's stamp, creating one if needed; None if Redis is unavailable."""
+    key = _auth_user_stamp_key(user_id)
+    await cache_add(key, uuid4().bytes, AUTH_USER_STAMP_TTL)
+    return await cache_get(key)
+
+
+def _snapshot_user(user: User) -> User:
+    """Copy a loaded user and its organization names into detached instances."""
+    snapshot = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+    make_transient_to_detached(snapshot)
+
+    organization = user.organization
+    if organization is not None:
+        organization = Organization(
+            id=organization.id,
+            name=organization.name,
+            name_tamil=organization.name_tamil,
+        )
+        make_transient_to_detached(organization)
+    set_committed_value(snapshot, "organization", organization)
+    return snapshot
+
+
+async def _get_cached_user(user_id: UUID) -> Optional[User]:
+    entry = _auth_users.get(user_id)
+    if entry is None:
+        return None
+    expires_at, stamp, user = entry
+    if expires_at <= time.monotonic():
+        del _auth_users[user_id]
+        return None
+    if await cache_get(_auth_user_stamp_key(user_id)) != stamp:
+        _auth_users.pop(user_id, None)
+        return None
+    return user
+
+
+def _cache_user(user: User, stamp: bytes) -> None:
+    if len(_auth_users) >= AUTH_USER_CACHE_SIZE:
+        # Evict the oldest entry
+        del _auth_users[next(iter(_auth_users))]
+    _auth_users[user.id] = (
+        time.monotonic() + AUTH_USER_CACHE_TTL,
+        stamp,
+        _snapshot_user(user),
+    )
+
+
+async def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop a user from the auth cache of every worker after its account changes."""
+    _auth_users.pop(user_id, None)
+    await cache_delete(_auth_user_stamp_key(user_id))
+
 
 class AuthService:
     """Authentication service for PIN and password-based authentication."""
@@ -29,25 +145,28 @@ class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    # bcrypt is deliberately slow and releases the GIL, so hashing runs in a
+    # worker thread instead of blocking the event loop
+
     @staticmethod
-    def hash_pin(pin: str) -> str:
+    async def hash_pin(pin: str) -> bytes:
         """Hash a PIN using bcrypt."""
-        return bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        return await asyncio.to_thread(bcrypt.hashpw, pin.encode('utf-8'), bcrypt.gensalt())
 
     @staticmethod
-    def verify_pin(plain_pin: str, hashed_pin: str) -> bool:
+    async def verify_pin(plain_pin: str, hashed_pin: bytes) -> bool:
         """Verify a PIN against its hash."""
-        return bcrypt.checkpw(plain_pin.encode('utf-8'), hashed_pin.encode('utf-8'))
+        return await asyncio.to_thread(bcrypt.checkpw, plain_pin.encode('utf-8'), hashed_pin)
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> bytes:
         """Hash a password using bcrypt."""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        return await asyncio.to_thread(bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt())
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(plain_password: str, hashed_password: bytes) -> bool:
         """Verify a password against its hash."""
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        return await asyncio.to_thread(bcrypt.checkpw, plain_password.encode('utf-8'), hashed_password)
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -69,43 +188,34 @@ class AuthService:
 
     @staticmethod
     def decode_token(token: str) -> TokenData:
-        """Decode and validate a JWT token."""
-        try:
-            payload = jwt.decode(
-                token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
-            )
-            return TokenData(
-                user_id=UUID(payload["user_id"]),
-                employee_code=payload["employee_code"],
-                role=payload["role"],
-                department=payload["department"],
-                org_id=UUID(payload["org_id"]),
-                exp=payload.get("exp"),
-            )
-        except JWTError as e:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            ) from e
+        """
+        Decode and validate a JWT token.
+
+        Verified tokens are cached, so only the expiry is rechecked when a
+        client presents the same token again.
+        """
+        token_data = _verify_token(token)
+        if token_data.exp is not None and token_data.exp <= time.time():
+            raise _invalid_token()
+        return token_data
 
     async def get_user_by_employee_code(self, employee_code: str) -> Optional[User]:
         """Get user by employee code with organization loaded."""
         result = await self.db.execute(
             select(User)
-            .options(selectinload(User.organization))
+            .options(*_USER_AUTH_LOADS)
             .where(User.employee_code == employee_code)
         )
         return result.scalar_one_or_none()
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID with organization loaded."""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.organization))
-            .where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        """
+        Get user by ID with organization loaded.
+
+        Uses the session's identity map, so a user already loaded in this
+        request (e.g. by get_current_user) is returned without a query.
+        """
+        return await self.db.get(User, user_id, options=_USER_AUTH_LOADS)
 
     async def authenticate_with_pin(
         self, employee_code: str, pin: str
@@ -114,7 +224,7 @@ class AuthService:
         user = await self.get_user_by_employee_code(employee_code)
         if not user or not user.is_active:
             return None
-        if not user.pin_hash or not self.verify_pin(pin, user.pin_hash):
+        if not user.pin_hash or not await self.verify_pin(pin, user.pin_hash):
             return None
         return user
 
@@ -125,7 +235,7 @@ class AuthService:
         user = await self.get_user_by_employee_code(employee_code)
         if not user or not user.is_active:
             return None
-        if not user.password_hash or not self.verify_password(password, user.password_hash):
+        if not user.password_hash or not await self.verify_password(password, user.password_hash):
             return None
         return user
 
@@ -223,11 +333,12 @@ class AuthService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        if not user.pin_hash or not self.verify_pin(current_pin, user.pin_hash):
+        if not user.pin_hash or not await self.verify_pin(current_pin, user.pin_hash):
             raise HTTPException(status_code=400, detail="Current PIN is incorrect")
 
-        user.pin_hash = self.hash_pin(new_pin)
+        user.pin_hash = await self.hash_pin(new_pin)
         await self.db.commit()
+        await invalidate_cached_user(user_id)
         return True
 
 
@@ -239,6 +350,14 @@ async def get_current_user(
     """FastAPI dependency to get the current authenticated user."""
     token_data = AuthService.decode_token(credentials.credentials)
 
+    cached = await _get_cached_user(token_data.user_id)
+    if cached is not None:
+        # Attach the cached state to this session without querying
+        return await db.merge(cached, load=False)
+
+    # Read before the user, so a change committed in between deletes this
+    # stamp and the snapshot taken below is never served
+    stamp = await _get_user_stamp(token_data.user_id)
     auth_service = AuthService(db)
     user = await auth_service.get_user_by_id(token_data.user_id)
 
@@ -254,6 +373,8 @@ async def get_current_user(
             detail="User is inactive",
         )
 
+    if stamp is not None:
+        _cache_user(user, stamp)
     return user
 
 
@@ -266,11 +387,12 @@ def require_role(*roles: UserRole):
         async def admin_endpoint(user: User = Depends(require_role(UserRole.ADMIN))):
             ...
     """
+    allowed = frozenset(r.value for r in roles)
 
     async def role_checker(
         current_user: Annotated[User, Depends(get_current_user)]
     ) -> User:
-        if current_user.role not in [r.value for r in roles]:
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
@@ -2,16 +2,34 @@
 Location service for hierarchical location management.
 """
 
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.cache import cache_delete, cache_get, cache_set
 from app.core.models.location import Location
-from app.core.schemas.location import LocationCreate, LocationTree, LocationUpdate
+from app.core.schemas.location import (
+    LocationCreate,
+    LocationListItem,
+    LocationTree,
+    LocationUpdate,
+)
+from app.core.services.pagination import page_items, paginate
+from app.database import after_commit
+
+# Parent paths are read on every QR scan but change only when a location on
+# the path is edited, which invalidates them
+PARENT_PATH_CACHE_TTL = 3600
+_PARENT_PATH_ADAPTER = TypeAdapter(list[LocationListItem])
+
+
+def _parent_path_key(location_id: UUID) -> str:
+    return f"loc:path:{location_id}"
 
 
 class LocationService:
@@ -21,12 +39,8 @@ class LocationService:
         self.db = db
 
     async def get_by_id(self, location_id: UUID) -> Optional[Location]:
-        """Get location by ID with children loaded."""
-        result = await self.db.execute(
-            select(Location)
-            .options(selectinload(Location.children))
-            .where(Location.id == location_id)
-        )
+        """Get location by ID."""
+        result = await self.db.execute(select(Location).where(Location.id == location_id))
         return result.scalar_one_or_none()
 
     async def get_by_code(self, org_id: UUID, code: str) -> Optional[Location]:
@@ -42,9 +56,7 @@ class LocationService:
     async def get_by_qr_code(self, qr_code: str) -> Optional[Location]:
         """Get location by QR code."""
         result = await self.db.execute(
-            select(Location)
-            .options(selectinload(Location.children))
-            .where(Location.qr_code == qr_code)
+            select(Location).where(Location.qr_code == qr_code)
         )
         return result.scalar_one_or_none()
 
@@ -55,9 +67,9 @@ class LocationService:
         location_type: Optional[str] = None,
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         limit: int = 50,
-    ) -> tuple[list[Location], int]:
+    ) -> tuple[list[Location], Optional[str]]:
         """Get all locations with optional filtering."""
         query = select(Location).where(Location.org_id == org_id)
 
@@ -80,89 +92,88 @@ class LocationService:
                 | (Location.name_tamil.ilike(search_filter))
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        query = query.offset(offset).limit(limit).order_by(Location.code)
-        result = await self.db.execute(query)
-        locations = list(result.scalars().all())
-
-        return locations, total
+        result = await self.db.execute(paginate(query, Location, cursor, limit))
+        return page_items(list(result.scalars().all()), limit)
 
     async def get_tree(self, org_id: UUID, root_id: Optional[UUID] = None) -> list[LocationTree]:
-        """Get location tree structure."""
-        # Get root locations or start from specified root
+        """
+        Get location tree structure.
+
+        The roots and all active descendants are fetched with one recursive
+        query and assembled in memory. Nodes are built from the typed rows
+        without validation.
+        """
+        columns = (
+            Location.id,
+            Location.parent_id,
+            Location.code,
+            Location.name,
+            Location.name_tamil,
+            Location.type,
+        )
+
+        # Start from the specified root or all active root locations
+        anchor = select(*columns).where(Location.org_id == org_id)
         if root_id:
-            root_location = await self.get_by_id(root_id)
-            if not root_location:
-                return []
-            roots = [root_location]
+            anchor = anchor.where(Location.id == root_id)
         else:
-            result = await self.db.execute(
-                select(Location)
-                .options(selectinload(Location.children))
-                .where(
-                    Location.org_id == org_id,
-                    Location.parent_id.is_(None),
-                    Location.is_active == True,
-                )
-                .order_by(Location.code)
-            )
-            roots = list(result.scalars().all())
-
-        async def build_tree(location: Location) -> LocationTree:
-            """Recursively build tree structure."""
-            # Fetch children if not already loaded
-            if not location.children:
-                result = await self.db.execute(
-                    select(Location)
-                    .options(selectinload(Location.children))
-                    .where(
-                        Location.parent_id == location.id,
-                        Location.is_active == True,
-                    )
-                    .order_by(Location.code)
-                )
-                children = list(result.scalars().all())
+            anchor = anchor.where(Location.parent_id.is_(None), Location.is_active == True)
+
+        tree = anchor.cte("tree", recursive=True)
+        tree = tree.union_all(
+            select(*columns)
+            .join(tree, Location.parent_id == tree.c.id)
+            .where(Location.is_active == True)
+        )
+        result = await self.db.execute(select(tree).order_by(tree.c.code))
+
+        nodes: dict[UUID, LocationTree] = {}
+        roots: list[LocationTree] = []
+        rows = result.all()
+        for row in rows:
+            nodes[row.id] = LocationTree.from_db(row, children=[])
+        for row in rows:
+            parent = nodes.get(row.parent_id)
+            if parent is not None and row.id != root_id:
+                parent.children.append(nodes[row.id])
             else:
-                children = [c for c in location.children if c.is_active]
-
-            child_trees = []
-            for child in children:
-                child_tree = await build_tree(child)
-                child_trees.append(child_tree)
-
-            return LocationTree(
-                id=location.id,
-                code=location.code,
-                name=location.name,
-                name_tamil=location.name_tamil,
-                type=location.type,
-                children=child_trees,
-            )
+                roots.append(nodes[row.id])
 
-        return [await build_tree(root) for root in roots]
+        return roots
 
     async def get_parent_path(self, location_id: UUID) -> list[Location]:
         """Get the path from root to the specified location."""
-        path = []
-        current = await self.get_by_id(location_id)
-
-        while current:
-            path.insert(0, current)
-            if current.parent_id:
-                result = await self.db.execute(
-                    select(Location).where(Location.id == current.parent_id)
-                )
-                current = result.scalar_one_or_none()
-            else:
-                break
+        location = await self.db.get(Location, location_id)
+        if not location:
+            return []
+
+        ancestor_ids = [UUID(part) for part in location.parent_path.split("/") if part]
+        result = await self.db.execute(
+            select(Location).where(Location.id.in_(ancestor_ids))
+        )
+        by_id = {loc.id: loc for loc in result.scalars().all()}
+
+        return [by_id[ancestor_id] for ancestor_id in ancestor_ids if ancestor_id in by_id]
+
+    async def get_cached_parent_path(self, location: Location) -> list[LocationListItem]:
+        """Get the path from root to the location, cached in Redis."""
+        key = _parent_path_key(location.id)
+        cached = await cache_get(key)
+        if cached is not None:
+            return _PARENT_PATH_ADAPTER.validate_json(cached)
 
+        path = _PARENT_PATH_ADAPTER.validate_python(await self.get_parent_path(location.id))
+        await cache_set(key, _PARENT_PATH_ADAPTER.dump_json(path), PARENT_PATH_CACHE_TTL)
         return path
 
+    async def _invalidate_parent_paths(self, location: Location) -> None:
+        """Drop the cached paths of a location and all its descendants on commit."""
+        result = await self.db.execute(
+            select(Location.id).where(Location.parent_path.startswith(location.parent_path))
+        )
+        keys = [_parent_path_key(location_id) for location_id in result.scalars()]
+        after_commit(self.db, partial(cache_delete, *keys))
+
     async def create(self, data: LocationCreate) -> Location:
         """Create a new location."""
         # Check if code already exists in org
@@ -206,7 +217,7 @@ class LocationService:
             address=data.address,
             description=data.description,
             description_tamil=data.description_tamil,
-            metadata=data.metadata or {},
+            extra_data=data.metadata or {},
         )
 
         self.db.add(location)
@@ -230,11 +241,14 @@ class LocationService:
                 )
 
         update_data = data.model_dump(exclude_unset=True)
+        if "metadata" in update_data:
+            update_data["extra_data"] = update_data.pop("metadata") or {}
         for field, value in update_data.items():
             setattr(location, field, value)
 
         await self.db.flush()
         await self.db.refresh(location)
+        await self._invalidate_parent_paths(location)
         return location
 
     async def delete(self, location_id: UUID) -> bool:
@@ -259,6 +273,7 @@ class LocationService:
 
         location.is_active = False
         await self.db.flush()
+        await self._invalidate_parent_paths(location)
         return True
 
     async def get_guest_houses(self, org_id: UUID) -> list[Location]:
@@ -3,18 +3,28 @@ Notification service for push notifications and alerts.
 """
 
 from datetime import datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, Optional, cast
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import CursorResult, Row, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import cache_delete, cache_get, cache_set
 from app.core.models.notification import (
     Notification,
     NotificationPriority,
     NotificationType,
 )
 from app.core.schemas.notification import NotificationCount, NotificationCreate
+from app.core.services.pagination import page_items, paginate
+from app.database import after_commit
+
+NOTIFICATION_COUNT_CACHE_TTL = 300
+
+
+def _notification_count_key(user_id: UUID) -> str:
+    return f"notif:count:{user_id}"
 
 
 class NotificationService:
@@ -26,7 +36,7 @@ class NotificationService:
     async def get_by_id(self, notification_id: UUID) -> Optional[Notification]:
         """Get notification by ID."""
         result = await self.db.execute(
-            select(Notification).where(Notification.id == notification_id)
+            select(Notification).where(Notification.external_id == notification_id)
         )
         return result.scalar_one_or_none()
 
@@ -35,57 +45,65 @@ class NotificationService:
         user_id: UUID,
         unread_only: bool = False,
         notification_type: Optional[str] = None,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         limit: int = 20,
-    ) -> tuple[list[Notification], int]:
-        """Get notifications for a user."""
-        query = select(Notification).where(Notification.user_id == user_id)
+    ) -> tuple[list[Row], Optional[str]]:
+        """
+        Get notifications for a user.
+
+        Only the columns shown in list views are selected, so pages are
+        answered from the covering idx_notifications_user_created index
+        without reading the message bodies.
+        """
+        query = select(
+            Notification.id,
+            Notification.external_id,
+            Notification.type,
+            Notification.priority,
+            Notification.title,
+            Notification.title_tamil,
+            Notification.read_at.is_not(None).label("is_read"),
+            Notification.created_at,
+        ).where(Notification.user_id == user_id)
 
         if unread_only:
             query = query.where(Notification.read_at.is_(None))
         if notification_type:
             query = query.where(Notification.type == notification_type)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering (newest first)
-        query = query.offset(offset).limit(limit).order_by(Notification.created_at.desc())
-        result = await self.db.execute(query)
-        notifications = list(result.scalars().all())
-
-        return notifications, total
+        result = await self.db.execute(paginate(query, Notification, cursor, limit))
+        return page_items(list(result.all()), limit)
 
     async def get_notification_count(self, user_id: UUID) -> NotificationCount:
-        """Get notification counts for a user."""
-        # Total count
-        total_result = await self.db.execute(
-            select(func.count()).where(Notification.user_id == user_id)
-        )
-        total = total_result.scalar() or 0
+        """Get notification counts for a user, cached in Redis."""
+        key = _notification_count_key(user_id)
+        cached = await cache_get(key)
+        if cached is not None:
+            return NotificationCount.model_validate_json(cached)
 
-        # Unread count
-        unread_result = await self.db.execute(
-            select(func.count()).where(
-                Notification.user_id == user_id,
-                Notification.read_at.is_(None),
-            )
+        unread = Notification.read_at.is_(None)
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.count().filter(unread),
+                func.count().filter(
+                    unread,
+                    Notification.priority == NotificationPriority.CRITICAL.value,
+                ),
+            ).where(Notification.user_id == user_id)
         )
-        unread = unread_result.scalar() or 0
-
-        # Critical unread count
-        critical_result = await self.db.execute(
-            select(func.count()).where(
-                Notification.user_id == user_id,
-                Notification.read_at.is_(None),
-                Notification.priority == NotificationPriority.CRITICAL.value,
-            )
+        total, unread_count, critical = result.one()
+
+        counts = NotificationCount(total=total, unread=unread_count, critical=critical)
+        await cache_set(
+            key, counts.model_dump_json().encode(), NOTIFICATION_COUNT_CACHE_TTL
         )
-        critical = critical_result.scalar() or 0
+        return counts
 
-        return NotificationCount(total=total, unread=unread, critical=critical)
+    def _invalidate_counts(self, *user_ids: UUID) -> None:
+        """Drop cached counts on commit so the next read recounts from the database."""
+        keys = [_notification_count_key(user_id) for user_id in set(user_ids)]
+        after_commit(self.db, partial(cache_delete, *keys))
 
     async def create(self, data: NotificationCreate) -> Notification:
         """Create a new notification."""
@@ -106,6 +124,7 @@ class NotificationService:
         self.db.add(notification)
         await self.db.flush()
         await self.db.refresh(notification)
+        self._invalidate_counts(data.user_id)
         return notification
 
     async def create_bulk(
@@ -120,68 +139,94 @@ class NotificationService:
         entity_type: Optional[str] = None,
         entity_id: Optional[UUID] = None,
     ) -> int:
-        """Create notifications for multiple users."""
-        notifications = [
-            Notification(
-                user_id=user_id,
-                type=notification_type,
-                priority=priority,
-                title=title,
-                title_tamil=title_tamil,
-                message=message,
-                message_tamil=message_tamil,
-                entity_type=entity_type,
-                entity_id=entity_id,
-            )
-            for user_id in user_ids
-        ]
+        """
+        Create notifications for multiple users.
 
-        self.db.add_all(notifications)
-        await self.db.flush()
-        return len(notifications)
+        Rows are sent as one bulk INSERT rather than flushed as ORM objects.
+        """
+        if not user_ids:
+            return 0
+
+        await self.db.execute(
+            insert(Notification),
+            [
+                {
+                    "user_id": user_id,
+                    "type": notification_type,
+                    "priority": priority,
+                    "title": title,
+                    "title_tamil": title_tamil,
+                    "message": message,
+                    "message_tamil": message_tamil,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                }
+                for user_id in user_ids
+            ],
+        )
+        self._invalidate_counts(*user_ids)
+        return len(user_ids)
 
     async def mark_as_read(self, notification_id: UUID, user_id: UUID) -> bool:
         """Mark a notification as read."""
-        result = await self.db.execute(
-            update(Notification)
-            .where(
-                Notification.id == notification_id,
-                Notification.user_id == user_id,
-            )
-            .values(read_at=datetime.now(timezone.utc))
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                update(Notification)
+                .where(
+                    Notification.external_id == notification_id,
+                    Notification.user_id == user_id,
+                )
+                .values(read_at=datetime.now(timezone.utc))
+            ),
         )
+        if result.rowcount:
+            self._invalidate_counts(user_id)
         return result.rowcount > 0
 
     async def mark_all_as_read(self, user_id: UUID) -> int:
         """Mark all notifications as read for a user."""
-        result = await self.db.execute(
-            update(Notification)
-            .where(
-                Notification.user_id == user_id,
-                Notification.read_at.is_(None),
-            )
-            .values(read_at=datetime.now(timezone.utc))
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                update(Notification)
+                .where(
+                    Notification.user_id == user_id,
+                    Notification.read_at.is_(None),
+                )
+                .values(read_at=datetime.now(timezone.utc))
+            ),
         )
+        if result.rowcount:
+            self._invalidate_counts(user_id)
         return result.rowcount
 
     async def mark_as_delivered(self, notification_id: UUID) -> bool:
         """Mark a notification as delivered."""
-        result = await self.db.execute(
-            update(Notification)
-            .where(Notification.id == notification_id)
-            .values(delivered_at=datetime.now(timezone.utc))
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                update(Notification)
+                .where(Notification.external_id == notification_id)
+                .values(delivered_at=datetime.now(timezone.utc))
+            ),
         )
         return result.rowcount > 0
 
     async def delete(self, notification_id: UUID, user_id: UUID) -> bool:
-        """Delete a notification."""
-        notification = await self.get_by_id(notification_id)
-        if not notification or notification.user_id != user_id:
-            return False
-
-        await self.db.delete(notification)
-        await self.db.flush()
-        return True
+        """Delete a notification owned by the user."""
+        result = cast(
+            CursorResult[Any],
+            await self.db.execute(
+                delete(Notification).where(
+                    Notification.external_id == notification_id,
+                    Notification.user_id == user_id,
+                )
+            ),
+        )
+        if result.rowcount:
+            self._invalidate_counts(user_id)
+        return result.rowcount > 0
 
     # Convenience methods for creating specific notification types
 
@@ -198,7 +243,7 @@ class NotificationService:
             NotificationCreate(
                 user_id=user_id,
                 type=NotificationType.ASSIGNMENT.value,
-                priority=NotificationPriority.HIGH.value,
+                priority=NotificationPriority.HIGH,
                 title=f"New task assigned: {task_title}",
                 title_tamil=f"புதிய பணி ஒதுக்கப்பட்டது: {task_title_tamil or task_title}",
                 entity_type=task_type,
@@ -219,7 +264,7 @@ class NotificationService:
             NotificationCreate(
                 user_id=user_id,
                 type=NotificationType.REMINDER.value,
-                priority=NotificationPriority.NORMAL.value,
+                priority=NotificationPriority.NORMAL,
                 title=f"Reminder: {task_title}",
                 title_tamil=f"நினைவூட்டல்: {task_title_tamil or task_title}",
                 entity_type=task_type,
@@ -240,7 +285,7 @@ class NotificationService:
             NotificationCreate(
                 user_id=user_id,
                 type=NotificationType.ALERT.value,
-                priority=NotificationPriority.CRITICAL.value,
+                priority=NotificationPriority.CRITICAL,
                 title=f"OVERDUE: {task_title}",
                 title_tamil=f"தாமதம்: {task_title_tamil or task_title}",
                 entity_type=task_type,
@@ -260,7 +305,7 @@ class NotificationService:
             NotificationCreate(
                 user_id=user_id,
                 type=NotificationType.LOW_STOCK.value,
-                priority=NotificationPriority.HIGH.value,
+                priority=NotificationPriority.HIGH,
                 title=f"Low stock: {item_name} ({current_qty} remaining)",
                 title_tamil=f"குறைந்த இருப்பு: {item_name_tamil or item_name} ({current_qty} மீதமுள்ளது)",
             )
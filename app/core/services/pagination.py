@@ -0,0 +1,42 @@
+"""
+Keyset (cursor) pagination helpers for list queries.
+"""
+
+from typing import Any, Optional, TypeVar
+
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+
+from app.core.schemas.common import Cursor
+
+M = TypeVar("M")
+
+
+def paginate(query: Select, model: Any, cursor: Optional[str], limit: int) -> Select:
+    """
+    Order a query newest first by (created_at, id) and start it after the cursor.
+
+    One extra row is fetched so page_items() can tell whether another page
+    follows without a separate COUNT.
+    """
+    if cursor:
+        try:
+            after = Cursor.decode(cursor)
+            after_id = model.id.type.python_type(after.id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            tuple_(model.created_at, model.id) < (after.created_at, after_id)
+        )
+
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def page_items(rows: list[M], limit: int) -> tuple[list[M], Optional[str]]:
+    """Trim the look-ahead row and return the page with its next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    # ORM instances and Rows both expose created_at and id
+    last: Any = rows[-1]
+    return rows, Cursor(last.created_at, str(last.id)).encode()
@@ -2,17 +2,19 @@
 User service for CRUD operations.
 """
 
+from functools import partial
 from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.models.user import User
 from app.core.schemas.user import UserCreate, UserUpdate
-from app.core.services.auth import AuthService
+from app.core.services.auth import AuthService, invalidate_cached_user
+from app.core.services.pagination import page_items, paginate
+from app.database import after_commit
 
 
 class UserService:
@@ -22,22 +24,12 @@ class UserService:
         self.db = db
 
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.organization))
-            .where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+        """Get user by ID, reusing the instance if this request already loaded it."""
+        return await AuthService(self.db).get_user_by_id(user_id)
 
     async def get_by_employee_code(self, employee_code: str) -> Optional[User]:
         """Get user by employee code."""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.organization))
-            .where(User.employee_code == employee_code)
-        )
-        return result.scalar_one_or_none()
+        return await AuthService(self.db).get_user_by_employee_code(employee_code)
 
     async def get_all(
         self,
@@ -46,11 +38,11 @@ class UserService:
         role: Optional[str] = None,
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         limit: int = 20,
-    ) -> tuple[list[User], int]:
+    ) -> tuple[list[User], Optional[str]]:
         """Get all users with optional filtering."""
-        query = select(User).options(selectinload(User.organization))
+        query = select(User)
 
         # Apply filters
         if org_id:
@@ -69,17 +61,8 @@ class UserService:
                 | (User.name_tamil.ilike(search_filter))
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.offset(offset).limit(limit).order_by(User.name)
-        result = await self.db.execute(query)
-        users = list(result.scalars().all())
-
-        return users, total
+        result = await self.db.execute(paginate(query, User, cursor, limit))
+        return page_items(list(result.scalars().all()), limit)
 
     async def create(self, data: UserCreate) -> User:
         """Create a new user."""
@@ -92,12 +75,12 @@ class UserService:
             )
 
         # Hash PIN
-        pin_hash = AuthService.hash_pin(data.pin)
+        pin_hash = await AuthService.hash_pin(data.pin)
 
         # Hash password if provided
         password_hash = None
         if data.password:
-            password_hash = AuthService.hash_password(data.password)
+            password_hash = await AuthService.hash_password(data.password)
 
         user = User(
             org_id=data.org_id,
@@ -130,6 +113,7 @@ class UserService:
 
         await self.db.flush()
         await self.db.refresh(user)
+        after_commit(self.db, partial(invalidate_cached_user, user_id))
         return user
 
     async def delete(self, user_id: UUID) -> bool:
@@ -140,6 +124,7 @@ class UserService:
 
         user.is_active = False
         await self.db.flush()
+        after_commit(self.db, partial(invalidate_cached_user, user_id))
         return True
 
     async def reset_pin(self, user_id: UUID, new_pin: str) -> bool:
@@ -148,8 +133,9 @@ class UserService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
-        user.pin_hash = AuthService.hash_pin(new_pin)
+        user.pin_hash = await AuthService.hash_pin(new_pin)
         await self.db.flush()
+        after_commit(self.db, partial(invalidate_cached_user, user_id))
         return True
 
     async def get_users_by_department(
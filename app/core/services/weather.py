@@ -2,37 +2,51 @@
 Weather service for fetching IMD weather data.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
 import httpx
 from dateutil import parser
 
+from app.core.schemas.weather import WeatherResponse
+
 logger = logging.getLogger(__name__)
 
 
+class WeatherServiceError(Exception):
+    """Raised when weather data cannot be fetched or parsed from IMD."""
+
+
 class WeatherCache:
-    """Simple in-memory cache for weather data."""
+    """
+    Simple in-memory cache for weather data.
+
+    Expiry uses the monotonic clock, so it is cheap to check and unaffected
+    by system clock changes.
+    """
 
     def __init__(self, ttl_minutes: int = 15):
-        self._cache: Dict[str, dict] = {}
+        self._cache: Dict[str, tuple[WeatherResponse, float]] = {}
         self._ttl = timedelta(minutes=ttl_minutes)
 
-    def get(self, key: str) -> Optional[dict]:
+    def get(self, key: str) -> Optional[WeatherResponse]:
         """Get cached data if not expired."""
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if datetime.now() - timestamp < self._ttl:
-                return data
-            else:
-                # Expired, remove from cache
-                del self._cache[key]
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        data, expires_at = entry
+        if time.monotonic() < expires_at:
+            return data
+        # Expired, remove from cache
+        del self._cache[key]
         return None
 
-    def set(self, key: str, data: dict) -> None:
-        """Set cache data with current timestamp."""
-        self._cache[key] = (data, datetime.now())
+    def set(self, key: str, data: WeatherResponse, ttl: Optional[timedelta] = None) -> None:
+        """Set cache data, expiring after ttl (default: the cache's TTL)."""
+        self._cache[key] = (data, time.monotonic() + (ttl or self._ttl).total_seconds())
 
     def clear(self) -> None:
         """Clear all cached data."""
@@ -49,6 +63,10 @@ class WeatherService:
     # Note: This needs to be obtained from IMD's API documentation PDF
     # For now using a placeholder - update with actual ID from IMD docs
     TIRUVANNAMALAI_STATION_ID = "43279"  # Placeholder - needs verification
+
+    # While IMD is unreachable, serve the fallback for this long before
+    # trying again, instead of waiting on a timeout for every request
+    FALLBACK_TTL = timedelta(minutes=1)
     
     # Tamil translations for common weather conditions
     WEATHER_TRANSLATIONS = {
@@ -74,6 +92,8 @@ class WeatherService:
 
     def __init__(self, cache_ttl_minutes: int = 15):
         self._cache = WeatherCache(ttl_minutes=cache_ttl_minutes)
+        # Fetches in progress by cache key, shared by concurrent cache misses
+        self._inflight: Dict[str, asyncio.Task] = {}
         self._http_client = httpx.AsyncClient(timeout=10.0)
 
     async def close(self):
@@ -88,11 +108,13 @@ class WeatherService:
                 return tamil
         return description  # Return original if no translation found
 
-    async def get_tiruvannamalai_weather(self) -> dict:
+    async def get_tiruvannamalai_weather(self) -> WeatherResponse:
         """
         Get current weather for Tiruvannamalai.
         
-        Returns weather data with caching support.
+        Returns weather data with caching support. The response is built
+        once per fetch; cache hits return a flagged copy of it.
+        Concurrent cache misses wait on a single IMD request.
         Falls back to mock data if IMD API is unavailable.
         """
         cache_key = "tiruvannamalai"
@@ -100,27 +122,37 @@ class WeatherService:
         # Check cache first
         cached_data = self._cache.get(cache_key)
         if cached_data:
-            logger.info("Returning cached weather data for Tiruvannamalai")
-            cached_data["cached"] = True
-            return cached_data
+            logger.debug("Returning cached weather data for Tiruvannamalai")
+            return cached_data.model_copy(update={"cached": True})
+
+        fetch = self._inflight.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.create_task(self._refresh_tiruvannamalai_weather(cache_key))
+            self._inflight[cache_key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # Shielded so a cancelled request does not abort the fetch for the others
+        return await asyncio.shield(fetch)
 
+    async def _refresh_tiruvannamalai_weather(self, cache_key: str) -> WeatherResponse:
+        """Fetch Tiruvannamalai weather from IMD and cache it."""
         try:
             # Attempt to fetch from IMD API
             weather_data = await self._fetch_from_imd(self.TIRUVANNAMALAI_STATION_ID)
             
             # Cache the result
             self._cache.set(cache_key, weather_data)
-            weather_data["cached"] = False
             
             logger.info("Successfully fetched weather data from IMD for Tiruvannamalai")
             return weather_data
             
-        except Exception as e:
+        except WeatherServiceError as e:
             logger.warning(f"Failed to fetch weather from IMD: {e}")
             # Return fallback data
-            return self._get_fallback_data("Tiruvannamalai")
+            weather_data = WeatherResponse(**self._get_fallback_data("Tiruvannamalai"))
+            self._cache.set(cache_key, weather_data, ttl=self.FALLBACK_TTL)
+            return weather_data
 
-    async def _fetch_from_imd(self, station_id: str) -> dict:
+    async def _fetch_from_imd(self, station_id: str) -> WeatherResponse:
         """
         Fetch weather data from IMD API.
         
@@ -131,22 +163,26 @@ class WeatherService:
             Parsed weather data
             
         Raises:
-            Exception: If API request fails
+            WeatherServiceError: If the request fails or the response
+                cannot be parsed
         """
         url = f"{self.IMD_BASE_URL}/current_wx_api.php"
         params = {"id": station_id}
         
         logger.info(f"Fetching weather from IMD for station {station_id}")
         
-        response = await self._http_client.get(url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Parse IMD response
-        # Note: The exact field names depend on IMD's actual response format
-        # This is based on common weather API patterns
-        return self._parse_imd_response(data)
+        try:
+            response = await self._http_client.get(url, params=params)
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            # Parse IMD response
+            # Note: The exact field names depend on IMD's actual response format
+            # This is based on common weather API patterns
+            return WeatherResponse(**self._parse_imd_response(data))
+        except (httpx.HTTPError, ValueError, TypeError, AttributeError) as e:
+            raise WeatherServiceError(f"IMD station {station_id}: {e}") from e
 
     def _parse_imd_response(self, data: dict) -> dict:
         """
@@ -211,7 +247,7 @@ class WeatherService:
 
     async def get_weather_by_coordinates(
         self, latitude: float, longitude: float
-    ) -> dict:
+    ) -> WeatherResponse:
         """
         Get weather data by latitude and longitude.
         
@@ -3,10 +3,12 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 with async support.
 """
 
-from typing import AsyncGenerator
+import inspect
+from typing import Any, AsyncGenerator, Callable, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
 
 from app.config import settings
 
@@ -16,7 +18,16 @@ engine = create_async_engine(
     echo=settings.debug,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    pool_pre_ping=settings.database_pool_pre_ping,
+    connect_args={
+        # Cache prepared statements per connection so repeated queries skip
+        # parse/plan; JIT compilation only slows down short OLTP queries.
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+        "statement_cache_size": settings.database_statement_cache_size,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create async session factory
@@ -35,6 +46,30 @@ class Base(DeclarativeBase):
     pass
 
 
+def get_pool_status() -> dict:
+    """Report connection pool usage for this process."""
+    # The async engine always uses AsyncAdaptedQueuePool, a QueuePool subclass
+    pool = cast(QueuePool, engine.pool)
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.database_max_overflow,
+    }
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Any]) -> None:
+    """
+    Run a callback once get_db commits the session.
+
+    For cache invalidation: dropping a key before the commit would let a
+    concurrent request re-cache the old committed rows. Callbacks may be
+    coroutine functions and are discarded if the request rolls back.
+    """
+    session.info.setdefault("after_commit", []).append(callback)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides a database session.
@@ -44,6 +79,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            for callback in session.info.pop("after_commit", ()):
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
         except Exception:
             await session.rollback()
             raise
@@ -1,18 +1,11 @@
 """
 Farm API routers.
+
+Router modules are imported on first access, so importing one router does
+not pull in the models, schemas and services of all the others.
 """
 
-from app.farm.api import (
-    checklists,
-    crops,
-    equipment,
-    fields,
-    harvests,
-    scheduled_tasks,
-    schedules,
-    tasks,
-    workers,
-)
+import importlib
 
 __all__ = [
     "crops",
@@ -25,3 +18,9 @@ __all__ = [
     "equipment",
     "workers",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
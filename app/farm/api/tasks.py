@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.models.user import User
 from app.core.services.auth import get_current_user
 from app.database import get_db
+from app.farm.models.task import TaskStatus
 from app.farm.schemas.task import (
     FarmTaskCreate,
     FarmTaskListResponse,
@@ -30,7 +31,7 @@ async def get_my_tasks(
     db: Annotated[AsyncSession, Depends(get_db)],
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     include_completed: bool = Query(False, description="Include completed/cancelled tasks"),
 ):
     """
@@ -39,7 +39,7 @@ class CropVariety(BaseModel):
 
     __tablename__ = "crop_varieties"
 
-    code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    code: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
@@ -93,6 +93,10 @@ class CultivationCycle(BaseModel):
 
     __tablename__ = "cultivation_cycles"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     field_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("fields.id"), nullable=False
     )
@@ -111,7 +115,7 @@ class CultivationCycle(BaseModel):
     )  # 'active', 'completed', 'failed'
     end_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     end_reason: Mapped[Optional[str]] = mapped_column(
-        String(200), nullable=True
+        Text, nullable=True
     )  # Why cycle ended
 
     # Yield tracking
@@ -6,7 +6,7 @@ import uuid
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, String
+from sqlalchemy import Boolean, Date, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -45,7 +45,7 @@ class Equipment(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    code: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
@@ -7,11 +7,21 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, column_property, mapped_column
 
-from app.core.models.base import BaseModel
+from app.core.models.base import AppendOnlyModel
 
 
 class QualityRating(str):
@@ -23,7 +33,7 @@ class QualityRating(str):
     POOR = "poor"
 
 
-class Harvest(BaseModel):
+class Harvest(AppendOnlyModel):
     """
     Harvest record for tracking yield and quality.
 
@@ -32,6 +42,10 @@ class Harvest(BaseModel):
 
     __tablename__ = "harvests"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     field_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("fields.id"), nullable=False
     )
@@ -49,7 +63,10 @@ class Harvest(BaseModel):
     )  # Which harvest in the cycle
 
     # Yield
-    yield_kg: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    yield_grams: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    yield_kg: Mapped[Decimal] = column_property(
+        func.round(yield_grams / 1000, 3)
+    )  # Read-only, computed from yield_grams when loaded rather than stored
     area_harvested_acres: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(6, 2), nullable=True
     )
@@ -5,7 +5,7 @@ Daily schedule and task update models for farm operations.
 import uuid
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import Boolean, Date, DateTime, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import UUID
@@ -13,6 +13,11 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.models.base import BaseModel
 
+if TYPE_CHECKING:
+    from app.core.models.user import User
+    from app.farm.models.crop import CropVariety
+    from app.farm.models.field import Field
+
 
 class IssueType(str, Enum):
     """Types of issues that can be reported for tasks."""
@@ -39,7 +44,7 @@ class DaySchedule(BaseModel):
     )
 
     # Schedule date
-    schedule_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    schedule_date: Mapped[date] = mapped_column(Date, nullable=False)
 
     # Notes
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -86,7 +91,7 @@ class ScheduledTask(BaseModel):
 
     # Scheduling
     scheduled_time: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, index=True
+        DateTime(timezone=True), nullable=False
     )
 
     # Category/Type
@@ -96,19 +101,11 @@ class ScheduledTask(BaseModel):
     field_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("fields.id"), nullable=True
     )
-    field_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    field_name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-
-    # Crop info
-    crop_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    crop_name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Worker assignment
     assigned_worker_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    assigned_worker_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    assigned_worker_name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Priority
     priority: Mapped[str] = mapped_column(String(20), default="normal", nullable=False)
@@ -141,6 +138,42 @@ class ScheduledTask(BaseModel):
     updates: Mapped[list["TaskUpdate"]] = relationship(
         "TaskUpdate", back_populates="task", lazy="selectin"
     )
+    field: Mapped[Optional["Field"]] = relationship("Field", lazy="selectin")
+    crop: Mapped[Optional["CropVariety"]] = relationship(
+        "CropVariety",
+        secondary="fields",
+        primaryjoin="ScheduledTask.field_id == Field.id",
+        secondaryjoin="Field.current_crop_id == CropVariety.id",
+        uselist=False,
+        viewonly=True,
+        lazy="selectin",
+    )  # Crop currently growing in the assigned field
+    assigned_worker: Mapped[Optional["User"]] = relationship("User", lazy="selectin")
+
+    # Display names, read through the relationships above
+    @property
+    def field_name(self) -> Optional[str]:
+        return self.field.name if self.field else None
+
+    @property
+    def field_name_tamil(self) -> Optional[str]:
+        return self.field.name_tamil if self.field else None
+
+    @property
+    def crop_name(self) -> Optional[str]:
+        return self.crop.name if self.crop else None
+
+    @property
+    def crop_name_tamil(self) -> Optional[str]:
+        return self.crop.name_tamil if self.crop else None
+
+    @property
+    def assigned_worker_name(self) -> Optional[str]:
+        return self.assigned_worker.name if self.assigned_worker else None
+
+    @property
+    def assigned_worker_name_tamil(self) -> Optional[str]:
+        return self.assigned_worker.name_tamil if self.assigned_worker else None
 
     def __repr__(self) -> str:
         return f"<ScheduledTask(id={self.id}, category={self.category}, status={self.status})>"
@@ -164,7 +197,6 @@ class TaskUpdate(BaseModel):
     worker_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
-    worker_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Update details
     status: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -188,6 +220,12 @@ class TaskUpdate(BaseModel):
     task: Mapped["ScheduledTask"] = relationship(
         "ScheduledTask", back_populates="updates"
     )
+    worker: Mapped["User"] = relationship("User", lazy="selectin")
+
+    @property
+    def worker_name(self) -> str:
+        """Worker's display name, preferring Tamil."""
+        return self.worker.name_tamil or self.worker.name
 
     def __repr__(self) -> str:
         return f"<TaskUpdate(task_id={self.task_id}, status={self.status})>"
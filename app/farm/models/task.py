@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Text, Time
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.models.base import BaseModel
@@ -65,8 +65,8 @@ class FarmTask(BaseModel):
 
     # Task details
     task_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    title: Mapped[str] = mapped_column(String(200), nullable=False)
-    title_tamil: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    title_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     description_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -77,7 +77,9 @@ class FarmTask(BaseModel):
 
     # Priority
     priority: Mapped[str] = mapped_column(
-        String(20), default=TaskPriority.NORMAL.value, nullable=False
+        ENUM(*(priority.value for priority in TaskPriority), name="farm_task_priority"),
+        default=TaskPriority.NORMAL.value,
+        nullable=False,
     )
 
     # Assignment
@@ -98,7 +100,9 @@ class FarmTask(BaseModel):
 
     # Execution tracking
     status: Mapped[str] = mapped_column(
-        String(50), default=TaskStatus.PENDING.value, nullable=False
+        ENUM(*(status.value for status in TaskStatus), name="farm_task_status"),
+        default=TaskStatus.PENDING.value,
+        nullable=False,
     )
     started_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -132,6 +136,10 @@ class WateringSchedule(BaseModel):
 
     __tablename__ = "watering_schedules"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     field_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("fields.id"), nullable=False
     )
@@ -9,6 +9,7 @@ from uuid import UUID
 from pydantic import Field
 
 from app.core.schemas.common import BaseSchema
+from app.farm.models.task import TaskPriority
 
 
 # ============== Task Response Schemas ==============
@@ -88,7 +89,7 @@ class FarmTaskCreate(BaseSchema):
     scheduled_date: date
     scheduled_time: Optional[time] = None
     due_date: Optional[date] = None
-    priority: str = "normal"
+    priority: TaskPriority = TaskPriority.NORMAL
     assigned_to: Optional[UUID] = None
     checklist_template_id: Optional[UUID] = None
 
@@ -105,7 +106,7 @@ class FarmTaskUpdate(BaseSchema):
     scheduled_date: Optional[date] = None
     scheduled_time: Optional[time] = None
     due_date: Optional[date] = None
-    priority: Optional[str] = None
+    priority: Optional[TaskPriority] = None
     assigned_to: Optional[UUID] = None
     checklist_template_id: Optional[UUID] = None
 
@@ -194,29 +194,6 @@ class ScheduleService:
         data: ScheduledTaskCreate,
     ) -> ScheduledTask:
         """Internal method to create a task."""
-        # Get field info if field_id provided
-        field_name = None
-        field_name_tamil = None
-        crop_name = None
-        crop_name_tamil = None
-
-        if data.field_id:
-            field = await self._get_field(data.field_id)
-            if field:
-                field_name = field.name
-                field_name_tamil = field.name_tamil
-                # TODO: Get crop info from field's current cultivation
-
-        # Get worker info if assigned
-        worker_name = None
-        worker_name_tamil = None
-
-        if data.assigned_worker_id:
-            worker = await self._get_user(data.assigned_worker_id)
-            if worker:
-                worker_name = worker.name
-                worker_name_tamil = worker.name_tamil
-
         return ScheduledTask(
             org_id=org_id,
             schedule_id=schedule_id,
@@ -225,13 +202,7 @@ class ScheduleService:
             scheduled_time=data.scheduled_time,
             category=data.category,
             field_id=data.field_id,
-            field_name=field_name,
-            field_name_tamil=field_name_tamil,
-            crop_name=crop_name,
-            crop_name_tamil=crop_name_tamil,
             assigned_worker_id=data.assigned_worker_id,
-            assigned_worker_name=worker_name,
-            assigned_worker_name_tamil=worker_name_tamil,
             priority=data.priority,
             notes=data.notes,
             notes_tamil=data.notes_tamil,
@@ -247,21 +218,6 @@ class ScheduleService:
             raise HTTPException(status_code=404, detail="Task not found")
 
         update_data = data.model_dump(exclude_unset=True)
-
-        # Handle field update
-        if "field_id" in update_data and update_data["field_id"]:
-            field = await self._get_field(update_data["field_id"])
-            if field:
-                update_data["field_name"] = field.name
-                update_data["field_name_tamil"] = field.name_tamil
-
-        # Handle worker update
-        if "assigned_worker_id" in update_data and update_data["assigned_worker_id"]:
-            worker = await self._get_user(update_data["assigned_worker_id"])
-            if worker:
-                update_data["assigned_worker_name"] = worker.name
-                update_data["assigned_worker_name_tamil"] = worker.name_tamil
-
         for field, value in update_data.items():
             setattr(task, field, value)
 
@@ -293,7 +249,6 @@ class ScheduleService:
         update = TaskUpdate(
             task_id=task_id,
             worker_id=user.id,
-            worker_name=user.name_tamil or user.name,
             status=data.status,
             timestamp=datetime.utcnow(),
             notes=data.notes,
@@ -330,7 +285,6 @@ class ScheduleService:
         update = TaskUpdate(
             task_id=task_id,
             worker_id=user.id,
-            worker_name=user.name_tamil or user.name,
             status="completed",
             timestamp=datetime.utcnow(),
             notes=data.notes,
@@ -366,7 +320,6 @@ class ScheduleService:
         update = TaskUpdate(
             task_id=task_id,
             worker_id=user.id,
-            worker_name=user.name_tamil or user.name,
             status="has_issues",
             timestamp=datetime.utcnow(),
             issue_type=data.issue_type,
@@ -407,19 +360,3 @@ class ScheduleService:
             .order_by(Field.name)
         )
         return list(result.scalars().all())
-
-    # ============== Helper Methods ==============
-
-    async def _get_field(self, field_id: UUID) -> Optional[Field]:
-        """Get field by ID."""
-        result = await self.db.execute(
-            select(Field).where(Field.id == field_id)
-        )
-        return result.scalar_one_or_none()
-
-    async def _get_user(self, user_id: UUID) -> Optional[User]:
-        """Get user by ID."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
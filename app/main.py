@@ -5,20 +5,31 @@ Main FastAPI application entry point.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.cache import close_cache
 from app.config import settings
-from app.database import close_db, init_db
-
+from app.core.models.user import UserRole
+from app.core.services.auth import require_role
+from app.database import close_db, get_pool_status, init_db
+from app.migrations import (
+    get_migration_status,
+    migration_state,
+    run_migrations,
+    start_migrations,
+)
+
+# isort: split
 # Import routers
 from app.core.api import auth, locations, notifications, users, voice
 from app.farm.api import checklists as farm_checklists
-from app.farm.api import crops, equipment, fields, harvests, schedules, workers
-from app.farm.api import scheduled_tasks
+from app.farm.api import crops, equipment, fields, harvests, scheduled_tasks, schedules
 from app.farm.api import tasks as farm_tasks
-from app.maintenance.api import assets, inventory, jobs, procurement, tools, vendors
+from app.farm.api import workers
+from app.maintenance.api import assets, inventory, jobs
 from app.maintenance.api import pm as preventive_maintenance
+from app.maintenance.api import procurement, tools, vendors
 from app.reports.api import reports
 
 
@@ -26,11 +37,23 @@ from app.reports.api import reports
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup/shutdown events."""
     # Startup
+    if settings.migration_mode == "sync":
+        await run_migrations()
+    elif settings.migration_mode == "async":
+        app.state.migration_task = start_migrations()
     if settings.debug:
         await init_db()
     yield
-    # Shutdown
-    await close_db()
+    # Shutdown; each step runs even if an earlier one fails
+    try:
+        weather_service = getattr(app.state, "weather_service", None)
+        if weather_service is not None:
+            await weather_service.close()
+    finally:
+        try:
+            await close_cache()
+        finally:
+            await close_db()
 
 
 def create_app() -> FastAPI:
@@ -158,7 +181,22 @@ def create_app() -> FastAPI:
     @app.get("/health", tags=["Health"])
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "app": settings.app_name}
+        migrating = migration_state["status"] in ("pending", "migrating")
+        status = "migrating" if migrating else "healthy"
+        return {"status": status, "app": settings.app_name}
+
+    # Detailed health reports expose internals, so they are for admins only
+    admin_only = [Depends(require_role(UserRole.ADMIN))]
+
+    @app.get("/health/migrations", tags=["Health"], dependencies=admin_only)
+    async def migration_health_check():
+        """Report the database revision against the latest migration."""
+        return await get_migration_status()
+
+    @app.get("/health/database", tags=["Health"], dependencies=admin_only)
+    async def database_health_check():
+        """Report database connection pool usage."""
+        return get_pool_status()
 
     return app
 
@@ -1,8 +1,11 @@
 """
 Maintenance API routers.
+
+Router modules are imported on first access, so importing one router does
+not pull in the models, schemas and services of all the others.
 """
 
-from app.maintenance.api import assets, inventory, jobs, pm, procurement, tools, vendors
+import importlib
 
 __all__ = [
     "assets",
@@ -13,3 +16,9 @@ __all__ = [
     "procurement",
     "pm",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
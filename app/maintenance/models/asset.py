@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.models.base import BaseModel
@@ -50,7 +50,7 @@ class AssetCategory(BaseModel):
 
     __tablename__ = "asset_categories"
 
-    code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    code: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
@@ -93,12 +93,12 @@ class Asset(BaseModel):
     )
 
     # Identity
-    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    code: Mapped[str] = mapped_column(Text, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
     # Identification
-    qr_code: Mapped[Optional[str]] = mapped_column(String(100), unique=True, nullable=True)
+    qr_code: Mapped[Optional[str]] = mapped_column(Text, unique=True, nullable=True)
     serial_number: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     barcode: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
@@ -114,10 +114,14 @@ class Asset(BaseModel):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(50), default=AssetStatus.OPERATIONAL.value, nullable=False
+        ENUM(*(status.value for status in AssetStatus), name="asset_status"),
+        default=AssetStatus.OPERATIONAL.value,
+        nullable=False,
     )
     criticality: Mapped[str] = mapped_column(
-        String(20), default=Criticality.MEDIUM.value, nullable=False
+        ENUM(*(level.value for level in Criticality), name="asset_criticality"),
+        default=Criticality.MEDIUM.value,
+        nullable=False,
     )
 
     # Maintenance
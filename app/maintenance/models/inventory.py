@@ -8,11 +8,21 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
-
-from app.core.models.base import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column
+
+from app.core.models.base import BaseModel, IdentityModel
 
 
 class InventoryCategory(str, Enum):
@@ -60,7 +70,10 @@ class InventoryItem(BaseModel):
     lead_time_days: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Pricing
-    unit_price: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    unit_price_paise: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    unit_price: Mapped[Optional[Decimal]] = column_property(
+        func.round(unit_price_paise / 100, 2)
+    )  # Read-only, computed from unit_price_paise when loaded rather than stored
 
     # Tracking options
     is_serialized: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -81,6 +94,10 @@ class StockLevel(BaseModel):
 
     __tablename__ = "stock_levels"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False
     )
@@ -88,7 +105,10 @@ class StockLevel(BaseModel):
         UUID(as_uuid=True), ForeignKey("locations.id"), nullable=False
     )
 
-    quantity: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=0, nullable=False)
+    quantity_milli: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    quantity: Mapped[Decimal] = column_property(
+        func.round(quantity_milli / 1000, 3)
+    )  # Read-only, computed from quantity_milli when loaded rather than stored
     last_counted_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -107,7 +127,7 @@ class TransactionType(str, Enum):
     RETURN = "return"  # Returned from job
 
 
-class InventoryTransaction(BaseModel):
+class InventoryTransaction(IdentityModel):
     """
     Audit trail for all inventory movements.
 
@@ -116,6 +136,10 @@ class InventoryTransaction(BaseModel):
 
     __tablename__ = "inventory_transactions"
 
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+
     item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False
     )
@@ -123,10 +147,16 @@ class InventoryTransaction(BaseModel):
         UUID(as_uuid=True), ForeignKey("locations.id"), nullable=False
     )
 
-    transaction_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    quantity: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2), nullable=False
-    )  # Positive for in, negative for out
+    transaction_type: Mapped[str] = mapped_column(
+        ENUM(*(kind.value for kind in TransactionType), name="inventory_transaction_type"),
+        nullable=False,
+    )
+    quantity_milli: Mapped[int] = mapped_column(
+        BigInteger, nullable=False
+    )  # Thousandths of a unit; positive for in, negative for out
+    quantity: Mapped[Decimal] = column_property(
+        func.round(quantity_milli / 1000, 3)
+    )
 
     # Reference to source document
     reference_type: Mapped[Optional[str]] = mapped_column(
@@ -136,7 +166,10 @@ class InventoryTransaction(BaseModel):
         UUID(as_uuid=True), nullable=True
     )
 
-    unit_cost: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    unit_cost_paise: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    unit_cost: Mapped[Optional[Decimal]] = column_property(
+        func.round(unit_cost_paise / 100, 2)
+    )
 
     performed_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
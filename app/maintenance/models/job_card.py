@@ -8,11 +8,20 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
-
-from app.core.models.base import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column
+
+from app.core.models.base import BaseModel, IdentityBaseModel
 
 
 class JobType(str, Enum):
@@ -62,8 +71,8 @@ class JobCard(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    # Auto-generated job number (JC-2024-0001)
-    job_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Auto-generated job number (JC-2024-0001), unique per organization
+    job_number: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Asset and location
     asset_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -74,13 +83,17 @@ class JobCard(BaseModel):
     )
 
     # Job details
-    job_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    job_type: Mapped[str] = mapped_column(
+        ENUM(*(job_type.value for job_type in JobType), name="job_type"), nullable=False
+    )
     priority: Mapped[str] = mapped_column(
-        String(20), default=JobPriority.NORMAL.value, nullable=False
+        ENUM(*(priority.value for priority in JobPriority), name="job_priority"),
+        default=JobPriority.NORMAL.value,
+        nullable=False,
     )
 
-    title: Mapped[str] = mapped_column(String(200), nullable=False)
-    title_tamil: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    title_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     description_tamil: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -105,7 +118,9 @@ class JobCard(BaseModel):
 
     # Status tracking
     status: Mapped[str] = mapped_column(
-        String(50), default=JobStatus.OPEN.value, nullable=False
+        ENUM(*(status.value for status in JobStatus), name="job_status"),
+        default=JobStatus.OPEN.value,
+        nullable=False,
     )
     started_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -120,7 +135,7 @@ class JobCard(BaseModel):
     resolution_audio_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), nullable=True
     )  # Voice resolution audio
-    root_cause: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    root_cause: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Metrics
     mttr_minutes: Mapped[Optional[int]] = mapped_column(
@@ -136,7 +151,7 @@ class JobCard(BaseModel):
         return f"<JobCard(job_number={self.job_number}, status={self.status})>"
 
 
-class JobCardMaterial(BaseModel):
+class JobCardMaterial(IdentityBaseModel):
     """
     Materials/parts consumed in job execution.
 
@@ -152,8 +167,14 @@ class JobCardMaterial(BaseModel):
         UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False
     )
 
-    quantity: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    unit_cost: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    quantity_milli: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    quantity: Mapped[Decimal] = column_property(
+        func.round(quantity_milli / 1000, 3)
+    )
+    unit_cost_paise: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    unit_cost: Mapped[Optional[Decimal]] = column_property(
+        func.round(unit_cost_paise / 100, 2)
+    )
 
     # Who issued the material
     issued_by: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -163,7 +184,7 @@ class JobCardMaterial(BaseModel):
         DateTime(timezone=True), nullable=False
     )
 
-    notes: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     def __repr__(self) -> str:
         return f"<JobCardMaterial(job_card_id={self.job_card_id}, qty={self.quantity})>"
@@ -8,11 +8,20 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Date, DateTime, ForeignKey, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
-
-from app.core.models.base import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    ForeignKey,
+    Numeric,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column
+
+from app.core.models.base import BaseModel, IdentityBaseModel
 
 
 class PRStatus(str, Enum):
@@ -57,8 +66,8 @@ class PurchaseRequisition(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    # Auto-generated number (PR-2024-0001)
-    pr_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Auto-generated number (PR-2024-0001), unique per organization
+    pr_number: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Requester
     requested_by: Mapped[uuid.UUID] = mapped_column(
@@ -67,7 +76,9 @@ class PurchaseRequisition(BaseModel):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(50), default=PRStatus.DRAFT.value, nullable=False
+        ENUM(*(status.value for status in PRStatus), name="purchase_requisition_status"),
+        default=PRStatus.DRAFT.value,
+        nullable=False,
     )
     priority: Mapped[str] = mapped_column(String(20), default="normal", nullable=False)
 
@@ -93,7 +104,7 @@ class PurchaseRequisition(BaseModel):
         return f"<PurchaseRequisition(pr_number={self.pr_number}, status={self.status})>"
 
 
-class PurchaseRequisitionItem(BaseModel):
+class PurchaseRequisitionItem(IdentityBaseModel):
     """Line items for Purchase Requisition."""
 
     __tablename__ = "purchase_requisition_items"
@@ -126,8 +137,8 @@ class PurchaseOrder(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    # Auto-generated number (PO-2024-0001)
-    po_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Auto-generated number (PO-2024-0001), unique per organization
+    po_number: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Source PR (optional)
     pr_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -141,7 +152,9 @@ class PurchaseOrder(BaseModel):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(50), default=POStatus.DRAFT.value, nullable=False
+        ENUM(*(status.value for status in POStatus), name="purchase_order_status"),
+        default=POStatus.DRAFT.value,
+        nullable=False,
     )
 
     # Dates
@@ -169,7 +182,7 @@ class PurchaseOrder(BaseModel):
         return f"<PurchaseOrder(po_number={self.po_number}, status={self.status})>"
 
 
-class PurchaseOrderItem(BaseModel):
+class PurchaseOrderItem(IdentityBaseModel):
     """Line items for Purchase Order."""
 
     __tablename__ = "purchase_order_items"
@@ -181,8 +194,14 @@ class PurchaseOrderItem(BaseModel):
         UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False
     )
 
-    quantity: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    unit_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    quantity_milli: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    quantity: Mapped[Decimal] = column_property(
+        func.round(quantity_milli / 1000, 3)
+    )
+    unit_price_paise: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    unit_price: Mapped[Decimal] = column_property(
+        func.round(unit_price_paise / 100, 2)
+    )
     received_quantity: Mapped[Decimal] = mapped_column(
         Numeric(10, 2), default=0, nullable=False
     )
@@ -201,8 +220,8 @@ class GoodsReceipt(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    # Auto-generated number (GRN-2024-0001)
-    grn_number: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Auto-generated number (GRN-2024-0001), unique per organization
+    grn_number: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # Source PO
     po_id: Mapped[uuid.UUID] = mapped_column(
@@ -220,7 +239,9 @@ class GoodsReceipt(BaseModel):
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(50), default=GRNStatus.PENDING.value, nullable=False
+        ENUM(*(status.value for status in GRNStatus), name="goods_receipt_status"),
+        default=GRNStatus.PENDING.value,
+        nullable=False,
     )
 
     # Invoice matching
@@ -234,7 +255,7 @@ class GoodsReceipt(BaseModel):
         return f"<GoodsReceipt(grn_number={self.grn_number}, status={self.status})>"
 
 
-class GoodsReceiptItem(BaseModel):
+class GoodsReceiptItem(IdentityBaseModel):
     """Line items for GRN."""
 
     __tablename__ = "goods_receipt_items"
@@ -242,8 +263,8 @@ class GoodsReceiptItem(BaseModel):
     grn_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("goods_receipts.id"), nullable=False
     )
-    po_item_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("purchase_order_items.id"), nullable=False
+    po_item_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("purchase_order_items.id"), nullable=False
     )
     item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("inventory_items.id"), nullable=False
@@ -8,10 +8,10 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import Boolean, Date, DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.core.models.base import BaseModel
+from app.core.models.base import BaseModel, IdentityModel
 
 
 class ToolStatus(str, Enum):
@@ -37,7 +37,7 @@ class Tool(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    code: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    code: Mapped[str] = mapped_column(Text, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     name_tamil: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
@@ -47,7 +47,9 @@ class Tool(BaseModel):
 
     # Status and location
     status: Mapped[str] = mapped_column(
-        String(50), default=ToolStatus.AVAILABLE.value, nullable=False
+        ENUM(*(status.value for status in ToolStatus), name="tool_status"),
+        default=ToolStatus.AVAILABLE.value,
+        nullable=False,
     )
     current_location_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("locations.id"), nullable=True
@@ -75,7 +77,7 @@ class Tool(BaseModel):
         return f"<Tool(code={self.code}, name={self.name}, status={self.status})>"
 
 
-class ToolTransaction(BaseModel):
+class ToolTransaction(IdentityModel):
     """
     Tool check-in/check-out log.
     """
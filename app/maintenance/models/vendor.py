@@ -26,7 +26,7 @@ class Vendor(BaseModel):
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
     )
 
-    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    code: Mapped[str] = mapped_column(Text, nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Contact info
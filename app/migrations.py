@@ -0,0 +1,91 @@
+"""
+Alembic migration runner used during application startup.
+
+Migrations can run before the app accepts traffic ("sync"), in the background
+while the app is already serving ("async"), or not at all ("skip").
+"""
+
+import asyncio
+import contextlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Current migration state: "skipped", "pending", "migrating", "complete" or "failed"
+migration_state: dict[str, Optional[str]] = {"status": "skipped", "error": None}
+
+
+def get_alembic_config() -> Config:
+    """Build an Alembic config that does not reconfigure the app's logging."""
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+async def run_migrations() -> None:
+    """Upgrade the database to the latest revision.
+
+    env.py drives its own event loop, so the upgrade runs in a worker thread.
+    """
+    migration_state.update(status="migrating", error=None)
+    try:
+        await asyncio.to_thread(command.upgrade, get_alembic_config(), "head")
+    except Exception as e:
+        logger.exception("Database migration failed")
+        migration_state.update(status="failed", error=str(e))
+        raise
+    migration_state["status"] = "complete"
+
+
+async def _run_migrations_in_background() -> None:
+    # Failures are logged and reported by the migrations health check
+    with contextlib.suppress(Exception):
+        await run_migrations()
+
+
+def start_migrations() -> asyncio.Task:
+    """Start migrations without blocking application startup."""
+    migration_state["status"] = "pending"
+    return asyncio.create_task(_run_migrations_in_background())
+
+
+def _current_heads(connection: Connection) -> tuple[str, ...]:
+    return MigrationContext.configure(connection).get_current_heads()
+
+
+async def get_migration_status() -> dict:
+    """Compare the database revision against the latest migration script."""
+    head_revisions = ScriptDirectory.from_config(get_alembic_config()).get_heads()
+    database_revisions: tuple[str, ...] = ()
+    try:
+        async with engine.connect() as conn:
+            database_revisions = await conn.run_sync(_current_heads)
+        database_status = "available"
+    except (SQLAlchemyError, OSError):
+        logger.warning("Database unavailable for migration status", exc_info=True)
+        database_status = "unavailable"
+
+    return {
+        "status": migration_state["status"],
+        "error": migration_state["error"],
+        "mode": settings.migration_mode,
+        "database": database_status,
+        "head_revisions": sorted(head_revisions),
+        "database_revisions": sorted(database_revisions),
+        "up_to_date": set(head_revisions) == set(database_revisions),
+    }
@@ -21,14 +21,14 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 
-def hash_pin(pin: str) -> str:
+def hash_pin(pin: str) -> bytes:
     """Hash a PIN using bcrypt."""
-    return bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(pin.encode('utf-8'), bcrypt.gensalt())
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str) -> bytes:
     """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
 
 
 # ========================================
@@ -571,13 +571,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": today.replace(hour=7, minute=0),
             "category": "watering",
             "field_id": NORTH_FIELD_ID,
-            "field_name": "North Field",
-            "field_name_tamil": "வடக்கு வயல்",
-            "crop_name": "Grass",
-            "crop_name_tamil": "புல்",
             "assigned_worker_id": RAJA_ID,
-            "assigned_worker_name": "Raja",
-            "assigned_worker_name_tamil": "ராஜா",
             "status": "completed",
             "priority": "normal",
             "completed_at": today.replace(hour=7, minute=45),
@@ -591,13 +585,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": today.replace(hour=8, minute=0),
             "category": "fertilizer",
             "field_id": SOUTH_FIELD_ID,
-            "field_name": "South Field",
-            "field_name_tamil": "தெற்கு வயல்",
-            "crop_name": "Sugarcane",
-            "crop_name_tamil": "கரும்பு",
             "assigned_worker_id": MURUGAN_ID,
-            "assigned_worker_name": "Murugan",
-            "assigned_worker_name_tamil": "முருகன்",
             "status": "completed",
             "priority": "high",
             "completed_at": today.replace(hour=9, minute=30),
@@ -611,11 +599,7 @@ def get_sample_schedules_and_tasks():
             "description_tamil": "மோட்டாரிலிருந்து கடைசி கேட் வரை பம்ப் லைன் சரிபார்க்கவும்",
             "scheduled_time": today.replace(hour=10, minute=0),
             "category": "maintenance",
-            "field_name": "All Fields",
-            "field_name_tamil": "அனைத்து வயல்கள்",
             "assigned_worker_id": RAJA_ID,
-            "assigned_worker_name": "Raja",
-            "assigned_worker_name_tamil": "ராஜா",
             "status": "has_issues",
             "priority": "urgent",
             "has_issues": True,
@@ -632,13 +616,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": today.replace(hour=11, minute=0),
             "category": "pesticide",
             "field_id": EAST_GARDEN_ID,
-            "field_name": "East Garden",
-            "field_name_tamil": "கிழக்கு தோட்டம்",
-            "crop_name": "Vegetables",
-            "crop_name_tamil": "காய்கறிகள்",
             "assigned_worker_id": KANNAN_ID,
-            "assigned_worker_name": "Kannan",
-            "assigned_worker_name_tamil": "கண்ணன்",
             "status": "in_progress",
             "priority": "normal",
         },
@@ -651,13 +629,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": today.replace(hour=14, minute=0),
             "category": "harvesting",
             "field_id": BANANA_PLANTATION_ID,
-            "field_name": "Banana Plantation",
-            "field_name_tamil": "வாழைத் தோட்டம்",
-            "crop_name": "Banana",
-            "crop_name_tamil": "வாழைப்பழம்",
             "assigned_worker_id": LAKSHMI_ID,
-            "assigned_worker_name": "Lakshmi",
-            "assigned_worker_name_tamil": "லக்ஷ்மி",
             "status": "scheduled",
             "priority": "normal",
         },
@@ -670,13 +642,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": today.replace(hour=16, minute=0),
             "category": "watering",
             "field_id": COCONUT_GROVE_ID,
-            "field_name": "Coconut Grove",
-            "field_name_tamil": "தென்னந்தோப்பு",
-            "crop_name": "Coconut",
-            "crop_name_tamil": "தேங்காய்",
             "assigned_worker_id": MURUGAN_ID,
-            "assigned_worker_name": "Murugan",
-            "assigned_worker_name_tamil": "முருகன்",
             "status": "scheduled",
             "priority": "normal",
         },
@@ -689,13 +655,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": tomorrow.replace(hour=6, minute=30),
             "category": "watering",
             "field_id": NORTH_FIELD_ID,
-            "field_name": "North Field",
-            "field_name_tamil": "வடக்கு வயல்",
-            "crop_name": "Paddy",
-            "crop_name_tamil": "நெல்",
             "assigned_worker_id": RAJA_ID,
-            "assigned_worker_name": "Raja",
-            "assigned_worker_name_tamil": "ராஜா",
             "status": "scheduled",
             "priority": "high",
         },
@@ -707,13 +667,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": tomorrow.replace(hour=8, minute=0),
             "category": "fertilizer",
             "field_id": EAST_GARDEN_ID,
-            "field_name": "East Garden",
-            "field_name_tamil": "கிழக்கு தோட்டம்",
-            "crop_name": "Vegetables",
-            "crop_name_tamil": "காய்கறிகள்",
             "assigned_worker_id": KANNAN_ID,
-            "assigned_worker_name": "Kannan",
-            "assigned_worker_name_tamil": "கண்ணன்",
             "status": "scheduled",
             "priority": "normal",
         },
@@ -725,11 +679,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": tomorrow.replace(hour=9, minute=0),
             "category": "maintenance",
             "field_id": NORTH_FIELD_ID,
-            "field_name": "North Field",
-            "field_name_tamil": "வடக்கு வயல்",
             "assigned_worker_id": RAJA_ID,
-            "assigned_worker_name": "Raja",
-            "assigned_worker_name_tamil": "ராஜா",
             "status": "scheduled",
             "priority": "urgent",
             "notes_tamil": "பிளம்பர் வருவார், உதவி செய்யவும்",
@@ -742,13 +692,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": tomorrow.replace(hour=10, minute=30),
             "category": "inspection",
             "field_id": SOUTH_FIELD_ID,
-            "field_name": "South Field",
-            "field_name_tamil": "தெற்கு வயல்",
-            "crop_name": "Sugarcane",
-            "crop_name_tamil": "கரும்பு",
             "assigned_worker_id": MURUGAN_ID,
-            "assigned_worker_name": "Murugan",
-            "assigned_worker_name_tamil": "முருகன்",
             "status": "scheduled",
             "priority": "normal",
         },
@@ -760,13 +704,7 @@ def get_sample_schedules_and_tasks():
             "scheduled_time": tomorrow.replace(hour=14, minute=0),
             "category": "transport",
             "field_id": BANANA_PLANTATION_ID,
-            "field_name": "Banana Plantation",
-            "field_name_tamil": "வாழைத் தோட்டம்",
-            "crop_name": "Banana",
-            "crop_name_tamil": "வாழைப்பழம்",
             "assigned_worker_id": LAKSHMI_ID,
-            "assigned_worker_name": "Lakshmi",
-            "assigned_worker_name_tamil": "லக்ஷ்மி",
             "status": "scheduled",
             "priority": "normal",
         },
@@ -778,7 +716,6 @@ def get_sample_schedules_and_tasks():
             "id": uuid.UUID("77777777-0001-1111-1111-111111111111"),
             "task_id": uuid.UUID("88888888-1001-1111-1111-111111111111"),
             "worker_id": RAJA_ID,
-            "worker_name": "ராஜா",
             "status": "completed",
             "timestamp": today.replace(hour=7, minute=45),
             "notes_tamil": "வேலை முடிந்தது",
@@ -787,7 +724,6 @@ def get_sample_schedules_and_tasks():
             "id": uuid.UUID("77777777-0002-1111-1111-111111111111"),
             "task_id": uuid.UUID("88888888-1002-1111-1111-111111111111"),
             "worker_id": MURUGAN_ID,
-            "worker_name": "முருகன்",
             "status": "completed",
             "timestamp": today.replace(hour=9, minute=30),
             "notes_tamil": "50 கிலோ உரம் பயன்படுத்தப்பட்டது",
@@ -796,7 +732,6 @@ def get_sample_schedules_and_tasks():
             "id": uuid.UUID("77777777-0003-1111-1111-111111111111"),
             "task_id": uuid.UUID("88888888-1003-1111-1111-111111111111"),
             "worker_id": RAJA_ID,
-            "worker_name": "ராஜா",
             "status": "has_issues",
             "timestamp": today.replace(hour=10, minute=45),
             "notes_tamil": "குழாய் உடைந்துள்ளது, பிளம்பர் வேண்டும்",
@@ -1025,10 +960,10 @@ async def seed_database(db_url: str, force: bool = False):
         for item in INVENTORY_ITEMS:
             await session.execute(
                 text("""
-                    INSERT INTO inventory_items (id, org_id, sku, name, name_tamil, category, unit, unit_tamil, criticality, min_stock_level, reorder_point, unit_price)
-                    VALUES (:id, :org_id, :sku, :name, :name_tamil, :category, :unit, :unit_tamil, :criticality, :min_stock_level, :reorder_point, :unit_price)
+                    INSERT INTO inventory_items (id, org_id, sku, name, name_tamil, category, unit, unit_tamil, criticality, min_stock_level, reorder_point, unit_price_paise)
+                    VALUES (:id, :org_id, :sku, :name, :name_tamil, :category, :unit, :unit_tamil, :criticality, :min_stock_level, :reorder_point, :unit_price_paise)
                 """),
-                {**item, "org_id": ORG_ID},
+                {**item, "org_id": ORG_ID, "unit_price_paise": int(item["unit_price"] * 100)},
             )
         print(f"   Created {len(INVENTORY_ITEMS)} inventory items")
 
@@ -1073,15 +1008,13 @@ async def seed_database(db_url: str, force: bool = False):
                     text("""
                         INSERT INTO scheduled_tasks (
                             id, org_id, schedule_id, description, description_tamil, scheduled_time,
-                            category, field_id, field_name, field_name_tamil, crop_name, crop_name_tamil,
-                            assigned_worker_id, assigned_worker_name, assigned_worker_name_tamil,
+                            category, field_id, assigned_worker_id,
                             status, priority, notes_tamil, completed_at, has_issues, issue_type,
                             issue_description, issue_description_tamil
                         )
                         VALUES (
                             :id, :org_id, :schedule_id, :description, :description_tamil, :scheduled_time,
-                            :category, :field_id, :field_name, :field_name_tamil, :crop_name, :crop_name_tamil,
-                            :assigned_worker_id, :assigned_worker_name, :assigned_worker_name_tamil,
+                            :category, :field_id, :assigned_worker_id,
                             :status, :priority, :notes_tamil, :completed_at, :has_issues, :issue_type,
                             :issue_description, :issue_description_tamil
                         )
@@ -1095,13 +1028,7 @@ async def seed_database(db_url: str, force: bool = False):
                         "scheduled_time": task["scheduled_time"],
                         "category": task["category"],
                         "field_id": task.get("field_id"),
-                        "field_name": task.get("field_name"),
-                        "field_name_tamil": task.get("field_name_tamil"),
-                        "crop_name": task.get("crop_name"),
-                        "crop_name_tamil": task.get("crop_name_tamil"),
                         "assigned_worker_id": task.get("assigned_worker_id"),
-                        "assigned_worker_name": task.get("assigned_worker_name"),
-                        "assigned_worker_name_tamil": task.get("assigned_worker_name_tamil"),
                         "status": task.get("status", "scheduled"),
                         "priority": task.get("priority", "normal"),
                         "notes_tamil": task.get("notes_tamil"),
@@ -1118,11 +1045,11 @@ async def seed_database(db_url: str, force: bool = False):
                 await session.execute(
                     text("""
                         INSERT INTO task_updates (
-                            id, task_id, worker_id, worker_name, status, timestamp,
+                            id, task_id, worker_id, status, timestamp,
                             notes_tamil, issue_type, issue_description_tamil
                         )
                         VALUES (
-                            :id, :task_id, :worker_id, :worker_name, :status, :timestamp,
+                            :id, :task_id, :worker_id, :status, :timestamp,
                             :notes_tamil, :issue_type, :issue_description_tamil
                         )
                     """),
@@ -1130,7 +1057,6 @@ async def seed_database(db_url: str, force: bool = False):
                         "id": update["id"],
                         "task_id": update["task_id"],
                         "worker_id": update["worker_id"],
-                        "worker_name": update["worker_name"],
                         "status": update["status"],
                         "timestamp": update["timestamp"],
                         "notes_tamil": update.get("notes_tamil"),
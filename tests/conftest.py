@@ -0,0 +1,52 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+import app.cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the parts of the Redis client app.cache uses."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class UnavailableRedis:
+    """Redis client whose every call fails, as when the server is down."""
+
+    async def get(self, key):
+        raise RedisConnectionError("Redis is down")
+
+    async def set(self, key, value, ex=None, nx=False):
+        raise RedisConnectionError("Redis is down")
+
+    async def delete(self, *keys):
+        raise RedisConnectionError("Redis is down")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(app.cache, "redis_client", redis)
+    return redis
+
+
+@pytest.fixture
+def unavailable_redis(monkeypatch):
+    monkeypatch.setattr(app.cache, "redis_client", UnavailableRedis())
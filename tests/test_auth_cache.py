@@ -0,0 +1,189 @@
+"""
+Tests for the in-memory cache of authenticated users.
+
+No database is reachable here: a cache hit must not query, and every miss
+goes through a stubbed AuthService.get_user_by_id.
+"""
+
+import uuid
+from functools import partial
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.models.organization import Organization
+from app.core.models.user import User, UserRole
+from app.core.services import auth
+from app.core.services.auth import AuthService, get_current_user, invalidate_cached_user
+from app.core.services.user import UserService
+from app.database import after_commit, get_db
+
+ORG_ID = uuid.UUID("11111111-1111-1111-1111-111111111111")
+
+
+def _user(
+    user_id: uuid.UUID | None = None,
+    role: UserRole = UserRole.WORKER,
+    is_active: bool = True,
+) -> User:
+    user = User(
+        id=user_id or uuid.uuid4(),
+        org_id=ORG_ID,
+        employee_code="FARM001",
+        name="Worker",
+        role=role.value,
+        department="farm",
+        is_active=is_active,
+    )
+    user.organization = Organization(id=ORG_ID, name="Sri Ramanasramam")
+    return user
+
+
+def _credentials(user: User) -> HTTPAuthorizationCredentials:
+    token = AuthService.create_access_token(
+        {
+            "user_id": str(user.id),
+            "employee_code": user.employee_code,
+            "role": user.role,
+            "department": user.department,
+            "org_id": str(user.org_id),
+        }
+    )
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_users():
+    auth._auth_users.clear()
+    yield
+    auth._auth_users.clear()
+
+
+@pytest.fixture
+async def db():
+    # Nothing listens on this port, so any query fails the test
+    engine = create_async_engine("postgresql+asyncpg://postgres@127.0.0.1:9/unused")
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Serve users from a dict in place of the database, recording lookups."""
+    users: dict[uuid.UUID, User] = {}
+    calls: list[uuid.UUID] = []
+
+    async def get_user_by_id(self, user_id):
+        calls.append(user_id)
+        return users.get(user_id)
+
+    monkeypatch.setattr(AuthService, "get_user_by_id", get_user_by_id)
+    return users, calls
+
+
+async def test_cache_hit_merges_snapshot_without_query(fake_redis, loads, db):
+    users, calls = loads
+    user = _user()
+    users[user.id] = user
+    credentials = _credentials(user)
+
+    await get_current_user(credentials, db)
+    current = await get_current_user(credentials, db)
+
+    assert calls == [user.id]
+    assert current in db
+    assert current is not user
+    assert current.employee_code == "FARM001"
+    assert current.organization.name == "Sri Ramanasramam"
+    assert not db.dirty
+
+
+async def test_deleted_stamp_reloads_user(fake_redis, loads, db):
+    users, calls = loads
+    user = _user(role=UserRole.ADMIN)
+    users[user.id] = user
+    credentials = _credentials(user)
+    await get_current_user(credentials, db)
+
+    # Another worker demotes the user: its local snapshot stays, the stamp goes
+    users[user.id] = _user(user.id, role=UserRole.WORKER)
+    fake_redis.data.clear()
+    current = await get_current_user(credentials, db)
+
+    assert calls == [user.id, user.id]
+    assert current.role == UserRole.WORKER.value
+
+
+async def test_deactivated_user_is_rejected_after_invalidation(fake_redis, loads, db):
+    users, _ = loads
+    user = _user()
+    users[user.id] = user
+    credentials = _credentials(user)
+    await get_current_user(credentials, db)
+
+    users[user.id] = _user(user.id, is_active=False)
+    await invalidate_cached_user(user.id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(credentials, db)
+    assert exc_info.value.status_code == 401
+
+
+async def test_nothing_is_cached_without_redis(unavailable_redis, loads, db):
+    users, calls = loads
+    user = _user()
+    users[user.id] = user
+    credentials = _credentials(user)
+
+    await get_current_user(credentials, db)
+    await get_current_user(credentials, db)
+
+    assert calls == [user.id, user.id]
+    assert not auth._auth_users
+
+
+async def _cache(user: User) -> bytes:
+    stamp = await auth._get_user_stamp(user.id)
+    auth._cache_user(user, stamp)
+    return stamp
+
+
+async def test_user_change_invalidates_after_commit(fake_redis, monkeypatch):
+    user = _user()
+    await _cache(user)
+
+    async def get_by_id(self, user_id):
+        return user
+
+    monkeypatch.setattr(UserService, "get_by_id", get_by_id)
+
+    sessions = get_db()
+    session = await anext(sessions)
+    await UserService(session).delete(user.id)
+
+    assert user.id in auth._auth_users
+    assert fake_redis.data
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(sessions)
+
+    assert user.id not in auth._auth_users
+    assert not fake_redis.data
+
+
+async def test_rolled_back_change_keeps_cache(fake_redis):
+    user = _user()
+    stamp = await _cache(user)
+
+    sessions = get_db()
+    session = await anext(sessions)
+    after_commit(session, partial(invalidate_cached_user, user.id))
+
+    with pytest.raises(RuntimeError):
+        await sessions.athrow(RuntimeError("request failed"))
+
+    assert user.id in auth._auth_users
+    assert list(fake_redis.data.values()) == [stamp]
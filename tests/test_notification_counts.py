@@ -0,0 +1,150 @@
+"""
+Tests for the cached notification counts.
+
+Redis is replaced by an in-memory stand-in. The count query runs against
+PostgreSQL and is skipped unless TEST_DATABASE_URL points at a migrated
+database; everything it writes is rolled back.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.models.notification import Notification, NotificationPriority
+from app.core.models.organization import Organization
+from app.core.models.user import User
+from app.core.schemas.notification import NotificationCount
+from app.core.services.notification import NotificationService, _notification_count_key
+from app.database import get_db
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+USER_ID = uuid.UUID("22222222-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+async def offline_db():
+    # Nothing listens on this port, so any query fails the test
+    engine = create_async_engine("postgresql+asyncpg://postgres@127.0.0.1:9/unused")
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+async def test_cached_counts_are_served_without_query(fake_redis, offline_db):
+    counts = NotificationCount(total=5, unread=2, critical=1)
+    key = _notification_count_key(USER_ID)
+    fake_redis.data[key] = counts.model_dump_json().encode()
+
+    service = NotificationService(offline_db)
+
+    assert await service.get_notification_count(USER_ID) == counts
+
+
+async def test_counts_are_invalidated_after_commit(fake_redis):
+    key = _notification_count_key(USER_ID)
+    fake_redis.data[key] = b"{}"
+
+    sessions = get_db()
+    session = await anext(sessions)
+    NotificationService(session)._invalidate_counts(USER_ID, USER_ID)
+
+    assert key in fake_redis.data
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(sessions)
+
+    assert key not in fake_redis.data
+
+
+async def test_counts_are_kept_after_rollback(fake_redis):
+    key = _notification_count_key(USER_ID)
+    fake_redis.data[key] = b"{}"
+
+    sessions = get_db()
+    session = await anext(sessions)
+    NotificationService(session)._invalidate_counts(USER_ID)
+
+    with pytest.raises(RuntimeError):
+        await sessions.athrow(RuntimeError("request failed"))
+
+    assert key in fake_redis.data
+
+
+async def _run_after_commit(session: AsyncSession) -> int:
+    callbacks = session.info.pop("after_commit", [])
+    for callback in callbacks:
+        await callback()
+    return len(callbacks)
+
+
+async def test_count_query_and_invalidation(fake_redis, db):
+    organization = Organization(name="Test", code=f"T{uuid.uuid4().hex[:8]}")
+    db.add(organization)
+    await db.flush()
+    user = User(
+        org_id=organization.id,
+        employee_code=f"T{uuid.uuid4().hex[:8]}",
+        name="Worker",
+    )
+    db.add(user)
+    await db.flush()
+
+    read_at = datetime.now(timezone.utc)
+    db.add_all(
+        [
+            Notification(user_id=user.id, title="a"),
+            Notification(user_id=user.id, title="b", read_at=read_at),
+            Notification(
+                user_id=user.id,
+                title="c",
+                priority=NotificationPriority.CRITICAL.value,
+            ),
+            Notification(
+                user_id=user.id,
+                title="d",
+                priority=NotificationPriority.CRITICAL.value,
+                read_at=read_at,
+            ),
+        ]
+    )
+    await db.flush()
+    await _run_after_commit(db)
+    service = NotificationService(db)
+
+    counts = await service.get_notification_count(user.id)
+
+    assert counts == NotificationCount(total=4, unread=2, critical=1)
+    key = _notification_count_key(user.id)
+    assert NotificationCount.model_validate_json(fake_redis.data[key]) == counts
+
+    # A no-op update leaves the cache alone; a real one drops it on commit
+    assert await service.mark_as_read(uuid.uuid4(), user.id) is False
+    assert await _run_after_commit(db) == 0
+    assert await service.mark_all_as_read(user.id) == 2
+    assert key in fake_redis.data
+    assert await _run_after_commit(db) == 1
+    assert key not in fake_redis.data
+
+    counts = await service.get_notification_count(user.id)
+
+    assert counts == NotificationCount(total=4, unread=0, critical=0)
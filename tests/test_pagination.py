@@ -0,0 +1,146 @@
+"""
+Tests for keyset (cursor) pagination.
+
+The page walk runs against PostgreSQL and is skipped unless
+TEST_DATABASE_URL points at a database the tests may create tables in.
+"""
+
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import DateTime, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.core.schemas.common import Cursor, CursorPage
+from app.core.services.pagination import page_items, paginate
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+CREATED_AT = datetime(2024, 2, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class PageRow(_Base):
+    __tablename__ = "test_pagination_rows"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+def _rows(count: int) -> list[PageRow]:
+    return [
+        PageRow(id=uuid.uuid4(), created_at=CREATED_AT - timedelta(seconds=i))
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trip():
+    cursor = Cursor(CREATED_AT, str(uuid.uuid4()))
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not a cursor",
+        Cursor(CREATED_AT, "").encode(),
+        "bm90LWEtZGF0ZXxhYmM",  # "not-a-date|abc"
+    ],
+)
+def test_cursor_decode_rejects_malformed_tokens(token):
+    with pytest.raises(ValueError):
+        Cursor.decode(token)
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not a cursor",
+        Cursor(CREATED_AT, "not-a-uuid").encode(),
+    ],
+)
+def test_paginate_rejects_bad_cursor_with_400(token):
+    with pytest.raises(HTTPException) as exc_info:
+        paginate(select(PageRow), PageRow, token, limit=10)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_page_items_with_look_ahead_row_has_more():
+    rows = _rows(4)
+
+    items, next_cursor = page_items(rows, limit=3)
+    page = CursorPage.create(items=items, next_cursor=next_cursor)
+
+    assert items == rows[:3]
+    assert page.has_more is True
+    assert Cursor.decode(next_cursor) == Cursor(rows[2].created_at, str(rows[2].id))
+
+
+@pytest.mark.parametrize("count", [0, 2, 3])
+def test_last_page_has_no_next_cursor(count):
+    rows = _rows(count)
+
+    items, next_cursor = page_items(rows, limit=3)
+    page = CursorPage.create(items=items, next_cursor=next_cursor)
+
+    assert items == rows
+    assert next_cursor is None
+    assert page.next_cursor is None
+    assert page.has_more is False
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_walk_pages_across_identical_created_at():
+    """Rows sharing a created_at are split across pages without gaps or repeats."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    # Seed data creates many rows in one transaction, so they share now()
+    rows = [PageRow(id=uuid.uuid4(), created_at=CREATED_AT) for _ in range(7)]
+    rows += [
+        PageRow(id=uuid.uuid4(), created_at=CREATED_AT - timedelta(days=1))
+        for _ in range(3)
+    ]
+    expected = sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)
+    expected_ids = [row.id for row in expected]
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(_Base.metadata.drop_all)
+            await conn.run_sync(_Base.metadata.create_all)
+            await conn.execute(
+                PageRow.__table__.insert(),
+                [{"id": row.id, "created_at": row.created_at} for row in rows],
+            )
+
+        seen = []
+        pages = 0
+        cursor = None
+        async with engine.connect() as conn:
+            while True:
+                result = await conn.execute(
+                    paginate(select(PageRow.id, PageRow.created_at), PageRow, cursor, 3)
+                )
+                items, cursor = page_items(list(result.all()), 3)
+                seen += [item.id for item in items]
+                pages += 1
+                if cursor is None:
+                    break
+
+        assert seen == expected_ids
+        assert pages == 4
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(_Base.metadata.drop_all)
+        await engine.dispose()
@@ -0,0 +1,124 @@
+"""
+Tests for the voice API.
+"""
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.api import voice
+from app.core.models.user import User
+from app.core.services.auth import get_current_user
+from app.database import get_db
+
+MAX_BYTES = 1024
+
+BOUNDARY = "audio-boundary"
+
+
+def _multipart(audio: bytes) -> bytes:
+    return (
+        (
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="audio"; filename="clip.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode()
+        + audio
+        + f"\r\n--{BOUNDARY}--\r\n".encode()
+    )
+
+
+def _chunks(body: bytes, size: int = 256):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """The transcribe endpoint on an AudioUploadRoute limited to MAX_BYTES."""
+    limited = settings.model_copy(update={"max_audio_upload_bytes": MAX_BYTES})
+    monkeypatch.setattr(voice, "settings", limited)
+    router = APIRouter(route_class=voice.AudioUploadRoute)
+    router.post("/transcribe")(voice.transcribe_audio)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: User(name="Worker")
+    app.dependency_overrides[get_db] = lambda: None
+    return TestClient(app)
+
+
+HEADERS = {"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"}
+
+
+def test_upload_within_limit_is_transcribed(client):
+    response = client.post(
+        "/transcribe", content=_multipart(b"\0" * 512), headers=HEADERS
+    )
+
+    assert response.status_code == 200
+    assert response.json()["transcript_english"] == "Fan not working in room 102"
+
+
+async def test_oversized_content_length_is_rejected_before_reading(client):
+    reads = []
+    sent = []
+
+    async def receive():
+        reads.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/transcribe",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", HEADERS["Content-Type"].encode()),
+            (b"content-length", str(MAX_BYTES + 1).encode()),
+        ],
+    }
+    await client.app(scope, receive, send)
+
+    assert sent[0]["status"] == 413
+    assert not reads
+
+
+def test_chunked_body_over_limit_is_rejected(client):
+    body = _multipart(b"\0" * (MAX_BYTES * 2))
+
+    response = client.post("/transcribe", content=_chunks(body), headers=HEADERS)
+
+    assert "content-length" not in response.request.headers
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Audio too large"
+
+
+def _english(transcript: str) -> list[str]:
+    return [keyword["english"] for keyword in voice.extract_keywords(transcript)]
+
+
+def test_longest_keyword_wins():
+    assert _english("சரிசெய்") == ["fix"]
+    assert _english("குழாய் சரிசெய்") == ["pipe", "fix"]
+
+
+def test_shorter_keyword_still_matches_on_its_own():
+    assert _english("எல்லாம் சரி") == ["okay"]
+
+
+def test_keywords_are_reported_once_in_first_seen_order():
+    assert _english("வயல் அறை வயல் அறை") == ["field", "room"]
+
+
+def test_numbers_are_extracted():
+    keywords = voice.extract_keywords("அறை 102 சரிசெய்")
+
+    assert keywords == [
+        {"tamil": "அறை", "english": "room", "category": "location"},
+        {"tamil": "சரிசெய்", "english": "fix", "category": "action"},
+        {"tamil": "102", "english": "102", "category": "number"},
+    ]